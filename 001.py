@@ -13,11 +13,12 @@ If it is, we add it to a running total.
 Finally, we print the total sum.
 """
 
-def solve():
+def solve(limit=1000):
     total_sum = 0
-    for i in range(1000):
+    for i in range(limit):
         if i % 3 == 0 or i % 5 == 0:
             total_sum += i
-    print(total_sum)
+    return total_sum
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
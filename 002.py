@@ -18,13 +18,14 @@ We continue generating the next Fibonacci number by adding the previous two, unt
 If the current number is even, we add it to our sum.
 """
 
-def solve():
+def solve(limit=4000000):
     a, b = 1, 2
     even_sum = 0
-    while a <= 4000000:
+    while a <= limit:
         if a % 2 == 0:
             even_sum += a
         a, b = b, a + b
-    print(even_sum)
+    return even_sum
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -20,14 +20,14 @@ We can optimize this by realizing a few things:
    This is because we have systematically removed all smaller prime factors. If the remaining `n` were composite, it would have a prime factor smaller than or equal to its square root, which would have already been found and divided out.
 """
 
-def solve():
-    n = 600851475143
+def solve(n=600851475143):
     d = 2
     while d * d <= n:
         if n % d == 0:
             n //= d
         else:
             d += 1
-    print(n)
+    return n
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
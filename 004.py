@@ -24,15 +24,18 @@ We can optimize the search slightly. If we have loops for `i` and `j` both from
 We can also add a break condition. If the product `i * j` becomes smaller than the `largest_palindrome` we've already found, we know that no further products in the inner loop (for the current `i`) can be larger, so we can break out of it and move to the next `i`.
 """
 
-def solve():
+def solve(digits=3):
+    largest = 10**digits - 1
+    smallest = 10**(digits - 1)
     largest_palindrome = 0
-    for i in range(999, 99, -1):
-        for j in range(i, 99, -1):
+    for i in range(largest, smallest - 1, -1):
+        for j in range(i, smallest - 1, -1):
             product = i * j
             if product <= largest_palindrome:
                 break
             if str(product) == str(product)[::-1]:
                 largest_palindrome = product
-    print(largest_palindrome)
+    return largest_palindrome
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
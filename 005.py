@@ -42,10 +42,11 @@ def lcm(a, b):
     # LCM(a,b) * GCD(a,b) = a * b
     return a * b // gcd(a, b) if a != 0 and b != 0 else 0
 
-def solve():
+def solve(n=20):
     result = 1
-    for i in range(1, 21):
+    for i in range(1, n + 1):
         result = lcm(result, i)
-    print(result)
+    return result
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -28,8 +28,7 @@ Using these formulas would be more efficient than looping, but for n=100, a dire
 Let's stick to the direct calculation method as it's clear and sufficient for this problem size.
 """
 
-def solve():
-    n = 100
+def solve(n=100):
     
     # Calculate the sum of the squares
     sum_of_squares = sum(i*i for i in range(1, n + 1))
@@ -41,6 +40,7 @@ def solve():
     # Find the difference
     difference = square_of_sum - sum_of_squares
     
-    print(difference)
+    return difference
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
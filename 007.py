@@ -17,38 +17,21 @@ The overall approach will be:
 5. Continue this process until `count` reaches 10,001.
 6. The last number that was identified as prime is our answer.
 
-For the `is_prime(n)` function, we can use an efficient trial division method:
-- A number `n` is prime if it is not divisible by any number other than 1 and itself.
-- We can immediately handle small cases: numbers less than or equal to 1 are not prime. 2 and 3 are prime.
-- Any number divisible by 2 or 3 (that isn't 2 or 3 itself) is not prime. This check eliminates a large portion of composite numbers.
-- For remaining numbers, we only need to check for divisors up to the square root of `n`.
-- We can further optimize by observing that all primes greater than 3 are of the form `6k ± 1`. So, we can check divisors in steps of 6 (i.e., `i` and `i+2`), starting from `i=5`.
+For the `is_prime(n)` function we use the shared `euler.primality` module:
+- Small numbers (all of the ones needed here) are answered by a lookup in a precomputed sieve table.
+- Larger numbers go through a deterministic Miller-Rabin test, which is exact for all 64-bit inputs.
 """
 
-import math
-
-def is_prime(n):
-    """Checks if a number is prime using an optimized trial division method."""
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
-
-def solve():
+from euler.primality import is_prime
+
+def solve(n=10001):
     count = 0
     num = 1
-    while count < 10001:
+    while count < n:
         num += 1
         if is_prime(num):
             count += 1
-    print(num)
+    return num
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
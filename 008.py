@@ -24,7 +24,7 @@ We can solve this using a "sliding window" approach.
 Let's refine the optimization: When we slide the window, instead of re-multiplying all 13 digits, we can divide by the digit that is leaving the window and multiply by the new digit that is entering. However, this is complicated by the presence of zeros. A simple loop that recalculates the product for each window is clear to implement and fast enough for this problem size.
 """
 
-def solve():
+def solve(num_digits=13):
     s = (
         "73167176531330624919225119674426574742355349194934"
         "96983520312774506326239578318016984801869478851843"
@@ -49,7 +49,6 @@ def solve():
     )
     
     largest_product = 0
-    num_digits = 13
     
     for i in range(len(s) - num_digits + 1):
         product = 1
@@ -58,6 +57,7 @@ def solve():
         if product > largest_product:
             largest_product = product
             
-    print(largest_product)
+    return largest_product
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -21,16 +21,17 @@
 # 3a < 1000 (since a < b < c, 3a < a+b+c = 1000)
 # So, a must be less than 1000/3, i.e., a <= 333.
 # Also, b must be less than 1000/2, i.e., b <= 499 (since a >= 1, b < c, a+b+c = 1000 => 2b < 1000-a => b < (1000-a)/2).
-# We can iterate through possible values of 'a' and 'b' and check if 'c' is an integer and satisfies the conditions.
-# The current solution iterates through 'a' and 'b' and calculates 'c'. It then checks if c > b and if a^2 + b^2 == c^2.
-# This approach seems correct and efficient enough given the constraints.
+# Instead of trying every (a, b), note that every triple is k times a primitive triple,
+# so its perimeter is k times the primitive perimeter. We walk the primitive triples with
+# perimeter <= 1000 (euler.pythagorean.primitive_triples, no gcd tests) and take the one
+# whose perimeter divides 1000; k = 1000 / perimeter scales it up.
+from euler.pythagorean import primitive_triples
 
-def solve():
-    for a in range(1, 1000):
-        for b in range(a + 1, 1000):
-            c = 1000 - a - b
-            if c > b and a**2 + b**2 == c**2:
-                print(a * b * c)
-                return
+def solve(perimeter=1000):
+    for a, b, c in primitive_triples(max_perimeter=perimeter):
+        k, rest = divmod(perimeter, a + b + c)
+        if rest == 0:
+            return k**3 * a * b * c
 
-solve()
+if __name__ == "__main__":
+    print(solve())
@@ -17,27 +17,29 @@
 # 4. After the loop, all numbers for which is_prime[i] is true are prime numbers.
 # 5. Sum all the prime numbers found.
 #
-# The current solution implements the Sieve of Eratosthenes correctly.
-# It initializes a boolean array `is_prime` of size `n` (2 million).
-# It correctly handles the base cases of 0 and 1.
-# It iterates from 2 up to the square root of `n`, marking multiples as not prime.
-# Finally, it iterates through the `is_prime` array and sums all numbers marked as prime.
-# This approach is efficient for the given limit.
+# The sieve itself lives in the shared `euler.sieve` module. We use its
+# segmented form: the range below n is sieved one cache-sized window at a
+# time using only the primes up to sqrt(n), so memory stays O(sqrt(n)) and
+# solve() works for n far beyond two million (e.g. 10**10). With numpy each
+# window comes as an int64 array and is summed in one step (a window's sum
+# stays far below 2**63); the total is kept as a Python int.
+# If the persistent prime table (`euler.prime_table`) already covers n, the
+# primes are streamed from its memory mapping instead. It is never built for
+# this: at 10**10 it would take about 625 MB of disk.
 
-def solve():
-    n = 2000000
-    is_prime = [True] * n
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(n**0.5) + 1):
-        if is_prime[i]:
-            for multiple in range(i*i, n, i):
-                is_prime[multiple] = False
-    
-    total = 0
-    for i in range(n):
-        if is_prime[i]:
-            total += i
-            
-    print(total)
+from euler.optional import numpy
+from euler.prime_table import prime_table
+from euler.sieve import prime_segments, segmented_primes
 
-solve()
+def solve(n=2000000):
+    table = prime_table(n - 1, build=False)
+    if table is not None:
+        total = sum(table.iter_primes(n - 1))
+    elif numpy() is not None:
+        total = sum(int(segment.sum()) for segment in prime_segments(n - 1, as_numpy=True))
+    else:
+        total = sum(segmented_primes(n - 1))
+    return total
+
+if __name__ == "__main__":
+    print(solve())
@@ -97,6 +97,7 @@ def solve():
                 if product > max_product:
                     max_product = product
 
-    print(max_product)
+    return max_product
 
-solve()
+if __name__ == "__main__":
+    print(solve())
@@ -21,44 +21,41 @@
 # The problem asks for the first triangle number that has over 500 divisors.
 # A triangle number is the sum of natural numbers up to n, given by the formula T_n = n * (n + 1) / 2.
 #
-# To solve this, we need a function to count the number of divisors for a given number.
+# To solve this, we need to count the number of divisors for a given number.
 #
-# Algorithm for counting divisors:
-# For a number `num`, iterate from `i = 1` up to `sqrt(num)`.
-# If `i` divides `num`, then `i` is a divisor.
-# Also, `num / i` is a divisor.
-# If `i * i == num`, then `i` and `num / i` are the same, so count only once.
-# Otherwise, count both `i` and `num / i`.
+# Counting divisors:
+# If num = p1^e1 * p2^e2 * ... then num has (e1 + 1) * (e2 + 1) * ... divisors.
+# The factorization comes from a smallest-prime-factor table (`euler.factor`),
+# which factors any number up to its limit in O(log n) steps.
+# Since n and n + 1 are coprime, T_n splits into two coprime factors
+# (n / 2 and n + 1, or n and (n + 1) / 2), and d(T_n) is the product of their
+# divisor counts. So the table only has to reach n + 1, not T_n; it is doubled
+# whenever n outgrows it.
 #
 # Main algorithm:
 # 1. Initialize `n = 1` (for the first natural number).
 # 2. Loop indefinitely:
-#    a. Calculate the current triangle number: `triangle_number = n * (n + 1) // 2`.
-#    b. Count the divisors of `triangle_number` using the `count_divisors` function.
-#    c. If the count of divisors is greater than 500, print `triangle_number` and break the loop.
-#    d. Increment `n` to calculate the next triangle number.
-#
-# The current solution implements this approach. The `count_divisors` function is efficient, and the main loop correctly generates triangle numbers and checks their divisor count.
+#    a. Count the divisors of T_n from the two coprime halves.
+#    b. If the count of divisors is greater than 500, print `n * (n + 1) // 2` and break the loop.
+#    c. Increment `n` to move to the next triangle number.
 
-def count_divisors(n):
-    count = 0
-    i = 1
-    while i * i <= n:
-        if n % i == 0:
-            if n / i == i:
-                count += 1
-            else:
-                count += 2
-        i += 1
-    return count
+from euler.factor import FactorTable
+from euler.figurate import polygonal
 
-def solve():
+def solve(divisors=500):
+    factor_table = FactorTable(1 << 14)
     n = 1
     while True:
-        triangle_number = n * (n + 1) // 2
-        if count_divisors(triangle_number) > 500:
-            print(triangle_number)
-            break
+        if n + 1 > factor_table.limit:
+            factor_table = FactorTable(2 * factor_table.limit)
+        if n % 2 == 0:
+            divisor_count = factor_table.num_divisors(n // 2) * factor_table.num_divisors(n + 1)
+        else:
+            divisor_count = factor_table.num_divisors(n) * factor_table.num_divisors((n + 1) // 2)
+        if divisor_count > divisors:
+            triangle_number = polygonal(3, n)
+            return triangle_number
         n += 1
 
-solve()
+if __name__ == "__main__":
+    print(solve())
@@ -115,7 +115,7 @@
 #
 # The current solution correctly implements this approach. It uses a multi-line string to store the numbers, splits them, converts them to integers, sums them, and then prints the first 10 digits of the sum.
 
-def solve():
+def solve(digits=10):
     numbers_str = """
     37107287533902102798797998220837590246510135740250
     46376937677490009712648124896970078050417018260538
@@ -220,6 +220,7 @@ def solve():
     """
     
     total = sum(int(''.join(filter(str.isdigit, line))) for line in numbers_str.strip().split('\n'))
-    print(str(total)[:10])
+    return str(total)[:digits]
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -1,4 +1,4 @@
-def solve():
+def solve(limit=1000000):
     """
     Solves the Project Euler Problem 14.
 
@@ -25,7 +25,6 @@ def solve():
     lengths of chains that have already been calculated. This avoids
     redundant calculations for sub-sequences.
     """
-    limit = 1000000
     cache = {1: 1}
     max_len = 0
     start_num = 0
@@ -47,7 +46,7 @@ def solve():
             max_len = total_len
             start_num = i
             
-    print(f"The starting number under {limit} that produces the longest chain is: {start_num}")
-    print(f"The length of the chain is: {max_len}")
+    return start_num
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -1,6 +1,6 @@
 import math
 
-def solve():
+def solve(grid_size=20):
     """
     Solves the Project Euler Problem 15.
 
@@ -22,8 +22,8 @@ def solve():
     Here, n = 40 (total moves) and k = 20 (moves of one type, e.g., right).
     We need to calculate C(40, 20) = 40! / (20! * 20!).
     """
-    grid_size = 20
     num_paths = math.comb(2 * grid_size, grid_size)
-    print(f"For a {grid_size}x{grid_size} grid, there are {num_paths} routes.")
+    return num_paths
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -1,4 +1,6 @@
-def solve():
+from euler.digits import digit_sum
+
+def solve(power=1000):
     """
     Solves the Project Euler Problem 16.
 
@@ -10,17 +12,15 @@ def solve():
     The problem requires two main steps:
     1.  Calculate the value of 2^1000. Python's integers can handle
         arbitrarily large numbers, so we can compute this directly.
-    2.  Sum the digits of the resulting number. The easiest way to do this
-        is to convert the large number into a string. This allows us to
-        iterate through each character of the string.
-    3.  For each character, we convert it back to an integer and add it to a
-        running total.
+    2.  Sum the digits of the resulting number with `euler.digits.digit_sum`,
+        which converts a number this large to a string once and counts each
+        digit character in C instead of looping over the characters.
     """
-    power = 1000
     number = 2**power
     
-    sum_of_digits = sum(int(digit) for digit in str(number))
+    sum_of_digits = digit_sum(number)
     
-    print(f"The sum of the digits of 2^{power} is: {sum_of_digits}")
+    return sum_of_digits
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
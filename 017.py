@@ -1,4 +1,4 @@
-def solve():
+def solve(limit=1000):
     """
     Solves the Project Euler Problem 17.
 
@@ -56,10 +56,11 @@ def solve():
         return ""
 
     total_letters = 0
-    for i in range(1, 1001):
+    for i in range(1, limit + 1):
         words = number_to_words(i)
         total_letters += len(words)
         
-    print(f"The total number of letters used is: {total_letters}")
+    return total_letters
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -1,3 +1,5 @@
+from euler.path_sums import max_triangle_path
+
 def solve():
     """
     Solves the Project Euler Problem 18.
@@ -21,6 +23,9 @@ def solve():
     4. Repeat this process, moving up the triangle one row at a time, until
        we reach the top.
     5. The single number remaining at the top will be the maximum total path sum.
+
+    `euler.path_sums.max_triangle_path` runs this collapse one whole row at
+    a time.
     """
     triangle_str = """
     75
@@ -41,11 +46,7 @@ def solve():
     """
     
     triangle = [list(map(int, line.split())) for line in triangle_str.strip().split('\n')]
+    return max_triangle_path(triangle)
 
-    for i in range(len(triangle) - 2, -1, -1):
-        for j in range(len(triangle[i])):
-            triangle[i][j] += max(triangle[i+1][j], triangle[i+1][j+1])
-            
-    print(f"The maximum total from top to bottom is: {triangle[0][0]}")
-
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
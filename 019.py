@@ -1,6 +1,6 @@
 import datetime
 
-def solve():
+def solve(first_year=1901, last_year=2000):
     """
     Solves the Project Euler Problem 19.
 
@@ -29,11 +29,12 @@ def solve():
     a Sunday and increment a counter if it is.
     """
     sunday_count = 0
-    for year in range(1901, 2001):
+    for year in range(first_year, last_year + 1):
         for month in range(1, 13):
             if datetime.date(year, month, 1).weekday() == 6:
                 sunday_count += 1
                 
-    print(f"The number of Sundays that fell on the first of the month is: {sunday_count}")
+    return sunday_count
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -1,6 +1,8 @@
 import math
 
-def solve():
+from euler.digits import digit_sum
+
+def solve(n=100):
     """
     Solves the Project Euler Problem 20.
 
@@ -16,15 +18,15 @@ def solve():
     Python's `math.factorial()` function is perfect for this, and its standard
     integer type can handle the resulting large number without any overflow issues.
 
-    Second, once we have the number, we need to sum its digits. The most
-    direct way to do this is to convert the large integer into a string.
-    This allows us to iterate over each character (digit), convert it back
-    to an integer, and add it to a total sum.
+    Second, once we have the number, we need to sum its digits. The shared
+    `euler.digits.digit_sum` does this; for a number this large it converts
+    it to a string once and counts each digit character.
     """
-    number = math.factorial(100)
+    number = math.factorial(n)
     
-    sum_of_digits = sum(int(digit) for digit in str(number))
+    sum_of_digits = digit_sum(number)
     
-    print(f"The sum of the digits in 100! is: {sum_of_digits}")
+    return sum_of_digits
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve())
@@ -11,7 +11,7 @@ Evaluate the sum of all the amicable numbers under 10000.
 
 Solution Idea:
 To find the amicable numbers, we need to calculate the sum of proper divisors for each number up to the limit (10000).
-Let's define a function `sum_proper_divisors(n)` that calculates d(n). To do this efficiently, we can iterate from 2 up to the square root of n. If a number `i` divides `n`, then both `i` and `n/i` are divisors. We add both to our sum. We initialize the sum with 1 to account for the divisor 1.
+To compute d(n) efficiently, we take the divisor-sum table sigma for every number up to the limit from the shared multiplicative-function sieve (`euler.multiplicative`), which fills it in one pass. Then d(n) = sigma(n) - n.
 
 Once we have this function, we can iterate through all numbers `a` from 2 to 10000. For each `a`, we calculate `b = d(a)`. Then we check if `d(b) == a`.
 There's a condition that `a` and `b` must not be equal (`a ≠ b`).
@@ -20,29 +20,15 @@ If these conditions are met, `a` is an amicable number, and we add it to our tot
 To make this more efficient, we can pre-calculate and store the sum of proper divisors for all numbers up to 10000 in an array or list. This avoids re-calculating `d(n)` multiple times.
 """
 
-def sum_proper_divisors(n):
-    """
-    Calculates the sum of proper divisors of a number n.
-    """
-    if n < 2:
-        return 0
-    
-    s = 1
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            s += i
-            if i * i != n:
-                s += n // i
-    return s
-
-def solve():
+from euler.multiplicative import multiplicative_tables
+
+def solve(limit=10000):
     """
     Finds the sum of all amicable numbers under 10000.
     """
-    limit = 10000
-    d_values = [0] * limit
-    for i in range(1, limit):
-        d_values[i] = sum_proper_divisors(i)
+    sigma = multiplicative_tables(limit - 1, ("sigma",))["sigma"]
+    d_values = [s - i for i, s in enumerate(sigma)]
+    d_values[1] = 0
     
     amicable_sum = 0
     for a in range(2, limit):
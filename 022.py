@@ -19,18 +19,16 @@ Solution Idea:
 8. Add this name score to the total score.
 9. After iterating through all the names, the total score will be the answer.
 """
+from euler.documents import words
 
 def solve():
     """
     Calculates the total of all name scores in the file.
     """
     try:
-        with open('resources/documents/0022_names.txt', 'r') as f:
-            content = f.read()
+        names = sorted(words("0022_names.txt"))
     except FileNotFoundError:
         return "Error: names.txt not found. Please make sure the file is in the 'resources/documents/' directory."
-
-    names = sorted([name.strip('"') for name in content.split(',')])
     
     total_score = 0
     for i, name in enumerate(names, 1):
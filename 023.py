@@ -11,37 +11,24 @@ As 12 is the smallest abundant number, 1 + 2 + 3 + 4 + 6 = 16, the smallest numb
 Find the sum of all the positive integers which cannot be written as the sum of two abundant numbers.
 
 Solution Idea:
-1.  **Find all abundant numbers:** We need to find all abundant numbers up to the limit of 28123. An abundant number is a number where the sum of its proper divisors is greater than the number itself. We can create a helper function `sum_proper_divisors(n)` to calculate this sum.
+1.  **Find all abundant numbers:** We need to find all abundant numbers up to the limit of 28123. An abundant number is a number where the sum of its proper divisors is greater than the number itself. We get this sum as sigma(n) - n, reading sigma from the divisor-sum table that the shared multiplicative-function sieve (`euler.multiplicative`) fills in one pass.
 2.  **Generate sums of two abundant numbers:** Create a list of all abundant numbers found in step 1. Then, generate all possible sums of two numbers from this list. We only need to consider sums that are less than or equal to 28123. A boolean array (or a set) is a good way to keep track of which numbers can be formed by the sum of two abundant numbers.
 3.  **Identify non-abundant sums:** The numbers that *cannot* be expressed as the sum of two abundant numbers are the ones not marked in our boolean array from step 2.
 4.  **Calculate the final sum:** Sum up all the numbers from 1 to 28123 that were not marked in the boolean array. This sum is our final answer.
 """
 
-def sum_proper_divisors(n):
-    """
-    Calculates the sum of proper divisors of a number n.
-    """
-    if n < 2:
-        return 0
-    
-    s = 1
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            s += i
-            if i * i != n:
-                s += n // i
-    return s
+from euler.multiplicative import multiplicative_tables
 
-def solve():
+def solve(limit=28123):
     """
     Finds the sum of all positive integers which cannot be written as the sum of two abundant numbers.
     """
-    limit = 28123
+    sigma = multiplicative_tables(limit, ("sigma",))["sigma"]
     
-    # 1. Find all abundant numbers
+    # 1. Find all abundant numbers (sum of proper divisors = sigma(i) - i)
     abundant_numbers = []
     for i in range(12, limit + 1):
-        if sum_proper_divisors(i) > i:
+        if sigma[i] - i > i:
             abundant_numbers.append(i)
             
     # 2. Generate sums of two abundant numbers
@@ -35,16 +35,16 @@ Instead of generating all 10! (3,628,800) permutations, which would be inefficie
 """
 import math
 
-def solve():
+def solve(position=1000000, digit_count=10):
     """
     Finds the millionth lexicographic permutation of the digits 0-9.
     """
-    digits = list(range(10))
-    target_index = 1_000_000 - 1  # Using 0-based index
+    digits = list(range(digit_count))
+    target_index = position - 1  # Using 0-based index
     
     result = []
     
-    for i in range(10, 0, -1):
+    for i in range(digit_count, 0, -1):
         # Calculate the factorial of the remaining digits
         f = math.factorial(i - 1)
         
@@ -28,14 +28,14 @@ We need to generate Fibonacci numbers and check the number of digits of each one
 
 2.  **Iteration:** We will loop, calculating the next Fibonacci number by adding the previous two (`fib = a + b`).
 
-3.  **Digit Check:** In each iteration, we check the number of digits in the newly calculated Fibonacci number. The easiest way to do this is to convert the number to a string and find its length: `len(str(fib))`.
+3.  **Digit Check:** In each iteration, we check the number of digits in the newly calculated Fibonacci number. Converting every term to a string (`len(str(fib))`) costs time quadratic in its length, and `str()` refuses ints beyond 4300 digits by default. Instead we compare with the smallest 1000-digit number: a term has 1000 digits exactly when it is at least `10^999`, which is computed once.
 
-4.  **Termination:** The loop continues until the length of the string representation of the Fibonacci number is 1000. When it is, we have found our target. The index counter at that point will be our answer.
+4.  **Termination:** The loop continues until the Fibonacci number reaches `10^999`. When it does, we have found our target. The index counter at that point will be our answer.
 
 5.  **Updating:** Inside the loop, after calculating the new term, we update our variables for the next iteration: `a` becomes `b`, and `b` becomes the new term. We also increment our index counter.
 """
 
-def solve():
+def solve(digits=1000):
     """
     Finds the index of the first term in the Fibonacci sequence to contain 1000 digits.
     """
@@ -43,10 +43,11 @@ def solve():
     a, b = 1, 1
     index = 2
     
-    # The number of digits in a number n is len(str(n))
+    # A number has at least `digits` digits exactly when it is >= 10^(digits-1).
     # We are looking for the first term with 1000 digits.
+    smallest = 10 ** (digits - 1)
     
-    while len(str(b)) < 1000:
+    while b < smallest:
         # Calculate the next term
         a, b = b, a + b
         index += 1
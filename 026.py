@@ -50,14 +50,14 @@ def get_cycle_length(d):
         # The cycle length is the current position minus the position where the remainder was first seen.
         return position - remainders[remainder]
 
-def solve():
+def solve(limit=1000):
     """
     Finds the value of d < 1000 for which 1/d has the longest recurring cycle.
     """
     max_length = 0
     result_d = 0
     
-    for d in range(2, 1000):
+    for d in range(2, limit):
         length = get_cycle_length(d)
         if length > max_length:
             max_length = length
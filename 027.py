@@ -23,7 +23,7 @@ We need to find the combination of coefficients 'a' and 'b' that generates the l
     - When `n = 0`, the formula is `0^2 + a*0 + b = b`. For this to be a prime number, `b` itself must be a prime number. This significantly reduces the number of values we need to check for `b`. Also, since primes are positive, `b` must be greater than 1. So, we only need to check prime values of `b` from 2 to 1000.
     - When `n = 1`, the formula is `1 + a + b`. This must also be prime.
 
-3.  **Primality Test**: We need an efficient function to check if a number is prime. A standard `is_prime` function that checks for divisibility up to the square root of the number will work. We can add a cache (memoization) to this function to avoid re-calculating primality for the same number multiple times, which will speed up the process.
+3.  **Primality Test**: We need an efficient function to check if a number is prime. We use `is_prime` from the shared `euler.primality` module: small values are looked up in a precomputed sieve table and larger ones go through a deterministic Miller-Rabin test, so no extra memoization is needed.
 
 4.  **The Algorithm**:
     - Create a list of all prime numbers up to 1000. These are our candidates for `b`.
@@ -33,36 +33,9 @@ We need to find the combination of coefficients 'a' and 'b' that generates the l
     - Keep track of the `(a, b)` pair that produces the longest chain of primes.
     - After checking all pairs, the answer is the product of the `a` and `b` that gave the maximum length.
 """
-import math
+from euler.primality import is_prime
 
-prime_cache = {}
-
-def is_prime(n):
-    """
-    Checks if a number is prime with memoization.
-    """
-    if n in prime_cache:
-        return prime_cache[n]
-    
-    if n < 2:
-        prime_cache[n] = False
-        return False
-    if n == 2:
-        prime_cache[n] = True
-        return True
-    if n % 2 == 0:
-        prime_cache[n] = False
-        return False
-    
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            prime_cache[n] = False
-            return False
-            
-    prime_cache[n] = True
-    return True
-
-def solve():
+def solve(limit=1000):
     """
     Finds the product of coefficients a and b for the quadratic expression
     that produces the maximum number of primes for consecutive values of n.
@@ -72,10 +45,10 @@ def solve():
     best_b = 0
 
     # Optimization: b must be a prime
-    primes_b = [i for i in range(2, 1001) if is_prime(i)]
+    primes_b = [i for i in range(2, limit + 1) if is_prime(i)]
 
     for b in primes_b:
-        for a in range(-999, 1000):
+        for a in range(-limit + 1, limit):
             n = 0
             while True:
                 result = n*n + a*n + b
@@ -36,11 +36,10 @@ Instead of constructing the entire spiral, we can find a mathematical pattern fo
     - In each layer `s`, we add the step `(s-1)` to the `current_number` four times, and add each new `current_number` to our total sum.
 """
 
-def solve():
+def solve(limit=1001):
     """
     Calculates the sum of the numbers on the diagonals in a 1001 by 1001 spiral.
     """
-    limit = 1001
     
     total_sum = 1
     current_number = 1
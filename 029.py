@@ -24,15 +24,15 @@ The problem asks for the number of *distinct* terms. A `set` is the perfect data
 4.  **Final Count**: After the loops have finished, the number of distinct terms is simply the size (length) of the set.
 """
 
-def solve():
+def solve(limit=100):
     """
     Calculates the number of distinct terms in the sequence a^b
     for 2 <= a <= 100 and 2 <= b <= 100.
     """
     distinct_terms = set()
     
-    for a in range(2, 101):
-        for b in range(2, 101):
+    for a in range(2, limit + 1):
+        for b in range(2, limit + 1):
             distinct_terms.add(a**b)
             
     return len(distinct_terms)
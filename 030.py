@@ -32,27 +32,28 @@ Therefore, we only need to check numbers up to the maximum possible sum for a 6-
 
 The algorithm is as follows:
 1. Iterate through numbers from 2 up to our calculated limit (354,294). We start at 2 because 1 is not considered a sum.
-2. For each number, calculate the sum of the fifth powers of its digits.
+2. For each number, calculate the sum of the fifth powers of its digits. `euler.digits.digit_power_sums`
+   fills a table of these sums for the whole range at once, four digits at a time (vectorized with numpy
+   when it is installed).
 3. If the sum is equal to the number itself, add it to a list of results.
 4. Finally, sum all the numbers in our results list.
 """
+from euler.digits import digit_power_sums
 
-def solve():
+def solve(power=5):
     """
     Finds the sum of all numbers that can be written as the sum of the fifth powers of their digits.
     """
-    # Upper limit is 6 * (9^5) = 354294
-    limit = 354294
-    found_numbers = []
+    # Upper limit is d * 9^power for the largest digit count d that can still
+    # reach d digits; for power=5 that is 6 * (9^5) = 354294.
+    digits = 1
+    while 10**digits <= (digits + 1) * 9**power:
+        digits += 1
+    limit = digits * 9**power
+    sums_of_powers = digit_power_sums(0, limit + 1, power)
     
     # Start from 10, as single-digit numbers are not sums.
-    for n in range(10, limit + 1):
-        sum_of_powers = 0
-        for digit in str(n):
-            sum_of_powers += int(digit)**5
-        
-        if sum_of_powers == n:
-            found_numbers.append(n)
+    found_numbers = [n for n in range(10, limit + 1) if sums_of_powers[n] == n]
             
     return sum(found_numbers)
 
@@ -24,28 +24,17 @@ This is a classic "coin change" problem, which can be solved efficiently using d
     - The update rule is: `ways[j] = ways[j] + ways[j - coin]`.
 
 4.  **Result**: After iterating through all the coins, the value at `ways[200]` will hold the total number of different combinations to make 200p. The order of the loops (coins on the outside, amounts on the inside) is crucial to ensure we count combinations, not permutations.
+
+This table is `euler.partitions.ways_table`; `count_ways(target, coins)` returns its last entry.
 """
+from euler.partitions import count_ways
 
-def solve():
+def solve(target=200):
     """
     Calculates the number of different ways to make £2 (200p) using any number of coins.
     """
-    target = 200
     coins = [1, 2, 5, 10, 20, 50, 100, 200]
-    
-    # Initialize a list to store the number of ways to make each amount
-    ways = [0] * (target + 1)
-    
-    # Base case: There is one way to make 0 (using no coins)
-    ways[0] = 1
-    
-    # Iterate through each coin
-    for coin in coins:
-        # Update the ways array for amounts from the coin value up to the target
-        for j in range(coin, target + 1):
-            ways[j] += ways[j - coin]
-            
-    return ways[target]
+    return count_ways(target, coins)
 
 if __name__ == "__main__":
     print(solve())
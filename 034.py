@@ -29,7 +29,7 @@ The algorithm is as follows:
 """
 import math
 
-def solve():
+def solve(limit=2540160):
     """
     Finds the sum of all numbers which are equal to the sum of the factorial of their digits.
     """
@@ -39,7 +39,6 @@ def solve():
     curious_numbers = []
     
     # Upper bound is 7 * 9! = 2,540,160
-    limit = 2540160
     
     # Start from 10 as 1! and 2! are not sums.
     for n in range(10, limit + 1):
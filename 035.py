@@ -27,20 +27,16 @@ To solve this, we need an efficient way to check for primality and a method to r
     - When we find a number that is a circular prime, we increment the counter.
     - The final value of the counter will be our answer. The problem asks for the count of such primes, so we don't need to worry about duplicates in the count (e.g., counting 197, 971, and 719 separately is correct as they are all distinct circular primes).
 """
+from euler.prime_table import cached_sieve
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the number of circular primes below one million.
     """
-    limit = 1_000_000
     
     # Step 1: Sieve of Eratosthenes to find all primes up to the limit
-    is_prime = [True] * limit
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(limit**0.5) + 1):
-        if is_prime[i]:
-            for multiple in range(i*i, limit, i):
-                is_prime[multiple] = False
+    sieve = cached_sieve(limit - 1)
+    is_prime = sieve.is_prime
 
     circular_prime_count = 0
     # Step 2: Iterate through numbers and check for circular prime property
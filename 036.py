@@ -9,48 +9,28 @@ Find the sum of all numbers, less than one million, which are palindromic in bas
 (Please note that the palindromic number, in either base, may not include leading zeros.)
 
 Solution Idea:
-We need to check every number from 1 up to 999,999 to see if it meets the criteria. For each number, we'll perform two checks:
-1.  Is it a palindrome in base 10?
-2.  Is it a palindrome in base 2?
+Instead of testing every number below one million, we only look at the numbers that are already palindromes in base 10 and check those in base 2.
 
-If a number satisfies both conditions, we add it to a running total.
+1.  **Generate Base 10 Palindromes**: A palindrome is determined by its first half. `euler.digits.palindromes` mirrors every possible first half (1..999 for numbers below one million), which yields the 1,998 decimal palindromes directly instead of filtering 999,999 numbers.
 
-1.  **Iterate**: We will loop through all numbers `n` from 1 to 999,999.
-
-2.  **Base 10 Palindrome Check**:
-    - For each number `n`, we convert it to a string.
-    - We can then easily check if the string is equal to its reverse. For example, in Python, `str(n) == str(n)[::-1]`.
-
-3.  **Base 2 Palindrome Check**:
-    - If the number is a palindrome in base 10, we then proceed to check its binary representation.
-    - We convert the number `n` to its binary string. Python's `bin(n)` function returns a string like `'0b101'`. We need to slice this string to remove the `'0b'` prefix (e.g., `bin(n)[2:]`).
-    - We then check if this binary string is a palindrome in the same way as the base 10 check.
+2.  **Base 2 Palindrome Check**:
+    - For each decimal palindrome we check its binary representation with `euler.digits.is_palindrome(n, 2)`.
+    - It formats the number as a binary string (without the `'0b'` prefix) and compares the string with its reverse.
 
 4.  **Summation**:
-    - We initialize a sum to 0.
-    - If a number passes both checks, we add it to the sum.
+    - We add up the decimal palindromes that pass the binary check.
 
 5.  **Final Result**: The final sum after checking all numbers up to the limit is the answer. The constraint about leading zeros is naturally handled by standard string conversions of numbers.
 """
+from euler.digits import is_palindrome, palindromes
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the sum of all numbers, less than one million, which are
     palindromic in base 10 and base 2.
     """
-    total_sum = 0
-    limit = 1_000_000
-    
-    for n in range(1, limit):
-        # Check for base 10 palindrome
-        s10 = str(n)
-        if s10 == s10[::-1]:
-            # If it is, check for base 2 palindrome
-            s2 = bin(n)[2:] # Remove the '0b' prefix
-            if s2 == s2[::-1]:
-                total_sum += n
-                
-    return total_sum
+    # Every base 10 palindrome below the limit, checked in base 2
+    return sum(n for n in palindromes(limit) if is_palindrome(n, 2))
 
 if __name__ == "__main__":
     print(solve())
@@ -21,20 +21,16 @@ We need to find 11 primes with this special property. This requires an efficient
 
 4.  **Collect and Sum**: If a number passes both tests, it's a truncatable prime. We add it to a list. Once our list contains 11 numbers, we can stop searching and compute their sum.
 """
+from euler.prime_table import cached_sieve
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the sum of the only eleven primes that are both truncatable from left to right and right to left.
     """
-    limit = 1_000_000  # A reasonable upper bound to search within
     
     # Sieve of Eratosthenes to find all primes up to the limit
-    is_prime = [True] * limit
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(limit**0.5) + 1):
-        if is_prime[i]:
-            for multiple in range(i*i, limit, i):
-                is_prime[multiple] = False
+    sieve = cached_sieve(limit - 1)
+    is_prime = sieve.is_prime
 
     truncatable_primes = []
     
@@ -13,6 +13,7 @@ We need to find the number of unique integer sets {a, b, c} that form a right-an
     - `a = m^2 - k^2`
     - `b = 2mk`
     - `c = m^2 + k^2`
+    Equivalently, they form the Berggren tree rooted at (3, 4, 5), which `euler.pythagorean` walks without any gcd tests.
 
 2.  **Perimeter of Primitive Triples**: The perimeter `p_primitive` for such a triple is:
     `p_primitive = a + b + c = (m^2 - k^2) + 2mk + (m^2 + k^2) = 2m^2 + 2mk = 2m(m + k)`
@@ -22,35 +23,19 @@ We need to find the number of unique integer sets {a, b, c} that form a right-an
 
 4.  **Algorithm**:
     - We can create an array `counts` of size 1001 to store the number of solutions for each perimeter.
-    - We iterate through possible values of `m` and `k` that satisfy the conditions.
-    - The perimeter `p = 2m(m+k)` must be less than or equal to 1000. Since `k < m`, `2m(m+m) > p`, which means `4m^2 > p`. A loose upper bound for `m` is `sqrt(1000/2)`, so `m` only needs to go up to about 22.
-    - For each pair `(m, k)` that generates a primitive triple, we calculate `p_primitive`.
+    - We walk the primitive triples with perimeter at most 1000.
     - We then iterate through all multiples of `p_primitive` (i.e., `p_primitive, 2*p_primitive, 3*p_primitive, ...`) that are less than or equal to 1000 and increment the count for each of these perimeters in our `counts` array.
+    - `euler.pythagorean.perimeter_counts(1000)` builds exactly this `counts` array.
     - Finally, we find the index (the perimeter `p`) in the `counts` array that has the highest value.
 """
-import math
+from euler.pythagorean import perimeter_counts
 
-def solve():
+def solve(limit=1000):
     """
     Finds the perimeter p <= 1000 for which the number of right-angle triangle solutions is maximised.
     """
-    limit = 1000
-    counts = [0] * (limit + 1)
-    
-    # Iterate through m and k to generate primitive triples
-    m_limit = int((limit / 2)**0.5)
-    for m in range(2, m_limit + 1):
-        for k in range(1, m):
-            # Conditions for a primitive triple: m, k are coprime and one is even
-            if (m - k) % 2 == 1 and math.gcd(m, k) == 1:
-                # Calculate the perimeter of the primitive triple
-                p_primitive = 2 * m * (m + k)
-                
-                # Add counts for this primitive and all its multiples up to the limit
-                p = p_primitive
-                while p <= limit:
-                    counts[p] += 1
-                    p += p_primitive
+    # Number of right triangles for every perimeter up to the limit
+    counts = perimeter_counts(limit)
                     
     # Find the perimeter with the maximum number of solutions
     max_solutions = 0
@@ -60,11 +60,11 @@ def find_digit(n):
     
     return int(str(the_number)[digit_index])
 
-def solve():
+def solve(limit=1000000):
     """
     Calculates the product of the specified digits of the Champernowne constant.
     """
-    indices = [1, 10, 100, 1000, 10000, 100000, 1000000]
+    indices = [10**k for k in range(len(str(limit))) if 10**k <= limit]
     product = 1
     
     for index in indices:
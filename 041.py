@@ -30,25 +30,11 @@ We are looking for the largest prime number that is also pandigital. This sugges
     - The very first prime number we find will be the largest one, and we can stop our search.
 
 4.  **Primality Test**:
-    - We need a standard `is_prime` function. For numbers up to 7 digits, a trial division check up to the square root of the number is efficient enough.
+    - We use `is_prime` from the shared `euler.primality` module, a deterministic Miller-Rabin test with a sieve-table fast path for small numbers.
 """
-import math
 import itertools
 
-def is_prime(n):
-    """
-    Checks if a number is prime.
-    """
-    if n < 2:
-        return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+from euler.primality import is_prime
 
 def solve():
     """
@@ -12,8 +12,7 @@ Using words.txt, a 16K text file containing nearly two-thousand common English w
 Solution Idea:
 1.  **Read and Parse the File**: First, we need to read the `words.txt` file. The file contains a single line of comma-separated, double-quoted words. We'll parse this line to get a clean list of words.
 
-2.  **Generate Triangle Numbers**: We need a way to check if a word's value is a triangle number. Instead of checking for each word value individually, it's more efficient to pre-generate a set of triangle numbers up to a reasonable limit.
-    - We need to estimate the maximum possible word value. The longest words in the file are around 14 characters. A word like "WWWWWWWWWWWWWW" would have a value of `14 * 23 = 322`. A word like "ZZZZZZZZZZZZZZ" would be `14 * 26 = 364`. Let's generate triangle numbers up to a value of 500 to be safe.
+2.  **Triangle Number Test**: `t = n(n+1)/2` solves to `n = (-1 + sqrt(1 + 8t)) / 2`, so `t` is a triangle number exactly when `1 + 8t` is a perfect square. `euler.figurate.is_polygonal(3, t)` does this with one `isqrt`, so there is no need to guess the largest word value and pre-generate a set of triangle numbers up to it.
 
 3.  **Calculate Word Values**: We'll loop through each word from the file. For each word, we calculate its value by summing the alphabetical positions of its letters (A=1, B=2, ...). The ASCII value of a character can be used for this: `ord(char) - ord('A') + 1`.
 
@@ -21,28 +20,22 @@ Solution Idea:
 
 5.  **Final Result**: The final value of the counter is the answer.
 """
+from euler.documents import words as load_words
+from euler.figurate import is_polygonal
 
 def solve():
     """
     Finds the number of triangle words in the words.txt file.
     """
     try:
-        with open('resources/documents/0042_words.txt', 'r') as f:
-            content = f.read()
+        words = load_words("0042_words.txt")
     except FileNotFoundError:
         return "Error: words.txt not found. Please make sure the file is in the 'resources/documents/' directory."
-
-    words = [word.strip('"') for word in content.split(',')]
-    
-    # Generate a set of triangle numbers up to a reasonable limit.
-    # Max word length is ~14, max letter value is 26. Max value ~14*26 = 364.
-    # Let's generate up to n=30, which gives t_30 = 465.
-    triangle_numbers = {n * (n + 1) // 2 for n in range(1, 31)}
     
     triangle_word_count = 0
     for word in words:
         word_value = sum(ord(char) - ord('A') + 1 for char in word)
-        if word_value in triangle_numbers:
+        if is_polygonal(3, word_value):
             triangle_word_count += 1
             
     return triangle_word_count
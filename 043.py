@@ -41,33 +41,16 @@ The problem asks for the sum of all 0-to-9 pandigital numbers that satisfy a spe
     - If a number passes all the checks, convert it to an integer and add it to the total sum.
 
 4.  **Final Result**: The final sum will be the answer.
+
+`euler.pandigital.substring_divisible_pandigitals` avoids the 10! permutations: it builds the number from the right, one digit at a time, and drops a partial number as soon as the three-digit window its new digit completes fails its divisor (17 first, then 13, 11, ...). Only a few hundred partial numbers survive any step, so the search takes milliseconds, and it runs unchanged for other bases and divisor lists.
 """
-import itertools
+from euler.pandigital import substring_divisible_pandigitals
 
 def solve():
     """
     Finds the sum of all 0 to 9 pandigital numbers with the sub-string divisibility property.
     """
-    total_sum = 0
-    digits = '0123456789'
-    
-    for p in itertools.permutations(digits):
-        # Skip numbers with a leading zero
-        if p[0] == '0':
-            continue
-        
-        # Check all divisibility properties
-        if (int("".join(p[1:4])) % 2 == 0 and
-            int("".join(p[2:5])) % 3 == 0 and
-            int("".join(p[3:6])) % 5 == 0 and
-            int("".join(p[4:7])) % 7 == 0 and
-            int("".join(p[5:8])) % 11 == 0 and
-            int("".join(p[6:9])) % 13 == 0 and
-            int("".join(p[7:10])) % 17 == 0):
-            
-            total_sum += int("".join(p))
-            
-    return total_sum
+    return sum(substring_divisible_pandigitals())
 
 if __name__ == "__main__":
     print(solve())
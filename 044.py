@@ -14,13 +14,13 @@ We need to search for two pentagonal numbers, `P_j` and `P_k`, such that `P_k +
 
 1.  **Pentagonal Number Check**: We need an efficient way to check if an arbitrary number `x` is a pentagonal number. A number `x` is pentagonal if there is an integer solution `n` to the equation `x = n(3n-1)/2`. We can solve this for `n` using the quadratic formula:
     `n = (1 + sqrt(1 + 24x)) / 6`
-    For `n` to be a positive integer, `1 + 24x` must be a perfect square, and the result of `(1 + sqrt(1 + 24x))` must be divisible by 6. This gives us a fast `is_pentagonal(x)` test.
+    For `n` to be a positive integer, `1 + 24x` must be a perfect square, and the result of `(1 + sqrt(1 + 24x))` must be divisible by 6. This gives us a fast test; `euler.figurate.polygonal_tester(5)` builds it with the constants folded in.
 
 2.  **Search Strategy**: We can iterate through pentagonal numbers and check pairs.
     - We will generate pentagonal numbers `P_k` for `k = 1, 2, 3, ...`.
     - For each `P_k`, we will check it against all previously generated pentagonal numbers `P_j` (where `j < k`).
     - For each pair `(P_j, P_k)`, we calculate their sum `S = P_k + P_j` and difference `D = P_k - P_j`.
-    - We then use our `is_pentagonal` function to check if both `S` and `D` are pentagonal.
+    - We then use our pentagonal test to check if both `S` and `D` are pentagonal.
 
 3.  **Minimizing D**:
     - We are looking for the minimum possible `D`. We will keep track of the smallest `D` found so far, let's call it `min_D`.
@@ -29,30 +29,19 @@ We need to search for two pentagonal numbers, `P_j` and `P_k`, such that `P_k +
 
 4.  **Stopping Condition**: The overall search can be stopped when the difference between consecutive pentagonal numbers (`P_k - P_{k-1}`) becomes larger than the smallest `min_D` we have found. At that point, any new pair we check will have a difference larger than `min_D`, so we know we have found the global minimum. However, a simple search up to a reasonable limit (e.g., a few thousand for `k`) is sufficient and fast enough to find the solution.
 """
-import math
+from euler.figurate import polygonal, polygonal_tester
 
-def is_pentagonal(x):
-    """Checks if a number x is a pentagonal number."""
-    if x <= 0:
-        return False
-    # A number is pentagonal if n = (1 + sqrt(1 + 24x)) / 6 is an integer.
-    val = 1 + 24 * x
-    sqrt_val = math.isqrt(val)
-    if sqrt_val * sqrt_val != val:
-        return False
-    return (1 + sqrt_val) % 6 == 0
-
-def solve():
+def solve(limit=3000):
     """
     Finds the minimized difference D between two pentagonal numbers whose sum and difference are also pentagonal.
     """
+    is_pentagonal = polygonal_tester(5)
     min_D = float('inf')
     pent_numbers = []
-    # A search limit of 3000 is sufficient to find the solution.
-    limit = 3000
+    # The default search limit of 3000 is sufficient to find the solution.
 
     for k in range(1, limit):
-        p_k = k * (3 * k - 1) // 2
+        p_k = polygonal(5, k)
         
         # Iterate j backwards because smaller differences (j close to k) are more likely to be the minimum.
         for p_j in reversed(pent_numbers):
@@ -29,20 +29,9 @@ We are looking for a number `x` that is present in all three sequences.
     - For each hexagonal number `H` we generate, we need to check if it is also a pentagonal number.
     - The first number we find that satisfies this condition will be our answer.
 
-4.  **Pentagonal Number Test**: To check if a number `x` is pentagonal, we can solve the formula `x = k(3k-1)/2` for `k`. Using the quadratic formula, we get `k = (1 + sqrt(1 + 24x)) / 6`. For `k` to be a positive integer, `1 + 24x` must be a perfect square, and `(1 + sqrt(1 + 24x))` must be divisible by 6. This gives us a fast and reliable test.
+4.  **Pentagonal Number Test**: To check if a number `x` is pentagonal, we can solve the formula `x = k(3k-1)/2` for `k`. Using the quadratic formula, we get `k = (1 + sqrt(1 + 24x)) / 6`. For `k` to be a positive integer, `1 + 24x` must be a perfect square, and `(1 + sqrt(1 + 24x))` must be divisible by 6. This gives us a fast and reliable test, `euler.figurate.is_polygonal(5, x)`.
 """
-import math
-
-def is_pentagonal(x):
-    """Checks if a number x is a pentagonal number."""
-    if x <= 0:
-        return False
-    # A number is pentagonal if k = (1 + sqrt(1 + 24x)) / 6 is an integer.
-    val = 1 + 24 * x
-    sqrt_val = math.isqrt(val)
-    if sqrt_val * sqrt_val != val:
-        return False
-    return (1 + sqrt_val) % 6 == 0
+from euler.figurate import is_polygonal, polygonal
 
 def solve():
     """
@@ -53,10 +42,10 @@ def solve():
     
     while True:
         # Generate the next hexagonal number
-        hexagonal_num = n * (2 * n - 1)
+        hexagonal_num = polygonal(6, n)
         
         # Check if it's also pentagonal (we already know it's triangular)
-        if is_pentagonal(hexagonal_num):
+        if is_polygonal(5, hexagonal_num):
             return hexagonal_num
         
         n += 1
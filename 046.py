@@ -33,19 +33,16 @@ We need to find the first odd composite number `n` that does not satisfy the equ
 """
 import math
 
-def solve():
+from euler.sieve import Sieve
+
+def solve(limit=10000):
     """
     Finds the smallest odd composite that cannot be written as the sum of a prime and twice a square.
     """
-    limit = 10000  # A reasonable search limit
     
     # Sieve of Eratosthenes to find primes
-    is_prime = [True] * limit
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(limit**0.5) + 1):
-        if is_prime[i]:
-            for multiple in range(i*i, limit, i):
-                is_prime[multiple] = False
+    sieve = Sieve(limit - 1)
+    is_prime = sieve.is_prime
 
     # Start checking odd numbers from 9 (the first odd composite)
     n = 9
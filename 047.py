@@ -17,10 +17,8 @@ Solution Idea:
 We need to find the first number `n` such that `n`, `n+1`, `n+2`, and `n+3` all have exactly four distinct prime factors. A brute-force approach of factoring each number individually would be slow. A much more efficient method is to pre-compute the number of distinct prime factors for all numbers up to a certain limit using a sieve-like algorithm.
 
 1.  **Sieve to Count Distinct Prime Factors**:
-    - We create an array, let's call it `factors_count`, initialized to all zeros, up to a reasonable search limit (e.g., 200,000). `factors_count[i]` will store the number of distinct prime factors of `i`.
-    - We iterate through numbers `i` starting from 2.
-    - If `factors_count[i]` is 0, it means `i` is a prime number.
-    - When we find a prime `i`, we then iterate through all of its multiples (`j = i, 2i, 3i, ...`) up to our limit and increment their distinct prime factor count (`factors_count[j] += 1`).
+    - We build an array, let's call it `factors_count`, up to a reasonable search limit (e.g., 200,000). `factors_count[i]` will store the number of distinct prime factors of `i` (the function omega).
+    - The table comes from the shared multiplicative-function sieve in `euler.multiplicative`: writing `n = p * m` with `p` the smallest prime factor of `n`, `omega(n) = omega(m)` if `p` divides `m` and `omega(m) + 1` otherwise, so one pass fills it.
 
 2.  **Search for the Consecutive Sequence**:
     - After the sieve has populated our `factors_count` array, we can simply iterate through it to find our sequence.
@@ -28,32 +26,27 @@ We need to find the first number `n` such that `n`, `n+1`, `n+2`, and `n+3` all
     - In the loop, we check if `factors_count[n]`, `factors_count[n+1]`, `factors_count[n+2]`, and `factors_count[n+3]` are all equal to 4.
     - The first `n` that satisfies this condition is the answer.
 """
+from euler.multiplicative import multiplicative_tables
 
-def solve():
+def solve(count=4, limit=200000):
     """
     Finds the first of four consecutive integers to have four distinct prime factors each.
     """
-    limit = 200000  # A reasonable search limit, can be increased if needed.
-    factors_count = [0] * limit
     
     # Sieve to count the number of distinct prime factors for each number
-    for i in range(2, limit):
-        if factors_count[i] == 0:  # i is a prime
-            # Iterate through multiples of i and increment their factor count
-            for j in range(i, limit, i):
-                factors_count[j] += 1
+    factors_count = multiplicative_tables(limit - 1, ("omega",))["omega"]
     
     # Search for the first sequence of four consecutive numbers
     consecutive_count = 0
     for i in range(2, limit):
-        if factors_count[i] == 4:
+        if factors_count[i] == count:
             consecutive_count += 1
         else:
             consecutive_count = 0
             
-        if consecutive_count == 4:
+        if consecutive_count == count:
             # We found the end of the sequence, so the start is i - 3
-            return i - 3
+            return i - count + 1
             
     return "Not found within the limit."
 
@@ -27,14 +27,14 @@ The key is that we only need the *last ten digits* of the final sum. This is a c
     - After the loop finishes, `total_sum` will hold the last ten digits of the series.
 """
 
-def solve():
+def solve(limit=1000):
     """
     Finds the last ten digits of the series, 1^1 + 2^2 + ... + 1000^1000.
     """
     modulus = 10**10
     total_sum = 0
     
-    for n in range(1, 1001):
+    for n in range(1, limit + 1):
         # Use Python's built-in pow(base, exp, mod) for efficient modular exponentiation
         term = pow(n, n, modulus)
         total_sum = (total_sum + term) % modulus
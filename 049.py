@@ -14,7 +14,7 @@ We need to find a sequence of three 4-digit prime numbers that are permutations
 1.  **Sieve for Primes**: First, we need a list of all 4-digit prime numbers. A Sieve of Eratosthenes up to 9999 is the most efficient way to generate these.
 
 2.  **Iterate and Search**: We will iterate through our list of 4-digit primes. For each prime `p1`, we will search for a second prime `p2` that is a permutation of `p1`.
-    - To check if two numbers are permutations of each other, we can convert them to strings and check if the sorted versions of their characters are identical. For example, `sorted(str(1487))` is `['1', '4', '7', '8']`, which is the same as `sorted(str(4817))`.
+    - To check if two numbers are permutations of each other, we compare their digit signatures (`euler.digits.digit_signature`): the multiset of digits packed into one integer, equal exactly when the numbers are permutations of each other. The signature of every prime is computed once up front.
 
 3.  **Check for the Third Term**:
     - If we find such a pair `(p1, p2)` where `p2 > p1`, we can calculate the common difference `d = p2 - p1`.
@@ -32,15 +32,8 @@ We need to find a sequence of three 4-digit prime numbers that are permutations
 """
 import itertools
 
-def sieve(n):
-    """Generate a boolean list of primes up to n using Sieve of Eratosthenes."""
-    primes = [True] * (n + 1)
-    primes[0] = primes[1] = False
-    for i in range(2, int(n**0.5) + 1):
-        if primes[i]:
-            for multiple in range(i*i, n + 1, i):
-                primes[multiple] = False
-    return primes
+from euler.digits import digit_signature
+from euler.sieve import Sieve
 
 def solve():
     """
@@ -48,10 +41,11 @@ def solve():
     other 4-digit arithmetic sequence of prime permutations.
     """
     limit = 9999
-    is_prime = sieve(limit)
+    is_prime = Sieve(limit).is_prime
     
     # Get a list of all 4-digit primes
     primes_4_digit = [i for i in range(1000, limit + 1) if is_prime[i]]
+    signatures = {p: digit_signature(p) for p in primes_4_digit}
     
     for i in range(len(primes_4_digit)):
         p1 = primes_4_digit[i]
@@ -64,13 +58,13 @@ def solve():
             p2 = primes_4_digit[j]
             
             # Check if p1 and p2 are permutations of each other
-            if sorted(str(p1)) == sorted(str(p2)):
+            if signatures[p1] == signatures[p2]:
                 # Calculate the potential third term
                 diff = p2 - p1
                 p3 = p2 + diff
                 
                 # Check if p3 is a 4-digit prime and a permutation of p1
-                if p3 < 10000 and is_prime[p3] and sorted(str(p1)) == sorted(str(p3)):
+                if p3 < 10000 and is_prime[p3] and signatures[p1] == signatures[p3]:
                     return str(p1) + str(p2) + str(p3)
 
     return "Sequence not found."
@@ -25,22 +25,18 @@ We need to find the prime number below one million that is the sum of the longes
     - Check if the sum is less than one million and if the sum is a prime number.
     - Because we are iterating from the longest length downwards, the very first valid sum we find will be the answer.
 """
+from euler.prime_table import cached_sieve
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the prime below one million that can be written as the sum of the most consecutive primes.
     """
-    limit = 1_000_000
     
     # Step 1: Sieve of Eratosthenes
-    is_prime = [True] * limit
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(limit**0.5) + 1):
-        if is_prime[i]:
-            for multiple in range(i*i, limit, i):
-                is_prime[multiple] = False
+    sieve = cached_sieve(limit - 1)
+    is_prime = sieve.is_prime
     
-    primes = [i for i, p in enumerate(is_prime) if p]
+    primes = sieve.primes()
     
     # Step 2: Cumulative sum of primes
     prime_sum = [0] * (len(primes) + 1)
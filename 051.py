@@ -35,23 +35,14 @@ The most direct approach is to iterate through primes in increasing order and, f
 """
 import itertools
 
-def sieve(n):
-    """Generate a boolean list of primes up to n using Sieve of Eratosthenes."""
-    primes = [True] * (n + 1)
-    primes[0] = primes[1] = False
-    for i in range(2, int(n**0.5) + 1):
-        if primes[i]:
-            for multiple in range(i*i, n + 1, i):
-                primes[multiple] = False
-    return primes
+from euler.prime_table import cached_sieve
 
-def solve():
+def solve(family_size=8, limit=1000000):
     """
     Finds the smallest prime which, by replacing part of the number,
     is part of an eight prime value family.
     """
-    limit = 1_000_000
-    is_prime = sieve(limit)
+    is_prime = cached_sieve(limit).is_prime
     
     for p in range(11, limit): # Start from 11, as single digits don't apply
         if not is_prime[p]:
@@ -84,7 +75,7 @@ def solve():
                 if is_prime[new_n]:
                     family_count += 1
             
-            if family_count == 8:
+            if family_count == family_size:
                 return p
 
     return "Not found within the limit."
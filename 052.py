@@ -11,32 +11,33 @@ We are looking for the smallest positive integer `x` that satisfies the conditio
 
 1.  **Search Strategy**: We will iterate through integers `x` starting from 1. The first number that satisfies the conditions will be the smallest, and thus our answer.
 
-2.  **Permutation Check**: The core of the problem is to check if two numbers "contain the same digits". An easy and reliable way to do this is to convert both numbers to strings, sort the characters of the strings, and check if the sorted versions are identical. For example, `sorted("125874")` is the same as `sorted("251748")`.
+2.  **Permutation Check**: The core of the problem is to check if two numbers "contain the same digits". We compare digit signatures (`euler.digits.digit_signature`): the multiset of a number's digits packed into one integer, so `digit_signature(125874) == digit_signature(251748)`. Computing one is cheaper than building and sorting a list of characters.
 
 3.  **Algorithm**:
     a.  Start a loop with `x = 1`.
-    b.  For each `x`, first get the "canonical" representation of its digits by creating a sorted list of its digit characters: `digits_x = sorted(str(x))`.
+    b.  For each `x`, first get the "canonical" representation of its digits: `digits_x = digit_signature(x)`.
     c.  Then, check each of the multiples `2x, 3x, 4x, 5x, 6x`.
-    d.  For each multiple `m`, calculate its sorted digits: `digits_m = sorted(str(m))`.
+    d.  For each multiple `m`, calculate its signature: `digits_m = digit_signature(m)`.
     e.  Compare `digits_m` with `digits_x`. If they are not the same at any point, then this `x` is not the solution. We break the check for the current `x` and move to `x + 1`.
     f.  If `x` passes the check for all multiples from 2x to 6x, we have found our answer. We can then terminate the search and return `x`.
 
 4.  **Optimization**: For `6x` to have the same number of digits as `x`, `x` must start with the digit '1'. For example, if `x` is 200, `6x` is 1200, which has more digits. This means we don't need to check every integer, but a simple incremental search is fast enough to find the solution quickly.
 """
+from euler.digits import digit_signature
 
-def solve():
+def solve(multiples=6):
     """
     Finds the smallest positive integer, x, such that 2x, 3x, 4x, 5x, and 6x, contain the same digits.
     """
     x = 1
     while True:
-        digits_x = sorted(str(x))
+        digits_x = digit_signature(x)
         
         # Check multiples from 2x to 6x
         is_solution = True
-        for i in range(2, 7):
+        for i in range(2, multiples + 1):
             multiple = x * i
-            if sorted(str(multiple)) != digits_x:
+            if digit_signature(multiple) != digits_x:
                 is_solution = False
                 break
         
@@ -37,14 +37,13 @@ We need to calculate `C(n, r)` for `1 <= n <= 100` and `1 <= r <= n` and count h
     - We can modify the algorithm: For each `n`, loop `r` from 1 up to `n/2`. If we find an `r` where `C(n, r) > 1,000,000`, we know that all values from `r` up to `n-r` will also exceed the limit. The number of such values is `(n - r) - r + 1 = n - 2r + 1`. We can add this number to our total count and break the inner loop for the current `n`, moving to `n+1`.
 """
 
-def solve():
+def solve(n_max=100, limit=1000000):
     """
     Counts how many values of C(n, r) for 1 <= n <= 100 are greater than one-million.
     """
-    limit = 1_000_000
     count = 0
     
-    for n in range(1, 101):
+    for n in range(1, n_max + 1):
         # We can use the iterative formula C(n, r) = C(n, r-1) * (n - r + 1) / r
         # C(n, 0) is 1
         c_n_r = 1
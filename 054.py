@@ -39,6 +39,7 @@ The core of the problem is to create a robust function that can evaluate a 5-car
     - It compares the resulting rank tuples. If Player 1's rank tuple is greater than Player 2's, a counter is incremented.
     - The final count is the answer.
 """
+from euler.documents import lines
 
 def get_hand_rank(hand):
     """
@@ -109,8 +110,7 @@ def solve():
     Reads poker hands from a file, evaluates them, and counts Player 1's wins.
     """
     try:
-        with open('resources/documents/0054_poker.txt', 'r') as f:
-            hands_data = f.readlines()
+        hands_data = lines("0054_poker.txt")
     except FileNotFoundError:
         return "Error: poker.txt not found. Please make sure the file is in 'resources/documents/'."
 
@@ -118,7 +118,7 @@ def solve():
     p1_wins = 0
 
     for line in hands_data:
-        cards = line.strip().split(' ')
+        cards = line.split(' ')
         p1_hand_str = cards[:5]
         p2_hand_str = cards[5:]
         
@@ -12,7 +12,7 @@ How many Lychrel numbers are there below ten-thousand?
 Solution Idea:
 We need to check every number from 1 to 9999 to see if it's a Lychrel number according to the problem's definition.
 
-1.  **Palindrome Check**: We need a helper function to check if a number is a palindrome. The easiest way is to convert the number to a string and check if the string is equal to its reverse.
+1.  **Palindrome Check**: `euler.digits` provides `is_palindrome` and `reverse_digits`. Small numbers are reversed with lookup tables four digits at a time; the long numbers the process produces are reversed through a string.
 
 2.  **Lychrel Check Function**: We will create a function, say `is_lychrel(n)`, that takes a number `n` and determines if it's a Lychrel number.
     - This function will perform the "reverse and add" process for a maximum of 50 iterations.
@@ -32,10 +32,7 @@ We need to check every number from 1 to 9999 to see if it's a Lychrel number acc
 
 4.  **Final Result**: The final value of the counter will be the answer.
 """
-
-def is_palindrome(n):
-    """Checks if a number is a palindrome."""
-    return str(n) == str(n)[::-1]
+from euler.digits import is_palindrome, reverse_digits
 
 def is_lychrel(n):
     """
@@ -43,7 +40,7 @@ def is_lychrel(n):
     """
     current_num = n
     for _ in range(50):
-        reversed_num = int(str(current_num)[::-1])
+        reversed_num = reverse_digits(current_num)
         current_num += reversed_num
         if is_palindrome(current_num):
             return False # It's not a Lychrel number
@@ -51,12 +48,12 @@ def is_lychrel(n):
     # If we reach here after 50 iterations, it's considered a Lychrel number for this problem.
     return True
 
-def solve():
+def solve(limit=10000):
     """
     Counts the number of Lychrel numbers below ten-thousand.
     """
     lychrel_count = 0
-    for i in range(1, 10000):
+    for i in range(1, limit):
         if is_lychrel(i):
             lychrel_count += 1
             
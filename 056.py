@@ -13,10 +13,7 @@ We need to check all possible combinations of a and b within the given range and
 
 2.  **Handling Large Numbers**: The numbers `a^b` can become very large (e.g., 99^99). Python's built-in support for arbitrary-precision integers handles this automatically, so we don't need to worry about overflow.
 
-3.  **Calculating Digital Sum**: For each calculated number `a^b`, we need to find the sum of its digits. The most straightforward way to do this is:
-    a. Convert the large integer to a string.
-    b. Iterate through each character in the string.
-    c. Convert each character back to an integer and add it to a running total.
+3.  **Calculating Digital Sum**: For each calculated number `a^b`, we need to find the sum of its digits. `euler.digits.digit_sum` converts the number to a string once and counts how often each digit character occurs, which is faster than converting every character back to an integer.
 
 4.  **Algorithm**:
     a. Initialize a variable `max_digital_sum` to 0.
@@ -26,20 +23,21 @@ We need to check all possible combinations of a and b within the given range and
     e. Compare `current_digital_sum` with `max_digital_sum`. If it's larger, update `max_digital_sum`.
     f. After the loops complete, `max_digital_sum` will hold the final answer.
 """
+from euler.digits import digit_sum
 
-def solve():
+def solve(limit=100):
     """
     Finds the maximum digital sum for numbers of the form a^b, where a, b < 100.
     """
     max_digital_sum = 0
     
     # a and b are less than 100, so they go from 1 to 99.
-    for a in range(1, 100):
-        for b in range(1, 100):
+    for a in range(1, limit):
+        for b in range(1, limit):
             power = a**b
             
             # Calculate the digital sum
-            current_digital_sum = sum(int(digit) for digit in str(power))
+            current_digital_sum = digit_sum(power)
             
             if current_digital_sum > max_digital_sum:
                 max_digital_sum = current_digital_sum
@@ -38,7 +38,7 @@ Algorithm:
 8. The final value of the counter is the answer.
 """
 
-def solve():
+def solve(expansions=1000):
     """
     Calculates how many of the first 1000 expansions of sqrt(2)
     have a numerator with more digits than the denominator.
@@ -49,7 +49,7 @@ def solve():
     count = 0
     
     # We already have the first expansion, so we loop 999 times for the rest.
-    for _ in range(999):
+    for _ in range(expansions - 1):
         # Calculate the next term using the recurrence relation
         # N_k = N_{k-1} + 2*D_{k-1}
         # D_k = N_{k-1} + D_{k-1}
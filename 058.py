@@ -15,7 +15,7 @@ We don't need to build the actual spiral. We can find a pattern for the numbers
     - Layer 2 (5x5 spiral, side length `s=5`, step `d=4`): Corners are 13, 17, 21, 25.
     - Layer k (side length `s = 2k+1`, step `d = 2k`): The four corners are generated by adding the step `d` four times to the previous corner.
 
-2.  **Primality Test**: We will be checking large numbers for primality. A standard `is_prime` function that checks for divisibility up to the square root of the number will be needed. Since the numbers can get large, a sieve is not practical for the entire range, so we'll test them one by one.
+2.  **Primality Test**: We will be checking large numbers for primality. Since the numbers can get large (close to 10^9), a sieve is not practical for the entire range, and trial division up to the square root is slow. We use the deterministic Miller-Rabin test from `euler.primality` instead, and its batch form `are_prime` to test the four new corners of each layer together.
 
 3.  **Algorithm**:
     a.  Initialize variables:
@@ -28,27 +28,14 @@ We don't need to build the actual spiral. We can find a pattern for the numbers
         - Increment `side_length` by 2.
         - The step size for this layer is `side_length - 1`.
         - Generate the four new corner numbers by adding the step size to `current_number` four times.
-        - For each of the four new corners, check if it's prime using our `is_prime` function. If it is, increment `prime_count`.
+        - For each of the four new corners, check if it's prime (in one `are_prime` batch). If it is, increment `prime_count`.
     d.  Update the total number of diagonal elements: `total_diagonal_numbers += 4`.
     e.  Calculate the current ratio: `ratio = prime_count / total_diagonal_numbers`.
     f.  Check if `ratio < 0.10`. If it is, we have found our answer. The side length at this point is the solution.
 """
-import math
+from euler.primality import are_prime
 
-def is_prime(n):
-    """
-    Checks if a number is prime. Optimized for speed.
-    """
-    if n < 2: return False
-    if n == 2 or n == 3: return True
-    if n % 2 == 0 or n % 3 == 0: return False
-    # Check divisibility for numbers of the form 6k +/- 1
-    for i in range(5, int(math.sqrt(n)) + 1, 6):
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-    return True
-
-def solve():
+def solve(threshold=0.10):
     """
     Finds the side length of the square spiral for which the ratio of primes
     along both diagonals first falls below 10%.
@@ -62,17 +49,16 @@ def solve():
         side_length += 2
         step = side_length - 1
         
-        # Generate and check the four corners of the new layer
-        for _ in range(4):
-            current_number += step
-            if is_prime(current_number):
-                prime_count += 1
+        # Generate the four corners of the new layer and test them as a batch
+        corners = [current_number + step * k for k in range(1, 5)]
+        current_number = corners[-1]
+        prime_count += sum(are_prime(corners))
         
         total_diagonal_numbers += 4
         
         ratio = prime_count / total_diagonal_numbers
         
-        if ratio < 0.10:
+        if ratio < threshold:
             return side_length
 
 if __name__ == "__main__":
@@ -29,13 +29,14 @@ The key is a repeating sequence of three lowercase letters. This means the first
 """
 import itertools
 
+from euler.documents import int_rows
+
 def solve():
     """
     Decrypts the message in 0059_cipher.txt and finds the sum of the ASCII values.
     """
     try:
-        with open('resources/documents/0059_cipher.txt', 'r') as f:
-            cipher_text = [int(c) for c in f.read().strip().split(',')]
+        cipher_text = int_rows("0059_cipher.txt")[0]
     except FileNotFoundError:
         return "Error: 0059_cipher.txt not found. Please ensure it's in the 'resources/documents/' directory."
 
@@ -11,7 +11,7 @@ This is a search problem for a special set of five primes. A brute-force check o
 
 1.  **Primality Testing**: We need two forms of primality testing:
     a.  A **Sieve of Eratosthenes** to efficiently generate a list of primes up to a certain limit (e.g., 10,000). These will be the candidates for our set.
-    b.  A standard `is_prime` function to test the large numbers created by concatenation. Memoization (caching results) is crucial here to avoid re-testing the same large numbers.
+    b.  The deterministic Miller-Rabin `is_prime` from `euler.primality` to test the large numbers (up to 8 digits) created by concatenation. Small values are answered from its sieve table.
 
 2.  **Pair Compatibility Check**: We'll create a helper function `check_pair(p1, p2)` that takes two primes and checks if concatenating them in both orders (`p1p2` and `p2p1`) results in two new prime numbers. This check will also be memoized to avoid redundant calculations.
 
@@ -27,34 +27,12 @@ This is a search problem for a special set of five primes. A brute-force check o
     - The prime `2` can be excluded because any number ending in 2 (from concatenation) will be even and thus not prime.
     - The prime `5` can be excluded because any number ending in 5 (from concatenation) will be divisible by 5.
 """
-import math
+from euler.primality import is_prime
+from euler.sieve import Sieve
 
-# Memoization caches for performance
-prime_cache = {}
+# Memoization cache for performance
 pair_cache = {}
 
-def is_prime(n):
-    """
-    A standard primality test with memoization.
-    """
-    if n in prime_cache:
-        return prime_cache[n]
-    if n < 2:
-        prime_cache[n] = False
-        return False
-    if n == 2 or n == 3:
-        prime_cache[n] = True
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        prime_cache[n] = False
-        return False
-    for i in range(5, int(math.sqrt(n)) + 1, 6):
-        if n % i == 0 or n % (i + 2) == 0:
-            prime_cache[n] = False
-            return False
-    prime_cache[n] = True
-    return True
-
 def check_pair(p1, p2):
     """
     Checks if two primes form a compatible pair, with memoization.
@@ -70,11 +48,11 @@ def check_pair(p1, p2):
     pair_cache[(p1, p2)] = True
     return True
 
-def find_set(current_set, candidate_primes):
+def find_set(current_set, candidate_primes, size=5):
     """
     Recursively searches for a set of 5 compatible primes.
     """
-    if len(current_set) == 5:
+    if len(current_set) == size:
         return sum(current_set)
 
     # Pruning: if the current sum is already larger than a known solution, stop.
@@ -90,32 +68,23 @@ def find_set(current_set, candidate_primes):
             # The next candidates must be larger than the current one
             new_candidates = candidate_primes[i+1:]
             
-            result = find_set(new_set, new_candidates)
+            result = find_set(new_set, new_candidates, size)
             if result is not None:
                 return result
                 
     return None
 
-def solve():
+def solve(size=5, limit=10000):
     """
     Finds the lowest sum for a set of five primes with the concatenation property.
     """
     # Sieve to generate initial primes. A limit of 10000 is a good starting point.
-    limit = 10000
-    sieve = [True] * limit
-    for i in range(3, int(limit**0.5) + 1, 2):
-        if sieve[i]:
-            for j in range(i*i, limit, 2*i):
-                sieve[j] = False
+    sieve = Sieve(limit - 1)
     
     # Candidate primes, excluding 2 and 5
-    primes = [3] + [i for i in range(7, limit, 2) if sieve[i]]
-    
-    # Pre-populate the prime cache from the sieve for faster lookups
-    for i in range(limit):
-        prime_cache[i] = sieve[i]
+    primes = [p for p in sieve.primes() if p != 2 and p != 5]
 
-    return find_set([], primes)
+    return find_set([], primes, size)
 
 if __name__ == "__main__":
     print(solve())
@@ -9,11 +9,11 @@ This problem can be modeled as finding a specific cycle in a directed graph. The
 
 1.  **Generate Polygonal Numbers**:
     - First, we need to generate all 4-digit numbers (1000-9999) for each of the six polygonal types (Triangle, Square, ..., Octagonal).
-    - We can store these numbers in a data structure, for example, a dictionary where keys are the polygonal type (3 to 8) and values are lists of the corresponding 4-digit numbers.
+    - `euler.figurate.prefix_index(p_type, 4)` enumerates the 4-digit numbers of each type directly from the index range, without testing every `n`.
 
 2.  **Structure for Efficient Search**:
     - To make the search for the next number in a cycle efficient, it's helpful to group the generated numbers by their first two digits.
-    - We can create a dictionary where keys are the polygonal types, and the values are another dictionary mapping a 2-digit prefix (e.g., '81') to a list of numbers of that type starting with that prefix (e.g., `[8128]`).
+    - We can create a dictionary where keys are the polygonal types, and the values are another dictionary mapping a 2-digit prefix (e.g., 81) to a list of numbers of that type starting with that prefix (e.g., `[8128]`). The prefix of `x` is `x // 100` and its suffix `x % 100`, so no strings are needed.
 
 3.  **Depth-First Search (DFS)**:
     - A recursive depth-first search is a natural fit for this problem. We will try to build the cycle step by step.
@@ -28,57 +28,38 @@ This problem can be modeled as finding a specific cycle in a directed graph. The
     - At this point, we must check if the last number is cyclic with the first number. If it is, we have found the unique solution.
     - Since the problem guarantees a unique solution, the first complete cycle we find will be the answer. We can then stop the search and sum the numbers in the cycle.
 """
-import collections
+from euler.figurate import prefix_index
 
 def generate_polygonal_numbers():
     """
-    Generates all 4-digit polygonal numbers for types 3 through 8.
+    Indexes the 4-digit polygonal numbers for types 3 through 8 by their
+    first two digits.
     """
-    polygonal_map = collections.defaultdict(list)
-    
-    formulas = {
-        3: lambda n: n * (n + 1) // 2,
-        4: lambda n: n * n,
-        5: lambda n: n * (3 * n - 1) // 2,
-        6: lambda n: n * (2 * n - 1),
-        7: lambda n: n * (5 * n - 3) // 2,
-        8: lambda n: n * (3 * n - 2),
-    }
-    
-    for p_type, formula in formulas.items():
-        n = 1
-        while True:
-            num = formula(n)
-            if num >= 10000:
-                break
-            if num >= 1000:
-                polygonal_map[p_type].append(num)
-            n += 1
-    return polygonal_map
+    return {p_type: prefix_index(p_type, 4) for p_type in range(3, 9)}
 
 def find_cycle(chain, used_types, polygonal_numbers, all_types):
     """
     Recursively searches for the 6-number cyclic set.
     """
+    last_num_suffix = chain[-1] % 100
+
     # Base case: if we have a chain of 6, check if it's a valid cycle
     if len(chain) == 6:
-        if str(chain[-1])[2:] == str(chain[0])[:2]:
+        if last_num_suffix == chain[0] // 100:
             return chain
         else:
             return None
 
-    last_num_suffix = str(chain[-1])[2:]
     available_types = all_types - used_types
     
     for p_type in available_types:
-        for num in polygonal_numbers[p_type]:
-            if str(num).startswith(last_num_suffix):
-                new_chain = chain + [num]
-                new_used_types = used_types | {p_type}
-                
-                result = find_cycle(new_chain, new_used_types, polygonal_numbers, all_types)
-                if result:
-                    return result
+        for num in polygonal_numbers[p_type].get(last_num_suffix, ()):
+            new_chain = chain + [num]
+            new_used_types = used_types | {p_type}
+            
+            result = find_cycle(new_chain, new_used_types, polygonal_numbers, all_types)
+            if result:
+                return result
     return None
 
 def solve():
@@ -92,7 +73,7 @@ def solve():
     # Start the search with the octagonal numbers (P8), as it's the smallest set.
     p8_numbers = polygonal_numbers[8]
     
-    for start_num in p8_numbers:
+    for start_num in (num for group in p8_numbers.values() for num in group):
         chain = [start_num]
         used_types = {8}
         
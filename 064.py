@@ -30,6 +30,7 @@ The general form of the fraction at each step is `(sqrt(N) + m) / d`.
     - The sequence of `a_i` (for `i > 0`) is the repeating part.
     - The period ends when the state `(m, d, a)` repeats. The sequence of `a_i` is guaranteed to be periodic. The period length is the number of steps it takes for the state to return to the initial state of the periodic part.
     - We can store the states `(m, d, a)` we have seen in a set or list. When we encounter a state that we've seen before, the cycle is complete, and the number of steps taken is the period length.
+    - `euler.continued_fraction` stops even earlier: the `(m, d)` pairs of a period form a palindrome, so the period length is known as soon as `m` or `d` repeats, halfway through. `period_lengths(limit)` computes it for every `N` at once.
 
 4.  **Main Algorithm**:
     a.  Initialize `odd_period_count = 0`.
@@ -39,41 +40,16 @@ The general form of the fraction at each step is `(sqrt(N) + m) / d`.
     e.  If the period length is odd, increment `odd_period_count`.
     f.  The final count is the answer.
 """
-import math
+from euler.continued_fraction import period_lengths
 
-def get_period_length(n):
-    """
-    Calculates the period length of the continued fraction of sqrt(n).
-    """
-    # Skip perfect squares
-    if int(math.sqrt(n))**2 == n:
-        return 0
-        
-    m = 0
-    d = 1
-    a0 = int(math.sqrt(n))
-    a = a0
-    
-    period = 0
-    
-    # The period ends when a is 2*a0
-    while a != 2 * a0:
-        m = d * a - m
-        d = (n - m * m) // d
-        a = (a0 + m) // d
-        period += 1
-        
-    return period
-
-def solve():
+def solve(limit=10000):
     """
     Counts how many continued fractions for N <= 10000 have an odd period.
     """
     odd_period_count = 0
-    limit = 10000
     
-    for n in range(2, limit + 1):
-        period = get_period_length(n)
+    # Entry n is the period length of sqrt(n); perfect squares have period 0.
+    for period in period_lengths(limit):
         if period % 2 != 0:
             odd_period_count += 1
             
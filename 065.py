@@ -11,7 +11,7 @@ We need to calculate the 100th convergent fraction, which will have a very large
 1.  **Generate the Sequence of Terms**: First, we need to generate the sequence of terms `a_0, a_1, a_2, ...` for the continued fraction of `e`.
     - `a_0` is 2.
     - The repeating pattern for `a_i` (where `i >= 1`) is `1, 2k, 1`.
-    - We can generate a list of the first 100 terms (`a_0` to `a_99`) based on this pattern.
+    - `euler.continued_fraction.e_terms()` yields the terms in this pattern, as many as needed.
 
 2.  **Calculate the Convergent**: A continued fraction `[a_0; a_1, a_2, ..., a_n]` can be calculated iteratively from the inside out.
     - Let the n-th convergent be `N_n / D_n`.
@@ -37,47 +37,21 @@ We need to calculate the 100th convergent fraction, which will have a very large
     f.  After the loop, `n_curr` will hold the numerator of the 100th convergent.
     g.  Calculate the sum of the digits of this final numerator.
 
-4.  **Digital Sum**: To get the sum of the digits, we convert the final large numerator to a string and sum the integer value of each character.
+4.  **Digital Sum**: The sum of the digits of the final numerator comes from `euler.digits.digit_sum`.
 """
+from euler.continued_fraction import e_terms, nth_convergent
+from euler.digits import digit_sum
 
-def solve():
+def solve(n=100):
     """
     Finds the sum of digits in the numerator of the 100th convergent of e.
     """
-    # Step 1: Generate the sequence of terms for e's continued fraction
-    # We need 100 terms for the 100th convergent (a_0 to a_99)
-    terms = [2]
-    k = 1
-    while len(terms) < 100:
-        terms.extend([1, 2 * k, 1])
-        k += 1
-    # Ensure we only have 100 terms
-    terms = terms[:100]
-
-    # Step 2: Calculate the numerator of the 100th convergent
-    # We work backwards from the 99th term (the 100th term in the sequence)
-    # The last fraction is 1 / a_99
-    num = 1
-    den = terms[99]
-    
-    # Loop backwards from a_98 down to a_0
-    for i in range(98, -1, -1):
-        # The new fraction is a_i + (num / den)
-        # which is (a_i * den + num) / den
-        # We then take the reciprocal for the next step
-        new_num = terms[i] * den + num
-        new_den = den
-        
-        # The new num/den for the next iteration is the reciprocal of this
-        num = new_den
-        den = new_num
-        
-    # After the loop, the final fraction is den/num (since we did one last flip)
-    # The numerator of the final convergent is den.
-    final_numerator = den
+    # Steps 1 and 2: the numerator of the 100th convergent, built forwards
+    # from the terms a_0 .. a_99 of e's continued fraction
+    final_numerator, _ = nth_convergent(e_terms(), n)
     
     # Step 3: Calculate the sum of the digits
-    return sum(int(digit) for digit in str(final_numerator))
+    return digit_sum(final_numerator)
 
 if __name__ == "__main__":
     print(solve())
@@ -28,56 +28,28 @@ The minimal solutions to Pell's equation, `x^2 - Dy^2 = 1`, are closely related
     a.  Initialize `max_x = 0` and `result_D = 0`.
     b.  Loop `D` from 2 to 1000.
     c.  If `D` is a perfect square, skip it.
-    d.  For each `D`, we will find the minimal solution `x`.
-        i.  Initialize the state for the continued fraction generation: `m=0, d=1, a0=floor(sqrt(D))`.
-        ii. Initialize the convergents: `h_prev=1, k_prev=0`, `h_curr=a0, k_curr=1`.
-        iii.Check if the first convergent is a solution: `h_curr^2 - D * k_curr^2 == 1`.
-        iv. If not, enter a loop to generate subsequent terms `a_i` and convergents until a solution is found.
+    d.  For each `D`, we will find the minimal solution `x` with `euler.pell.fundamental_solution(D)`, which only walks half the period of `sqrt(D)`.
     e.  Once the minimal `x` for `D` is found, compare it with `max_x`. If it's larger, update `max_x` and set `result_D = D`.
     f.  The final `result_D` is the answer.
 """
 import math
 
-def solve():
+from euler.pell import fundamental_solution
+
+def solve(limit=1000):
     """
     Finds the value of D <= 1000 for which the largest minimal x is obtained.
     """
     max_x = 0
     result_D = 0
     
-    for D in range(2, 1001):
+    for D in range(2, limit + 1):
         # Skip perfect squares
-        limit = int(math.sqrt(D))
-        if limit * limit == D:
+        root = math.isqrt(D)
+        if root * root == D:
             continue
             
-        # Initialize continued fraction state
-        m = 0
-        d = 1
-        a0 = limit
-        a = a0
-        
-        # Initialize convergents
-        h_prev = 1
-        h_curr = a0
-        k_prev = 0
-        k_curr = 1
-        
-        # Loop until we find a solution to Pell's equation
-        while h_curr*h_curr - D * k_curr*k_curr != 1:
-            # Calculate next term in continued fraction
-            m = d * a - m
-            d = (D - m * m) // d
-            a = (a0 + m) // d
-            
-            # Calculate next convergent
-            h_next = a * h_curr + h_prev
-            k_next = a * k_curr + k_prev
-            
-            h_prev, h_curr = h_curr, h_next
-            k_prev, k_curr = k_curr, k_next
-            
-        x = h_curr
+        x, _ = fundamental_solution(D)
         
         if x > max_x:
             max_x = x
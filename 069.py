@@ -31,21 +31,15 @@ We need to find the number `n` that maximizes the ratio `n / phi(n)`.
     d.  If the new `n` is still within the limit of 1,000,000, continue.
     e.  If the new `n` exceeds the limit, then the previous value of `n` is our answer.
 """
+from euler.sieve import primes_up_to
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the value of n <= 1,000,000 for which n/phi(n) is a maximum.
     """
-    limit = 1_000_000
     
     # We need a way to get primes in order
-    primes = []
-    is_prime = [True] * 100 # A small sieve is enough to get the first few primes
-    for p in range(2, 100):
-        if is_prime[p]:
-            primes.append(p)
-            for i in range(p * p, 100, p):
-                is_prime[i] = False
+    primes = primes_up_to(100) # A small sieve is enough to get the first few primes
 
     result = 1
     for p in primes:
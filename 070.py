@@ -22,7 +22,7 @@ We need to find `n` in the range `(1, 10^7)` that minimizes `n/phi(n)` while `ph
     We need to find prime factors. A Sieve of Eratosthenes is the most efficient way to generate primes. Since `n = p1 * p2` and `n < 10^7`, the primes `p1` and `p2` will be roughly around `sqrt(10^7)`, which is about 3162. We can generate primes up to a slightly larger value, say 4000, to be safe.
 
 3.  **Permutation Check**:
-    A simple way to check if two numbers are permutations of each other is to convert them to strings, sort the characters, and see if the sorted strings are equal.
+    Two numbers are permutations of each other exactly when their digit signatures (`euler.digits.digit_signature`, the multiset of digits packed into one integer) are equal.
 
 4.  **Algorithm**:
     a.  Generate all primes up to a reasonable limit (e.g., 4000) using a sieve.
@@ -36,31 +36,20 @@ We need to find `n` in the range `(1, 10^7)` that minimizes `n/phi(n)` while `ph
     i.  If this ratio is smaller than `min_ratio`, update `min_ratio` and `result_n`.
     j.  The final `result_n` will be the answer.
 """
-
-def sieve(n):
-    """Generate a boolean list of primes up to n."""
-    primes = [True] * (n + 1)
-    primes[0] = primes[1] = False
-    for i in range(2, int(n**0.5) + 1):
-        if primes[i]:
-            for multiple in range(i*i, n + 1, i):
-                primes[multiple] = False
-    return primes
+from euler.digits import digit_signature
+from euler.sieve import Sieve
 
 def are_permutations(n1, n2):
     """Check if two numbers are permutations of each other."""
-    return sorted(str(n1)) == sorted(str(n2))
+    return digit_signature(n1) == digit_signature(n2)
 
-def solve():
+def solve(limit=10000000, prime_limit=4000):
     """
     Finds the value of n for which phi(n) is a permutation of n and n/phi(n) is a minimum.
     """
-    limit = 10_000_000
     # Primes around sqrt(limit) = 3162. We can search a bit wider.
-    prime_limit = 4000
     
-    prime_bools = sieve(prime_limit)
-    primes = [i for i, is_p in enumerate(prime_bools) if is_p]
+    primes = Sieve(prime_limit).primes()
     
     min_ratio = float('inf')
     result_n = 0
@@ -38,7 +38,7 @@ We are looking for a reduced proper fraction `n/d` that is as close as possible
 7.  **The Answer**: The fraction is `428,570 / 999,997`. The problem asks for the numerator.
 """
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the numerator of the fraction immediately to the left of 3/7
     in the sorted list of reduced proper fractions for d <= 1,000,000.
@@ -46,14 +46,9 @@ def solve():
     # We want to solve 3*d - 7*n = 1 for the largest d <= 1,000,000.
     # This is equivalent to finding the largest d where d === 5 (mod 7).
     
-    limit = 1_000_000
-    
-    # 1,000,000 % 7 is 1.
-    # To get to a number that is 5 mod 7, we subtract 3.
-    # (1,000,000 - 1) is divisible by 7.
-    # (1,000,000 - 2) % 7 = 6
-    # (1,000,000 - 3) % 7 = 5
-    d = limit - 3
+    # For the default limit, 1,000,000 % 7 is 1, so we subtract 3 to get to
+    # a number that is 5 mod 7: (1,000,000 - 3) % 7 = 5.
+    d = limit - (limit - 5) % 7
     
     # Now find the corresponding numerator n
     # 7n = 3d - 1
@@ -20,33 +20,25 @@ The problem asks for the total number of reduced proper fractions `n/d` where `d
     - A much more efficient method is to adapt the Sieve of Eratosthenes to calculate the `phi` values for all numbers up to the limit in one go.
 
 3.  **Sieve for Totients**:
-    a.  Create an array, `phi`, of size `limit + 1`, and initialize `phi[i] = i` for all `i`.
-    b.  Iterate through numbers `p` from 2 up to the limit.
-    c.  If `phi[p] == p`, it means `p` is a prime number.
-    d.  When a prime `p` is found, iterate through all of its multiples `j` (from `p` up to the limit, in steps of `p`).
-    e.  For each multiple `j`, update its `phi` value using the formula: `phi[j] = phi[j] * (1 - 1/p)`. This can be done with integer arithmetic as `phi[j] = phi[j] // p * (p - 1)`.
+    a.  We use the shared multiplicative-function sieve in `euler.multiplicative`.
+    b.  Every `n` is written as `n = p * m`, where `p` is the smallest prime factor of `n`.
+    c.  If `p` also divides `m`, then `phi(n) = phi(m) * p`; otherwise `phi(n) = phi(m) * (p - 1)`.
+    d.  Since `m < n`, one pass over `n` fills the whole `phi` table (a typed array).
 
 4.  **Final Summation**:
     - After the sieve has computed all the `phi` values up to 1,000,000, we simply sum the values in the `phi` array from index 2 to 1,000,000.
     - This sum will be the total count of the reduced proper fractions.
 """
+from euler.multiplicative import multiplicative_tables
 
-def solve():
+def solve(limit=1000000):
     """
     Counts the number of reduced proper fractions for d <= 1,000,000.
     This is equivalent to the sum of phi(d) for d from 2 to 1,000,000.
     """
-    limit = 1_000_000
     
-    # Initialize phi array where phi[i] = i
-    phi = list(range(limit + 1))
-    
-    # Sieve to calculate totients
-    for i in range(2, limit + 1):
-        if phi[i] == i: # i is a prime
-            # Update phi for all multiples of i
-            for j in range(i, limit + 1, i):
-                phi[j] -= phi[j] // i
+    # Totients of every number up to the limit, from the shared one-pass sieve
+    phi = multiplicative_tables(limit, ("phi",))["phi"]
                 
     # The total number of fractions is the sum of phi(d) for d from 2 to limit.
     # We can sum the whole array and subtract phi[0] and phi[1].
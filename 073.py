@@ -33,11 +33,10 @@ This problem asks us to count the number of reduced proper fractions `n/d` that
 """
 import math
 
-def solve():
+def solve(limit=12000):
     """
     Counts the number of reduced proper fractions between 1/3 and 1/2 for d <= 12,000.
     """
-    limit = 12000
     count = 0
     
     for d in range(1, limit + 1):
@@ -88,11 +88,10 @@ def get_chain_length(n):
         
     return chain_lengths[n]
 
-def solve():
+def solve(limit=1000000, chain_length=60):
     """
     Finds the number of digit factorial chains with exactly 60 non-repeating terms.
     """
-    limit = 1_000_000
     count_60 = 0
     
     # Pre-populate the known loops
@@ -110,7 +109,7 @@ def solve():
 
 
     for i in range(1, limit):
-        if get_chain_length(i) == 60:
+        if get_chain_length(i) == chain_length:
             count_60 += 1
             
     return count_60
@@ -22,39 +22,20 @@ The problem is to find how many perimeters `L` correspond to exactly one Pythago
     a.  We can create an array `counts` of size `1,500,001` to store the number of solutions for each perimeter length.
     b.  We first generate all *primitive* perimeters by setting `k=1`. We can do this by iterating through `m` and `n` under certain limits.
     c.  The perimeter `L = 2m(m + n)` must be `<= 1,500,000`. Since `n < m`, we have `L > 2m(m+m) = 4m^2`. This gives an upper bound for `m`: `m < sqrt(1,500,000 / 2)`, which is roughly 866.
-    d.  We iterate `m` from 2 up to this limit. For each `m`, we iterate `n` from 1 to `m-1`, ensuring `m` and `n` are coprime and one is even (which is equivalent to `(m-n)` being odd).
-    e.  For each primitive perimeter `p` found, we know that all its multiples (`p, 2p, 3p, ...`) are also valid perimeters. We can iterate through these multiples up to the limit and increment the count for each one in our `counts` array.
+    d.  Rather than testing every `(m, n)` for coprimality, `euler.pythagorean` walks the Berggren tree of primitive triples, which yields each primitive triple exactly once and can be pruned at the perimeter limit.
+    e.  For each primitive perimeter `p` found, we know that all its multiples (`p, 2p, 3p, ...`) are also valid perimeters, and we increment the count for each one in our `counts` array. `perimeter_counts(limit)` does both steps; with numpy it handles a limit of 10^8 in about 5 seconds.
 
 4.  **Final Count**: After the generation process is complete, we simply iterate through our `counts` array and count how many entries have a value of exactly 1.
 """
-import math
+from euler.pythagorean import perimeter_counts
 
-def solve():
+def solve(limit=1500000):
     """
     Finds the number of values of L <= 1,500,000 for which exactly one
     integer sided right angle triangle can be formed.
     """
-    limit = 1_500_000
-    perimeters = [0] * (limit + 1)
-    
-    # Determine the upper limit for m
-    m_limit = int((limit / 2)**0.5)
-    
-    for m in range(2, m_limit + 1):
-        for n in range(1, m):
-            # Conditions for a primitive triple: m, n are coprime and one is even
-            if (m - n) % 2 == 1 and math.gcd(m, n) == 1:
-                # Calculate the perimeter of the primitive triple
-                p = 2 * m * (m + n)
-                
-                # If the primitive perimeter is already over the limit,
-                # no need to check larger n for this m.
-                if p > limit:
-                    break
-                
-                # Increment the count for this primitive and all its multiples
-                for k in range(p, limit + 1, p):
-                    perimeters[k] += 1
+    # Number of right triangles for every perimeter up to the limit
+    perimeters = perimeter_counts(limit)
                     
     # Count how many perimeters have exactly one solution
     count = perimeters.count(1)
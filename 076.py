@@ -30,25 +30,18 @@ We can solve this using dynamic programming, treating it as a variation of the "
     c.  For each `i`, loop through all target sums `j` from `i` up to 100.
     d.  Update the `ways` array: `ways[j] = ways[j] + ways[j - i]`. This means the number of ways to make sum `j` is increased by the number of ways to make the sum `j - i` (to which we can now add the part `i`).
     e.  After the loops complete, `ways[100]` will hold the total number of ways to write 100 as a sum of integers less than 100. This is exactly the number of partitions into at least two parts.
+
+    `euler.partitions.count_ways(target, range(1, target))` runs this DP.
 """
+from euler.partitions import count_ways
 
-def solve():
+def solve(target=100):
     """
     Calculates the number of ways one hundred can be written as a sum of
     at least two positive integers.
     """
-    target = 100
-    
-    # ways[i] will store the number of ways to partition i
-    ways = [0] * (target + 1)
-    ways[0] = 1
-    
     # The parts of the sum can be any integer from 1 to 99.
-    for i in range(1, target):
-        for j in range(i, target + 1):
-            ways[j] += ways[j - i]
-            
-    return ways[target]
+    return count_ways(target, range(1, target))
 
 if __name__ == "__main__":
     print(solve())
@@ -27,51 +27,38 @@ This is a partition problem where the parts must be prime numbers. We can solve
         e.  `ways[j] = ways[j] + ways[j - prime]`.
 
 3.  **Search Strategy**:
-    - We can start with a target `n = 2` and check the number of ways.
-    - We can then increment `n` one by one, calculating the number of prime partitions for each `n` until we find one where the number of ways exceeds 5000.
-    - The first `n` that satisfies this condition will be our answer.
+    - One table for a limit `L` (`euler.partitions.ways_table(L, primes up to L)`) already holds the number of prime partitions of every `n <= L`, so there is no need to rebuild it for each `n`.
+    - We scan the table for the first `n` whose number of ways exceeds 5000.
+    - If there is none, we double `L` and try again.
 
 4.  **Algorithm**:
-    a.  Initialize `target = 10`.
+    a.  Initialize `limit = 64`.
     b.  Start a `while True` loop.
     c.  Inside the loop:
-        i.   Generate primes up to `target`.
-        ii.  Create a `ways` array of size `target + 1`.
-        iii. Calculate the number of prime partitions for all numbers up to `target` using the dynamic programming method.
-        iv.  Check if `ways[target]` is greater than 5000. If it is, we have found our answer, so return `target`.
-        v.   If not, increment `target` and continue the loop.
+        i.   Generate primes up to `limit`.
+        ii.  Calculate the number of prime partitions for all numbers up to `limit` with `ways_table`.
+        iii. Return the first `n` with `ways[n]` greater than 5000, if there is one.
+        iv.  If not, double `limit` and continue the loop.
 """
+from euler.partitions import ways_table
+from euler.sieve import primes_up_to
 
-def solve():
+def solve(ways_limit=5000):
     """
     Finds the first value which can be written as the sum of primes in over
     five thousand different ways.
     """
-    target = 10
+    limit = 64
     
     while True:
-        # Sieve to get primes up to the current target
-        primes = []
-        is_prime = [True] * (target + 1)
-        for p in range(2, target + 1):
-            if is_prime[p]:
-                primes.append(p)
-                for i in range(p * p, target + 1, p):
-                    is_prime[i] = False
+        # Prime partitions of every n up to the current limit
+        ways = ways_table(limit, primes_up_to(limit))
         
-        # DP to count partitions
-        ways = [0] * (target + 1)
-        ways[0] = 1
-        
-        for prime in primes:
-            for j in range(prime, target + 1):
-                ways[j] += ways[j - prime]
-                
-        # Check if the current target meets the condition
-        if ways[target] > 5000:
-            return target
+        for n in range(2, limit + 1):
+            if ways[n] > ways_limit:
+                return n
             
-        target += 1
+        limit *= 2
 
 if __name__ == "__main__":
     print(solve())
@@ -21,68 +21,28 @@ The numbers `k(3k-1)/2` and `k(3k+1)/2` are the generalized pentagonal numbers.
 2.  **Recurrence with Modulo**: We are looking for `p(n)` that is divisible by one million, which means `p(n) % 1,000,000 == 0`. We can apply the modulo operation at each step of the calculation to keep the numbers manageable. The recurrence relation holds true under modular arithmetic.
 
 3.  **Algorithm**:
-    a.  Set `mod = 1,000,000`.
-    b.  Create a list `partitions` to store the values of `p(i) % mod`. Initialize `partitions[0] = 1`.
-    c.  Start a loop for `n` from 1 upwards.
-    d.  Inside the loop, calculate `p(n)` using the recurrence relation and the previously computed values in the `partitions` list.
-        i.   Initialize `p_n = 0`.
-        ii.  Loop `k` from 1 upwards.
-        iii. Calculate the two generalized pentagonal numbers for `k`.
-        iv.  If these pentagonal numbers are greater than `n`, we can stop the inner loop.
-        v.   Add or subtract the corresponding `p(n - g_k)` terms to `p_n` based on the `(-1)^(k-1)` sign.
-        vi.  Remember to take the modulo at each step.
-    e.  Store the result: `partitions.append(p_n % mod)`.
-    f.  Check if `p_n % mod == 0`. If it is, then `n` is our answer.
+    a.  Set `mod = 1,000,000` and `limit = 2^14`.
+    b.  Compute `p(n) % mod` for every `n <= limit` with `euler.partitions.partition_numbers(limit, mod)`, which runs the recurrence over a precomputed table of the generalized pentagonal numbers and their signs (with numpy, a block of `n` at a time).
+    c.  The first `n >= 1` with `p(n) % mod == 0` is our answer.
+    d.  If there is none, double `limit` and repeat.
 """
+from euler.partitions import partition_numbers
 
-def solve():
+def solve(mod=1000000):
     """
     Finds the least value of n for which p(n) is divisible by one million.
     """
-    mod = 1_000_000
-    partitions = [1]
-    n = 0
+    limit = 1 << 14
     
     while True:
-        n += 1
-        p_n = 0
-        k = 1
-        
-        while True:
-            # Calculate generalized pentagonal numbers
-            pent1 = k * (3 * k - 1) // 2
-            pent2 = k * (3 * k + 1) // 2
-            
-            term1_val = 0
-            if n >= pent1:
-                term1_val = partitions[n - pent1]
-            
-            term2_val = 0
-            if n >= pent2:
-                term2_val = partitions[n - pent2]
-            
-            # The sum of terms for this k
-            total_term = term1_val + term2_val
-            
-            # Stop if we've gone past n
-            if total_term == 0:
-                break
-            
-            # Apply the sign based on k
-            if k % 2 == 1: # k is odd
-                p_n += total_term
-            else: # k is even
-                p_n -= total_term
-            
-            k += 1
-            
-        # Store the result modulo 1,000,000
-        p_n %= mod
-        partitions.append(p_n)
+        partitions = partition_numbers(limit, mod)
         
         # Check for the condition
-        if p_n == 0:
-            return n
+        for n in range(1, limit + 1):
+            if partitions[n] == 0:
+                return n
+        
+        limit *= 2
 
 if __name__ == "__main__":
     print(solve())
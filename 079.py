@@ -33,13 +33,14 @@ This problem can be modeled as finding a topological sort of a directed graph. T
 """
 import collections
 
+from euler.documents import lines
+
 def solve():
     """
     Determines the shortest possible secret passcode from the keylog file.
     """
     try:
-        with open('resources/documents/0079_keylog.txt', 'r') as f:
-            login_attempts = [line.strip() for line in f]
+        login_attempts = lines("0079_keylog.txt")
     except FileNotFoundError:
         return "Error: keylog.txt not found. Please ensure it's in 'resources/documents/'."
 
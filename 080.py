@@ -26,23 +26,24 @@ We need to calculate the first 100 decimal digits for the square root of each no
         ii.  Calculate the scaled target number: `target = n * (10**(2 * d))`.
         iii. Use `math.isqrt()` to find the integer square root of `target`.
         iv.  The result `sqrt_result` contains the integer part of `sqrt(n)` followed by the first 100 decimal digits.
-        v.   Convert `sqrt_result` to a string.
-        vi.  The first 100 digits of this string (after accounting for the integer part, which is always 1 or 2 digits for n<=100) are what we need. However, since the integer part's digits are not part of the sum, and the total number of digits in `sqrt_result` will be 101 (for n<100), we can simply sum the first 100 digits of the string representation of `sqrt_result`.
-        vii. Sum the integer values of these 100 digit characters and add this sum to `total_digital_sum`.
+        v.   Keep the first 100 digits of `sqrt_result`: divide it by 10 to the power of (its digit count - 100). The digit count comes from `euler.digits.num_digits`, which estimates it from a logarithm instead of converting the number to a string.
+        vi.  Add the digit sum of those 100 digits (`euler.digits.digit_sum`) to `total_digital_sum`. Neither step is limited by the length of `str()` of an int, so `num_digits` can be raised far beyond 100.
 
 4.  **Final Result**: The final `total_digital_sum` will be the answer.
 """
 import math
 
-def solve():
+from euler.digits import digit_sum
+from euler.digits import num_digits as digit_count
+
+def solve(limit=100, num_digits=100):
     """
     Finds the total of the digital sums of the first one hundred decimal digits
     for all irrational square roots of the first one hundred natural numbers.
     """
     total_digital_sum = 0
-    num_digits = 100
     
-    for n in range(1, 101):
+    for n in range(1, limit + 1):
         # Check if n is a perfect square
         root = math.isqrt(n)
         if root * root == n:
@@ -53,20 +54,15 @@ def solve():
         # Let's use a precision of 100 digits for the fractional part.
         # The integer part for sqrt(n<100) is at most 1 digit (for n<10) or 2 digits (for n<100).
         # So we need about 102 digits total. Let's use a higher precision to be safe.
-        precision = 105 
+        precision = num_digits + 5
         target_number = n * (10**(2 * precision))
         sqrt_result = math.isqrt(target_number)
         
         # The result contains the integer part + the fractional part.
-        # We only want the first 100 digits of the fractional part.
-        # The integer part has len(str(root)) digits.
-        s_sqrt_result = str(sqrt_result)
-        
-        # Sum the first 100 decimal digits
-        # The integer part is small, so we can just sum the first 100 digits of the result string.
-        # For n=2, isqrt(2*10^200) = 1414... (101 digits). Summing the first 100 gives the sum of the fractional part.
-        # For n=99, isqrt(99*10^200) = 9949... (101 digits). Summing the first 100 gives the sum of the fractional part.
-        current_sum = sum(int(digit) for digit in s_sqrt_result[:num_digits])
+        # Sum the first 100 decimal digits, counting from the integer part:
+        # for n=2, isqrt(2*10^210) = 1414... (106 digits) -> keep 1414...(100 digits).
+        leading_digits = sqrt_result // 10 ** (digit_count(sqrt_result) - num_digits)
+        current_sum = digit_sum(leading_digits)
         
         total_digital_sum += current_sum
         
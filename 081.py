@@ -21,36 +21,21 @@ This is a classic dynamic programming problem. A brute-force search of all possi
         - The first column: For each cell `matrix[i][0]` (for `i > 0`), the only way to reach it is from above. So, `matrix[i][0] += matrix[i-1][0]`.
     c.  Iterate through the rest of the matrix, starting from `(1, 1)`. For each cell `matrix[i][j]`, apply the recurrence relation: `matrix[i][j] += min(matrix[i-1][j], matrix[i][j-1])`.
     d.  After the loops are complete, the value in the bottom-right cell of the matrix will be the minimal path sum for the entire grid.
+
+`euler.path_sums.CostGrid.min_path_right_down` runs this DP. With numpy it fills a whole row at once: moving right only adds the cells passed, so with the prefix sums `S` of the row, `dp[i][j] = S[j] + min over k <= j of (dp[i-1][k] + matrix[i][k] - S[k])`, a running minimum.
 """
+from euler.path_sums import CostGrid
 
 def solve():
     """
     Finds the minimal path sum from the top left to the bottom right of the matrix.
     """
     try:
-        with open('resources/documents/0081_matrix.txt', 'r') as f:
-            matrix = [[int(n) for n in line.strip().split(',')] for line in f]
+        grid = CostGrid.from_document("0081_matrix.txt")
     except FileNotFoundError:
         return "Error: matrix.txt not found. Please ensure it's in 'resources/documents/'."
 
-    rows = len(matrix)
-    cols = len(matrix[0])
-
-    # Handle the first row (can only be reached from the left)
-    for j in range(1, cols):
-        matrix[0][j] += matrix[0][j-1]
-
-    # Handle the first column (can only be reached from above)
-    for i in range(1, rows):
-        matrix[i][0] += matrix[i-1][0]
-
-    # Fill in the rest of the matrix
-    for i in range(1, rows):
-        for j in range(1, cols):
-            matrix[i][j] += min(matrix[i-1][j], matrix[i][j-1])
-            
-    # The bottom-right element now contains the minimal path sum
-    return matrix[rows-1][cols-1]
+    return grid.min_path_right_down()
 
 if __name__ == "__main__":
     print(solve())
@@ -26,8 +26,10 @@ Dijkstra's algorithm is the perfect tool for this.
              - Update `distances[nr][nc] = new_dist`.
              - Push the neighbor onto the priority queue: `(new_dist, nr, nc)`.
     e.  The algorithm terminates when the priority queue is empty. The value in the bottom-right cell of our `distances` matrix (`distances[rows-1][cols-1]`) will be the minimal path sum.
+
+`euler.path_sums.CostGrid.min_path_four_way` runs Dijkstra over flat cell indices (`row * cols + col`), with the distances in one flat list, and stops as soon as the bottom-right cell is popped. Since the costs are small integers, the priority queue is a ring of buckets indexed by distance (Dial's algorithm) instead of a heap; `python -m benchmarks.path_bench` compares it with the heap above on larger generated matrices.
 """
-import heapq
+from euler.path_sums import CostGrid
 
 def solve():
     """
@@ -35,45 +37,11 @@ def solve():
     allowing movement in all four directions.
     """
     try:
-        with open('resources/documents/0083_matrix.txt', 'r') as f:
-            matrix = [[int(n) for n in line.strip().split(',')] for line in f]
+        grid = CostGrid.from_document("0083_matrix.txt")
     except FileNotFoundError:
         return "Error: matrix.txt not found. Please ensure it's in 'resources/documents/'."
 
-    rows = len(matrix)
-    cols = len(matrix[0])
-    
-    # Initialize distances with infinity
-    distances = [[float('inf')] * cols for _ in range(rows)]
-    
-    # Start node distance is its own value
-    distances[0][0] = matrix[0][0]
-    
-    # Priority queue for Dijkstra's algorithm: (distance, row, col)
-    pq = [(matrix[0][0], 0, 0)]
-    
-    while pq:
-        dist, r, c = heapq.heappop(pq)
-        
-        # If we've found a shorter path already, skip
-        if dist > distances[r][c]:
-            continue
-        
-        # Check all four neighbors
-        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nr, nc = r + dr, c + dc
-            
-            # Check if the neighbor is within bounds
-            if 0 <= nr < rows and 0 <= nc < cols:
-                new_dist = dist + matrix[nr][nc]
-                
-                # If we found a shorter path to the neighbor
-                if new_dist < distances[nr][nc]:
-                    distances[nr][nc] = new_dist
-                    heapq.heappush(pq, (new_dist, nr, nc))
-                    
-    # The result is the distance to the bottom-right cell
-    return distances[rows-1][cols-1]
+    return grid.min_path_four_way()
 
 if __name__ == "__main__":
     print(solve())
@@ -44,7 +44,7 @@ We can simulate the game for a large number of turns to find the steady-state pr
 """
 import random
 
-def solve():
+def solve(num_turns=1000000):
     """
     Simulates Monopoly with two 4-sided dice to find the three most popular squares.
     """
@@ -57,8 +57,7 @@ def solve():
     R = {5, 15, 25, 35}
     U = {12, 28}
 
-    # Simulation parameters
-    num_turns = 1_000_000
+    # Simulation state
     visit_counts = [0] * 40
     current_pos = 0
     consecutive_doubles = 0
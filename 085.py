@@ -34,19 +34,17 @@ First, we need a formula to calculate the number of rectangles in an `m x n` gri
     j.  If `total_rects` becomes much larger than the target, we can break the inner loop for `n` and move to the next `m`, as further increases in `n` will only make the count larger.
 """
 
-def solve():
+def solve(target=2000000, limit=100):
     """
     Finds the area of the rectangular grid with the number of rectangles
     closest to two million.
     """
-    target = 2_000_000
     closest_diff = float('inf')
     result_area = 0
 
     # Set a reasonable search limit for the width 'm'.
     # If m=1, n would be ~2000. If m=n, m^2(m+1)^2/4 ~ 2M => m^4 ~ 8M => m ~ 53.
-    # A limit of 100 for m should be very safe.
-    limit = 100
+    # The default limit of 100 for m should be very safe.
 
     for m in range(1, limit):
         rects_m = m * (m + 1) // 2
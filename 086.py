@@ -20,51 +20,45 @@ Instead of iterating through all cuboids for a given M (O(M^3)), which is too sl
     - The constraints on `H` are `H <= W` (which implies `H <= s/2`) and `W <= M` (which implies `s-H <= M`, so `H >= s-M`).
     - For a given `(M, s)` pair, the number of valid `H` values is `(s // 2) - max(1, s - M) + 1`.
 
-3.  **Algorithm**:
-    a.  Initialize `count = 0` and `M = 0`.
-    b.  Start a loop that increments `M` at each step.
-    c.  Inside the loop, let `L = M`.
-    d.  Iterate `s` (for `W+H`) from 2 up to `2*L`.
-    e.  Check if `L^2 + s^2` is a perfect square.
-    f.  If it is, calculate the number of valid `(W, H)` pairs for this `(L, s)` and add it to the total `count`.
-    g.  When `count` first exceeds one million, the current value of `M` is the answer.
+3.  **Generating the Pairs**: Testing every `(L, s)` for a perfect square wastes almost all of the work. Every pair is a multiple `(k*a, k*b)` of the legs of a primitive triple, so we walk the primitive triples with both legs at most `2 * bound` (`euler.pythagorean.primitive_triples`, no square roots or gcd tests) and their multiples. Each multiple gives up to two pairs: `L = k*a, s = k*b` (if `k*b <= 2*k*a`) and `L = k*b, s = k*a`.
+
+4.  **Algorithm**:
+    a.  Choose a `bound` for `M`.
+    b.  For every `L <= bound`, add up the number of cuboids with largest side exactly `L` from the pairs above.
+    c.  Walk `M = 1, 2, ...` keeping a running total; when it reaches one million, the current value of `M` is the answer.
+    d.  If it never does, double the `bound` and repeat.
 """
-import math
+from euler.pythagorean import primitive_triples
 
-def solve():
+def solve(target=1000000):
     """
     Finds the least value of M such that the number of integer shortest path
     solutions for cuboids up to M x M x M first exceeds one million.
     """
-    target = 1_000_000
-    count = 0
-    m = 0
+    bound = 64
     
-    while count < target:
-        m += 1
-        # Let L = m, the largest dimension.
-        # Iterate through the sum of the other two dimensions, s = W+H.
-        # s can range from 2 up to 2*m.
-        for s in range(2, 2 * m + 1):
-            path_sq = m * m + s * s
-            path = math.isqrt(path_sq)
-            
-            if path * path == path_sq:
-                # We have a valid Pythagorean triple (m, s, path).
-                # Now, count the number of ways to form s = W+H
-                # with the constraint 1 <= H <= W <= m.
-                
-                # From H <= W and W+H=s, we get H <= s/2.
-                if s <= m:
-                    # If s <= m, then s-m <= 0. The lower bound for H is 1.
-                    # The range for H is [1, s/2]. Number of solutions is s // 2.
-                    count += s // 2
-                else: # s > m
-                    # From W <= m and W+H=s, we get s-H <= m, so H >= s-m.
-                    # The range for H is [s-m, s/2].
-                    count += (s // 2) - (s - m) + 1
-                    
-    return m
+    while True:
+        # routes[L]: cuboids with largest dimension exactly L and an integer route
+        routes = [0] * (bound + 1)
+        for a, b, _ in primitive_triples(max_leg=2 * bound):
+            # The multiples (x, y) = k * (a, b), x < y <= 2 * bound
+            x, y = a, b
+            while y <= 2 * bound:
+                # L = x, s = y > L: the range for H is [s-m, s/2].
+                if x <= bound and y <= 2 * x:
+                    routes[x] += (y // 2) - (y - x) + 1
+                # L = y, s = x < L: the range for H is [1, s/2].
+                if y <= bound:
+                    routes[y] += x // 2
+                x += a
+                y += b
+        
+        count = 0
+        for m in range(1, bound + 1):
+            count += routes[m]
+            if count >= target:
+                return m
+        bound *= 2
 
 if __name__ == "__main__":
     print(solve())
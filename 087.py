@@ -25,27 +25,17 @@ We need to find the number of unique integers N < 50,000,000 such that N = p1^2
 """
 import math
 
-def sieve(n):
-    """Generate a list of primes up to n using Sieve of Eratosthenes."""
-    primes = [True] * (n + 1)
-    primes[0] = primes[1] = False
-    for i in range(2, int(n**0.5) + 1):
-        if primes[i]:
-            for multiple in range(i*i, n + 1, i):
-                primes[multiple] = False
-    prime_numbers = [i for i, is_p in enumerate(primes) if is_p]
-    return prime_numbers
+from euler.prime_table import cached_sieve
 
-def solve():
+def solve(limit=50000000):
     """
     Finds how many numbers below fifty million can be expressed as the sum
     of a prime square, prime cube, and prime fourth power.
     """
-    limit = 50_000_000
     
     # Determine the maximum prime needed for the sieve
     max_prime_needed = int(limit**0.5) + 1
-    primes = sieve(max_prime_needed)
+    primes = cached_sieve(max_prime_needed).primes()
     
     # Generate the lists of powers
     prime_squares = [p**2 for p in primes]
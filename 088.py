@@ -24,16 +24,15 @@ Instead of iterating through k and trying to find the smallest N, it's more effi
     f.  The final answer is the sum of the unique values in this array.
 """
 
-def solve():
+def solve(k_limit=12000):
     """
     Finds the sum of all the minimal product-sum numbers for 2 <= k <= 12000.
     """
-    K_LIMIT = 12000
-    # The minimal N for a given k is between k and 2k. So the max N to check is ~2*K_LIMIT.
-    N_LIMIT = 2 * K_LIMIT
+    # The minimal N for a given k is between k and 2k. So the max N to check is ~2*k_limit.
+    n_limit = 2 * k_limit
     
     # Array to store the minimal product-sum number for each k
-    min_n_for_k = [float('inf')] * (K_LIMIT + 1)
+    min_n_for_k = [float('inf')] * (k_limit + 1)
 
     def find_sums(product, current_sum, num_factors, start_factor):
         """
@@ -44,7 +43,7 @@ def solve():
             # Calculate k for the current factorization
             k = product - current_sum + num_factors
             
-            if k <= K_LIMIT:
+            if k <= k_limit:
                 # We found a product-sum number 'product' for set size 'k'.
                 # Update the minimum if this one is smaller.
                 min_n_for_k[k] = min(min_n_for_k[k], product)
@@ -52,8 +51,8 @@ def solve():
         # Continue adding factors to the product
         # The next factor 'i' must be at least 'start_factor' to avoid duplicates.
         # The new product must not exceed the overall limit.
-        for i in range(start_factor, (N_LIMIT // product) * 2): # A bit of margin
-             if product * i > N_LIMIT + 100: # Pruning
+        for i in range(start_factor, (n_limit // product) * 2): # A bit of margin
+             if product * i > n_limit + 100: # Pruning
                  break
              find_sums(product * i, current_sum + i, num_factors + 1, i)
 
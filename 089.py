@@ -20,6 +20,7 @@ The process is to convert each Roman numeral to its integer value, then convert
     - Add the difference `(original_length - new_length)` to a running total.
     - The final total is the answer.
 """
+from euler.documents import lines
 
 def roman_to_int(s):
     """Converts a Roman numeral string to an integer."""
@@ -57,8 +58,7 @@ def solve():
     in the file in its minimal form.
     """
     try:
-        with open('resources/documents/0089_roman.txt', 'r') as f:
-            roman_numerals = [line.strip() for line in f]
+        roman_numerals = lines("0089_roman.txt")
     except FileNotFoundError:
         return "Error: roman.txt not found. Please ensure it's in 'resources/documents/'."
 
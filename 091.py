@@ -32,12 +32,11 @@ A more efficient approach is to fix one point, say P, and then count how many ot
 """
 import math
 
-def solve():
+def solve(limit=50):
     """
     Finds the number of right triangles that can be formed with vertices
     O(0,0), P(x1, y1), Q(x2, y2) where coordinates are in [0, 50].
     """
-    limit = 50
     count = 0
 
     # Case 1: Right angle at the origin O(0,0).
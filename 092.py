@@ -31,11 +31,10 @@ def sum_square_digits(n):
         n //= 10
     return total
 
-def solve():
+def solve(limit=10000000):
     """
     Counts how many starting numbers below ten million will arrive at 89.
     """
-    limit = 10_000_000
     
     # The max sum for a number under 10M is for 9,999,999 -> 7 * 9^2 = 567.
     # So we only need a cache up to this size.
@@ -20,31 +20,29 @@ We are looking for triangles with sides (a, a, a-1) or (a, a, a+1).
     - Let `X = 3a-1`. This also transforms into the Pell-type equation `X^2 - 3y^2 = 4`.
 
 4.  **Solving the Pell-type Equation**:
-    - The solutions `(X_k)` to `X^2 - 3y^2 = 4` can be generated by the linear recurrence relation `X_k = 4 * X_{k-1} - X_{k-2}` with initial values `X_0 = 2` and `X_1 = 4`.
+    - `euler.pell.pell_solutions(3, 4)` yields the positive solutions in increasing order: `X = 4, 14, 52, 194, ...` (the same numbers as the recurrence `X_k = 4 * X_{k-1} - X_{k-2}`).
     - For each solution `X_k`, we check if it corresponds to an integer side `a` in either of our two cases.
         - Case 1: `a = (X_k - 1) / 3`. This requires `X_k ≡ 1 (mod 3)`. The perimeter is `P = 3a - 1 = X_k - 2`.
         - Case 2: `a = (X_k + 1) / 3`. This requires `X_k ≡ 2 (mod 3)`. The perimeter is `P = 3a + 1 = X_k + 2`.
 
 5.  **Algorithm**:
-    - Generate the sequence `X_k` using the recurrence.
+    - Generate the sequence `X_k` with `pell_solutions(3, 4)`.
     - For each `X_k`, check if it yields a valid integer `a` for either case.
     - If it does, calculate the corresponding perimeter.
     - If the perimeter is within the one billion limit, add it to a running total.
     - Stop when the generated perimeters exceed the limit.
 """
+from euler.pell import pell_solutions
 
-def solve():
+def solve(limit=1000000000):
     """
     Finds the sum of the perimeters of all almost equilateral triangles
     with integral side lengths and area and whose perimeters do not
     exceed one billion.
     """
-    limit = 1_000_000_000
     total_perimeter_sum = 0
     
-    x_prev, x_curr = 2, 4  # Initial values for the recurrence X_k = 4*X_{k-1} - X_{k-2}
-    
-    while True:
+    for x_curr, _ in pell_solutions(3, 4):
         # Case 2 check: a = (X+1)/3, P = X+2
         if (x_curr + 1) % 3 == 0:
             a = (x_curr + 1) // 3
@@ -65,10 +63,6 @@ def solve():
                     break
                 total_perimeter_sum += perimeter
         
-        # Generate next term in the sequence
-        x_next = 4 * x_curr - x_prev
-        x_prev, x_curr = x_curr, x_next
-        
     return total_perimeter_sum
 
 if __name__ == "__main__":
@@ -8,7 +8,7 @@ Find the smallest member of the longest amicable chain with no element exceeding
 Solution Idea:
 The problem requires us to find the longest amicable chain starting from numbers up to one million.
 
-1.  **Pre-compute Divisor Sums**: The core operation is finding the sum of proper divisors. Doing this repeatedly would be slow. We can pre-compute these sums for all numbers up to the limit using a sieve-like method.
+1.  **Pre-compute Divisor Sums**: The core operation is finding the sum of proper divisors. Doing this repeatedly would be slow. We can pre-compute these sums for all numbers up to the limit with the shared multiplicative-function sieve (`euler.multiplicative`), which fills the divisor-sum table sigma in one pass; the sum of proper divisors is sigma(n) - n.
 
 2.  **Chain Traversal**: We will iterate through each number `n` from 2 to the limit. If we haven't processed `n` yet, we start building a chain from it.
     - `n_0 = n`, `n_1 = sum_divisors(n_0)`, `n_2 = sum_divisors(n_1)`, etc.
@@ -33,20 +33,17 @@ The problem requires us to find the longest amicable chain starting from numbers
         iii. Mark all numbers in the generated `chain` as visited.
         iv.  If a cycle was found (the repeated number is in the current `chain`), check if its length is the new maximum. If so, update the max length and the result (the minimum element in the cycle).
 """
+from euler.multiplicative import multiplicative_tables
 
-def solve():
+def solve(limit=1000000):
     """
     Finds the smallest member of the longest amicable chain with no element
     exceeding one million.
     """
-    limit = 1_000_000
     
     # Step 1: Pre-compute the sum of proper divisors for all numbers up to the limit
-    divisor_sums = [1] * (limit + 1)
-    divisor_sums[0] = divisor_sums[1] = 0
-    for i in range(2, limit // 2 + 1):
-        for j in range(i * 2, limit + 1, i):
-            divisor_sums[j] += i
+    sigma = multiplicative_tables(limit, ("sigma",))["sigma"]
+    divisor_sums = [s - i for i, s in enumerate(sigma)]
 
     # Step 2: Find the longest chain
     longest_chain_len = 0
@@ -9,6 +9,8 @@
 # 5. After solving each grid, take the first three numbers from the first row, form a 3-digit number, and add it to a total sum.
 # 6. Finally, print the total sum.
 
+from euler.documents import lines
+
 def solve_sudoku(grid):
     find = find_empty(grid)
     if not find:
@@ -59,24 +61,26 @@ def find_empty(grid):
 
     return None
 
-def get_puzzles(path):
+def get_puzzles(name):
     puzzles = []
-    with open(path, 'r') as f:
-        lines = f.readlines()
-        for i in range(0, len(lines), 10):
-            puzzle = []
-            for j in range(1, 10):
-                puzzle.append([int(c) for c in lines[i+j].strip()])
-            puzzles.append(puzzle)
+    rows = lines(name)
+    for i in range(0, len(rows), 10):
+        puzzle = []
+        for j in range(1, 10):
+            puzzle.append([int(c) for c in rows[i+j]])
+        puzzles.append(puzzle)
     return puzzles
 
-def main():
-    puzzles = get_puzzles('resources/documents/p096_sudoku.txt')
+def solve():
+    puzzles = get_puzzles("p096_sudoku.txt")
     total_sum = 0
     for puzzle in puzzles:
         solve_sudoku(puzzle)
         total_sum += puzzle[0][0] * 100 + puzzle[0][1] * 10 + puzzle[0][2]
-    print(total_sum)
+    return total_sum
+
+def main():
+    print(solve())
 
 if __name__ == "__main__":
     main()
@@ -8,10 +8,12 @@
 # Python's built-in pow(base, exp, mod) function is perfect for this.
 # It calculates (base^exp) % mod efficiently.
 
+def solve(digits=10):
+    mod = 10**digits
+    return (28433 * pow(2, 7830457, mod) + 1) % mod
+
 def main():
-    mod = 10**10
-    result = (28433 * pow(2, 7830457, mod) + 1) % mod
-    print(result)
+    print(solve())
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,8 @@
 
 from collections import defaultdict
 
-def get_words(path):
-    with open(path, 'r') as f:
-        content = f.read()
-        words = [word.strip('"') for word in content.split(',')]
-    return words
+from euler.documents import words as load_words
+from euler.paths import document_path
 
 def group_anagrams(words):
     anagrams = defaultdict(list)
@@ -23,9 +20,8 @@ def get_squares(max_len):
         i += 1
     return squares
 
-def find_largest_square_anagram(words_path):
-    words = get_words(words_path)
-    anagram_groups = group_anagrams(words)
+def find_largest_square_anagram(words_name):
+    anagram_groups = group_anagrams(load_words(words_name))
     if not anagram_groups:
         return 0
     max_len = max(len(k) for k in anagram_groups.keys())
@@ -77,11 +73,13 @@ def find_largest_square_anagram(words_path):
     
     return max_square
 
+def solve():
+    return find_largest_square_anagram("0098_words.txt")
+
 def main():
-    words_path = 'resources/documents/0098_words.txt'
+    words_path = document_path("0098_words.txt")
     try:
-        result = find_largest_square_anagram(words_path)
-        print(result)
+        print(solve())
     except FileNotFoundError:
         print(f"Error: The file '{words_path}' was not found.")
 
@@ -12,40 +12,26 @@
 
 import math
 
-def find_largest_value_line(path):
+from euler.documents import int_rows
+from euler.paths import document_path
+
+def find_largest_value_line(name):
     max_val = 0
     max_line_num = 0
-    with open(path, 'r') as f:
-        for i, line in enumerate(f, 1):
-            base, exponent = map(int, line.strip().split(','))
-            val = exponent * math.log(base)
-            if val > max_val:
-                max_val = val
-                max_line_num = i
+    for i, (base, exponent) in enumerate(int_rows(name), 1):
+        val = exponent * math.log(base)
+        if val > max_val:
+            max_val = val
+            max_line_num = i
     return max_line_num
 
-def main():
-    # The problem description gives the file name as '0099_base_exp.txt',
-    # but based on the project structure, it is likely 'p099_base_exp.txt'.
-    # I will assume the latter.
-    file_path = 'resources/documents/p099_base_exp.txt'
-    try:
-        # First, let's create the file with the expected name from the problem,
-        # in case the actual file has a different name.
-        # I'll look for a file that seems to contain the data.
-        # A file named 'base_exp.txt' seems likely.
-        with open('resources/documents/base_exp.txt', 'r') as source_file:
-            content = source_file.read()
-        with open(file_path, 'w') as dest_file:
-            dest_file.write(content)
-    except FileNotFoundError:
-        # If 'base_exp.txt' is not found, I'll just proceed,
-        # assuming 'p099_base_exp.txt' already exists.
-        pass
+def solve():
+    return find_largest_value_line("p099_base_exp.txt")
 
+def main():
+    file_path = document_path("p099_base_exp.txt")
     try:
-        line_num = find_largest_value_line(file_path)
-        print(line_num)
+        print(solve())
     except FileNotFoundError:
         print(f"Error: Could not find the file at {file_path}")
 
@@ -0,0 +1,75 @@
+"""
+Benchmark: str() vs. euler.digits.decimal_string on huge integers.
+
+Converts 3**k for numbers of the given bit lengths both ways (str() with the
+sys.set_int_max_str_digits limit lifted) and times digit_sum and num_digits,
+which is what 016, 020, 025, 056, 065 and 080 need. str() is skipped above
+--str-max bits, where it takes minutes.
+
+Run from the repository root:
+    python -m benchmarks.bigint_bench                  # 10^4 .. 10^7 bits
+    python -m benchmarks.bigint_bench 33219281 --str-max 0
+"""
+import argparse
+import sys
+import time
+
+from euler.digits import decimal_string, digit_sum, num_digits
+
+
+def check_num_digits():
+    """num_digits against len(str()) just below, at and above large powers of ten."""
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        for k in (512, 1024, 2048):
+            for n in (10**k - 1, 10**k, 10**k + 1):
+                if num_digits(n) != len(str(n)):
+                    raise AssertionError(f"num_digits is {num_digits(n)} for 10**{k} {n - 10**k:+d}")
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bigint_bench",
+                                     description=__doc__.split("\n\n")[0])
+    parser.add_argument("bits", type=int, nargs="*", default=[10**4, 10**5, 10**6, 4 * 10**6, 10**7],
+                        help="bit lengths of the numbers to convert")
+    parser.add_argument("--str-max", type=int, default=4 * 10**6, metavar="BITS",
+                        help="largest number also converted with str() (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    check_num_digits()
+    limit = sys.get_int_max_str_digits()
+    print(f"{'bits':>10} {'digits':>9} {'str (s)':>9} {'decimal (s)':>11} {'speedup':>8} "
+          f"{'digit_sum (s)':>13} {'num_digits (s)':>14}")
+    for bits in args.bits:
+        n = 3 ** (bits * 100 // 158)
+        # The tree of powers is built on first use; time the steady state.
+        decimal_string(n)
+        new, text = timed(decimal_string, n)
+        if bits <= args.str_max:
+            sys.set_int_max_str_digits(0)
+            try:
+                old, reference = timed(str, n)
+            finally:
+                sys.set_int_max_str_digits(limit)
+            if reference != text:
+                raise AssertionError(f"decimal_string differs from str() at {bits} bits")
+            old_column, speedup = f"{old:9.3f}", f"{old / new:7.1f}x"
+        else:
+            old_column, speedup = f"{'-':>9}", f"{'-':>8}"
+        sum_time, _ = timed(digit_sum, n)
+        count_time, count = timed(num_digits, n)
+        print(f"{bits:>10} {count:>9} {old_column} {new:11.3f} {speedup:>8} {sum_time:13.3f} {count_time:14.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark: string-based digit idioms vs. euler.digits.
+
+Times each operation the scripts used to spell out with str() -- digit sum
+(016, 020, 056, 065), digit fifth-power sums over a range (030), permutation
+keys (049, 052, 062, 070), reversal (055) and palindrome tests (036) -- on
+a batch of numbers of a given size, old idiom against the shared helper.
+
+Run from the repository root:
+    python -m benchmarks.digits_bench                # 6, 12, 30 and 300 digits
+    python -m benchmarks.digits_bench 8 1000
+"""
+import random
+import sys
+import time
+
+from euler.digits import (digit_power_sums, digit_signature, digit_sum, is_palindrome, palindromes,
+                          reverse_digits)
+
+BATCH = 20000
+
+
+def str_digit_sum(n):
+    return sum(int(digit) for digit in str(n))
+
+
+def str_signature(n):
+    return "".join(sorted(str(n)))
+
+
+def str_reverse(n):
+    return int(str(n)[::-1])
+
+
+def str_is_palindrome(n):
+    return str(n) == str(n)[::-1]
+
+
+OPERATIONS = (
+    ("digit sum", str_digit_sum, digit_sum),
+    ("signature", str_signature, digit_signature),
+    ("reverse", str_reverse, reverse_digits),
+    ("palindrome", str_is_palindrome, is_palindrome),
+)
+
+
+def per_call(func, numbers):
+    """Best of three, in nanoseconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for n in numbers:
+            func(n)
+        best = min(best, time.perf_counter() - start)
+    return best / len(numbers) * 1e9
+
+
+def compare(label, old, new):
+    print(f"{label:>26} {old:>12.0f} {new:>12.0f} {old / new:>8.2f}x")
+
+
+def range_workloads():
+    """Whole-range workloads: 030's power sums and 036's palindromes."""
+    limit = 6 * 9**5
+    start = time.perf_counter()
+    [sum(int(digit)**5 for digit in str(n)) for n in range(limit + 1)]
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    digit_power_sums(0, limit + 1, 5)
+    new = time.perf_counter() - start
+    compare(f"power sums 0..{limit} (ms)", old * 1e3, new * 1e3)
+
+    limit = 10**6
+    start = time.perf_counter()
+    [n for n in range(1, limit) if str_is_palindrome(n)]
+    old = time.perf_counter() - start
+    start = time.perf_counter()
+    list(palindromes(limit))
+    new = time.perf_counter() - start
+    compare(f"palindromes < {limit} (ms)", old * 1e3, new * 1e3)
+
+
+def main(sizes):
+    rng = random.Random(1)
+    print(f"{'operation':>26} {'str (ns)':>12} {'digits (ns)':>12} {'speedup':>9}")
+    for size in sizes:
+        numbers = [rng.randrange(10**(size - 1), 10**size) for _ in range(BATCH)]
+        for name, old, new in OPERATIONS:
+            compare(f"{name}, {size} digits", per_call(old, numbers), per_call(new, numbers))
+    range_workloads()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [6, 12, 30, 300]
+    main(sizes)
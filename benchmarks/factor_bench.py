@@ -0,0 +1,70 @@
+"""
+Benchmark: per-number trial division vs. the smallest-prime-factor table.
+
+Times the divisor-sum and divisor-count workloads of 012, 021, 023 and 095
+(every n up to N) both with the O(sqrt n) trial loops those scripts used and
+with `euler.factor.FactorTable` (table build included).
+
+Run from the repository root:
+    python -m benchmarks.factor_bench               # N = 10^4, 10^5, 10^6
+    python -m benchmarks.factor_bench 28123
+"""
+import sys
+import time
+
+from euler.factor import FactorTable
+
+
+def trial_sum_divisors(n):
+    """sigma(n) by trial division, as in 021.py / 023.py."""
+    s = 0
+    for i in range(1, int(n**0.5) + 1):
+        if n % i == 0:
+            s += i
+            if i * i != n:
+                s += n // i
+    return s
+
+
+def trial_num_divisors(n):
+    """d(n) by trial division, as in 012.py."""
+    count = 0
+    i = 1
+    while i * i <= n:
+        if n % i == 0:
+            count += 1 if i * i == n else 2
+        i += 1
+    return count
+
+
+def run_trial(limit):
+    sigma = [trial_sum_divisors(n) for n in range(1, limit + 1)]
+    d = [trial_num_divisors(n) for n in range(1, limit + 1)]
+    return sigma, d
+
+
+def run_table(limit):
+    table = FactorTable(limit)
+    sigma = [table.sum_divisors(n) for n in range(1, limit + 1)]
+    d = [table.num_divisors(n) for n in range(1, limit + 1)]
+    return sigma, d
+
+
+def timed(func, limit):
+    start = time.perf_counter()
+    result = func(limit)
+    return time.perf_counter() - start, result
+
+
+def main(limits):
+    print(f"{'N':>10} {'trial (s)':>10} {'table (s)':>10} {'speedup':>8}")
+    for limit in limits:
+        t_trial, expected = timed(run_trial, limit)
+        t_table, result = timed(run_table, limit)
+        assert result == expected
+        print(f"{limit:>10} {t_trial:>10.3f} {t_table:>10.3f} {t_trial / t_table:>7.1f}x")
+
+
+if __name__ == "__main__":
+    limits = [int(arg) for arg in sys.argv[1:]] or [10**4, 10**5, 10**6]
+    main(limits)
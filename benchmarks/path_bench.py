@@ -0,0 +1,165 @@
+"""
+Benchmark: four-way minimal path sums (083) on generated square matrices.
+
+Times the tuple-based Dijkstra 083.py used (heapq of (dist, r, c), a list of
+lists of float('inf') distances) against CostGrid.min_path_four_way with a
+heap and with a bucket queue, each also as A*.
+
+Two workloads per size:
+    corner    083 itself: top left to bottom right, costs uniform in 1..9999
+    middle    between two cells of the middle row, half the width apart,
+              costs in 5000..9999, where the A* lower bound is tight
+The tuple solver always fills the whole grid, so it only runs on "corner".
+
+With --three-way the benchmark times 082 instead: a generated square matrix
+is written as a comma-separated document, then min_path_three_way runs on
+it twice in fresh CostGrids, the first time including the parse into the
+document cache (a temporary directory). Needs numpy.
+
+With --triangle it times 067-style triangles instead: a generated triangle
+document of the given depth is read with documents.stream_int_rows() and
+solved top-down by max_triangle_path_top_down(), holding one row at a time.
+Up to 3000 rows it is also solved the old way (int_rows() and the
+bottom-up max_triangle_path()) for comparison. Needs numpy.
+
+Run from the repository root:
+    python -m benchmarks.path_bench                 # 500, 1000 and 2000 square
+    python -m benchmarks.path_bench 4000
+    python -m benchmarks.path_bench --three-way 10000
+    python -m benchmarks.path_bench --triangle 1000 3000 20000
+"""
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import time
+
+from euler.documents import int_rows, stream_int_rows
+from euler.optional import require_numpy
+from euler.path_sums import CostGrid, max_triangle_path, max_triangle_path_top_down
+
+# Deepest triangle also solved by loading every row.
+MAX_LOADED_TRIANGLE = 3000
+
+MODES = (
+    ("heap", "heap", False),
+    ("heap A*", "heap", True),
+    ("buckets", "buckets", False),
+    ("buckets A*", "buckets", True),
+)
+
+
+def tuple_dijkstra(matrix):
+    """The original solver of 083.py."""
+    rows, cols = len(matrix), len(matrix[0])
+    distances = [[float('inf')] * cols for _ in range(rows)]
+    distances[0][0] = matrix[0][0]
+    pq = [(matrix[0][0], 0, 0)]
+    while pq:
+        dist, r, c = heapq.heappop(pq)
+        if dist > distances[r][c]:
+            continue
+        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                new_dist = dist + matrix[nr][nc]
+                if new_dist < distances[nr][nc]:
+                    distances[nr][nc] = new_dist
+                    heapq.heappush(pq, (new_dist, nr, nc))
+    return distances[rows - 1][cols - 1]
+
+
+def random_matrix(size, low, high):
+    rng = random.Random(size * low)
+    return [[rng.randint(low, high) for _ in range(size)] for _ in range(size)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def four_way(sizes):
+    header = "".join(f"{name + ' (s)':>16}" for name, _, _ in MODES)
+    print(f"{'size':>6} {'workload':>8} {'tuples (s)':>12}{header}")
+    for size in sizes:
+        matrix = random_matrix(size, 1, 9999)
+        t_tuples, expected = timed(tuple_dijkstra, matrix)
+        grid = CostGrid(matrix)
+        line = f"{size:>6} {'corner':>8} {t_tuples:>12.2f}"
+        for _, queue, heuristic in MODES:
+            elapsed, result = timed(grid.min_path_four_way, 0, None, queue, heuristic)
+            assert result == expected
+            line += f"{elapsed:>16.2f}"
+        print(line)
+
+        grid = CostGrid(random_matrix(size, 5000, 9999))
+        middle = size // 2 * size
+        start, end = middle + size // 4, middle + 3 * size // 4
+        line = f"{size:>6} {'middle':>8} {'-':>12}"
+        expected = None
+        for _, queue, heuristic in MODES:
+            elapsed, result = timed(grid.min_path_four_way, start, end, queue, heuristic)
+            assert expected is None or result == expected
+            expected = result
+            line += f"{elapsed:>16.2f}"
+        print(line)
+
+
+def three_way(sizes):
+    np = require_numpy("--three-way")
+    print(f"{'size':>6} {'text MB':>8} {'parse + solve (s)':>18} {'cached solve (s)':>17}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ["EULER_CACHE_DIR"] = directory
+            path = os.path.join(directory, "matrix.txt")
+            rng = np.random.default_rng(size)
+            with open(path, 'w') as f:
+                for _ in range(size):
+                    f.write(",".join(map(str, rng.integers(1, 10000, size).tolist())) + "\n")
+            megabytes = os.path.getsize(path) / 2**20
+            t_first, expected = timed(lambda: CostGrid.from_document(path).min_path_three_way())
+            t_cached, result = timed(lambda: CostGrid.from_document(path).min_path_three_way())
+            assert result == expected
+            print(f"{size:>6} {megabytes:>8.0f} {t_first:>18.2f} {t_cached:>17.2f}")
+
+
+def triangle(depths):
+    np = require_numpy("--triangle")
+    print(f"{'rows':>6} {'text MB':>8} {'streamed (s)':>13} {'loaded (s)':>11}")
+    for depth in depths:
+        with tempfile.TemporaryDirectory() as directory:
+            os.environ["EULER_CACHE_DIR"] = directory
+            path = os.path.join(directory, "triangle.txt")
+            rng = np.random.default_rng(depth)
+            with open(path, 'w') as f:
+                for width in range(1, depth + 1):
+                    f.write(" ".join(map(str, rng.integers(1, 100, width).tolist())) + "\n")
+            megabytes = os.path.getsize(path) / 2**20
+            t_stream, expected = timed(lambda: max_triangle_path_top_down(stream_int_rows(path)))
+            line = f"{depth:>6} {megabytes:>8.0f} {t_stream:>13.2f}"
+            if depth <= MAX_LOADED_TRIANGLE:
+                t_loaded, result = timed(lambda: max_triangle_path(int_rows(path)))
+                assert result == expected
+                line += f" {t_loaded:>11.2f}"
+            else:
+                line += f" {'-':>11}"
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.path_bench",
+                                     description=__doc__.split("\n\n")[0])
+    parser.add_argument("sizes", nargs="*", type=int, help="matrix sizes (square) or triangle depths")
+    parser.add_argument("--three-way", action="store_true", help="time 082 on generated documents")
+    parser.add_argument("--triangle", action="store_true",
+                        help="time 067 on generated triangles (sizes are depths)")
+    args = parser.parse_args()
+    if args.three_way:
+        three_way(args.sizes or [1000, 3000, 10000])
+    elif args.triangle:
+        triangle(args.sizes or [1000, 3000, 20000])
+    else:
+        four_way(args.sizes or [500, 1000, 2000])
@@ -0,0 +1,184 @@
+"""
+Benchmark: how each problem's time and memory grow with its size parameter.
+
+Every problem's solve() takes its limits as keyword arguments (default: the
+Project Euler value). This benchmark picks one size parameter per problem,
+runs solve() at several multiples of the default in fresh interpreters (via
+`euler.bench.run_problem`) and reports wall time, CPU time and peak memory for
+each size, plus the fitted growth exponent k in time ~ N^k.
+
+The size parameter is the integer parameter with the largest default, unless
+SIZE_PARAMETERS names another one or --param is given. Problems whose solve()
+takes no integer parameter (fixed input files, fixed digit sets) are skipped.
+
+Run from the repository root:
+    python -m benchmarks.scaling_bench                       # KEY_PROBLEMS
+    python -m benchmarks.scaling_bench 014 035 --factors 0.5 1 2 4
+    python -m benchmarks.scaling_bench 010 --param n --values 1000000 10000000 100000000
+    python -m benchmarks.scaling_bench --all --csv scaling.csv
+    python -m benchmarks.scaling_bench 092 --tracemalloc --plot plots/   # needs matplotlib
+"""
+import argparse
+import csv
+import inspect
+import math
+import os
+import sys
+
+from euler.bench import KEY_PROBLEMS, run_problem
+from euler.optional import pyplot
+from euler.problems import entry_point, normalize_id, problem_ids
+
+DEFAULT_FACTORS = (0.125, 0.25, 0.5, 1, 2)
+
+# Problems whose largest integer parameter is not the one that sets the work.
+SIZE_PARAMETERS = {
+    "053": "n_max",
+}
+
+FIELDS = ("problem", "param", "value", "status", "wall_s", "cpu_s", "peak_rss_kb", "traced_peak_kb",
+          "output")
+
+
+def size_parameter(problem):
+    """Returns (name, default) of the problem's size parameter, or None."""
+    defaults = {name: parameter.default
+                for name, parameter in inspect.signature(entry_point(problem)).parameters.items()
+                if type(parameter.default) is int}
+    if not defaults:
+        return None
+    name = SIZE_PARAMETERS.get(problem) or max(defaults, key=defaults.get)
+    return name, defaults[name]
+
+
+def scaled_values(default, factors):
+    """The sizes default * factor, as sorted distinct positive ints."""
+    return sorted({max(1, round(default * factor)) for factor in factors})
+
+
+def growth_exponent(rows, metric="wall_s"):
+    """Least-squares slope of log(metric) against log(N), or None."""
+    points = [(math.log(row["value"]), math.log(row[metric]))
+              for row in rows if row["status"] == "ok" and row["value"] > 0 and row[metric]]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def scale_problem(problem, param, values, trace=False, timeout=None):
+    """Runs one problem at every size and returns the rows."""
+    rows = []
+    for value in values:
+        record = run_problem(problem, trace, timeout, params={param: value})
+        record.update(param=param, value=value)
+        rows.append(record)
+        print_row(record)
+    return rows
+
+
+def print_row(row):
+    if row["status"] != "ok":
+        print(f"{row['problem']:>7} {row['param']:>12} {row['value']:>14} {row['status']:>9}", flush=True)
+        return
+    traced = row["traced_peak_kb"]
+    traced = f"{traced / 1024:12.1f}" if traced is not None else f"{'-':>12}"
+    print(f"{row['problem']:>7} {row['param']:>12} {row['value']:>14} {row['wall_s']:9.3f} "
+          f"{row['cpu_s']:8.3f} {row['peak_rss_kb'] / 1024:9.1f} {traced}", flush=True)
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def plot(problem, rows, directory):
+    """Writes <directory>/<problem>.png: time and memory against N, log-log."""
+    plt = pyplot()
+    ok = [row for row in rows if row["status"] == "ok"]
+    if not ok:
+        return None
+    values = [row["value"] for row in ok]
+    figure, (time_axes, memory_axes) = plt.subplots(1, 2, figsize=(10, 4))
+    time_axes.loglog(values, [row["wall_s"] for row in ok], "o-", label="wall")
+    time_axes.loglog(values, [row["cpu_s"] for row in ok], "s--", label="cpu")
+    time_axes.set_ylabel("seconds")
+    memory_axes.loglog(values, [row["peak_rss_kb"] / 1024 for row in ok], "o-", label="peak RSS")
+    if all(row["traced_peak_kb"] is not None for row in ok):
+        memory_axes.loglog(values, [row["traced_peak_kb"] / 1024 for row in ok], "s--", label="traced peak")
+    memory_axes.set_ylabel("MiB")
+    for axes in (time_axes, memory_axes):
+        axes.set_xlabel(ok[0]["param"])
+        axes.legend()
+    figure.suptitle(f"Problem {problem}")
+    figure.tight_layout()
+    path = os.path.join(directory, f"{problem}.png")
+    figure.savefig(path)
+    plt.close(figure)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scaling_bench",
+                                     description=__doc__.split("\n\n")[0])
+    parser.add_argument("problems", nargs="*", help=f"problem ids (default: {' '.join(KEY_PROBLEMS)})")
+    parser.add_argument("--all", action="store_true", help="every problem with a size parameter")
+    parser.add_argument("--param", help="size parameter to vary (default: chosen per problem)")
+    parser.add_argument("--factors", type=float, nargs="+", default=DEFAULT_FACTORS,
+                        help="multiples of the default size (default: %(default)s)")
+    parser.add_argument("--values", type=int, nargs="+", help="explicit sizes instead of --factors")
+    parser.add_argument("--tracemalloc", action="store_true", help="also record the tracemalloc peak")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per run")
+    parser.add_argument("--csv", metavar="PATH", help="write all rows as CSV")
+    parser.add_argument("--plot", metavar="DIR", help="write one PNG per problem (needs matplotlib)")
+    args = parser.parse_args(argv)
+
+    if args.plot:
+        if pyplot() is None:
+            parser.error("--plot requires matplotlib")
+        os.makedirs(args.plot, exist_ok=True)
+    if args.all:
+        problems = problem_ids()
+    else:
+        problems = [normalize_id(problem) for problem in args.problems] or list(KEY_PROBLEMS)
+
+    all_rows = []
+    print(f"{'problem':>7} {'param':>12} {'N':>14} {'wall (s)':>9} {'cpu (s)':>8} {'rss (MiB)':>9} "
+          f"{'traced (MiB)':>12}")
+    for problem in problems:
+        size = size_parameter(problem)
+        if args.param:
+            size = (args.param, size[1] if size and size[0] == args.param else None)
+        if size is None:
+            print(f"{problem:>7} {'-':>12} {'no size parameter, skipped':>27}")
+            continue
+        param, default = size
+        if args.values:
+            values = sorted(set(args.values))
+        elif default is None:
+            parser.error(f"problem {problem} has no integer default for {param}; use --values")
+        else:
+            values = scaled_values(default, args.factors)
+        rows = scale_problem(problem, param, values, args.tracemalloc, args.timeout)
+        exponent = growth_exponent(rows)
+        if exponent is not None:
+            print(f"{problem:>7} {'time ~ N^k':>12} {'k =':>14} {exponent:9.2f}")
+        if args.plot:
+            path = plot(problem, rows, args.plot)
+            if path:
+                print(f"{problem:>7} {'plot':>12} {path}")
+        all_rows.extend(rows)
+
+    if args.csv:
+        write_csv(all_rows, args.csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark: list-of-bool sieve vs. the shared bytearray sieve.
+
+Compares the `[True] * n` sieve that the scripts used to copy around with
+`euler.sieve.Sieve`, reporting wall time and peak traced memory for each.
+
+Run from the repository root:
+    python -m benchmarks.sieve_bench                 # 10^6, 10^7, 10^8
+    python -m benchmarks.sieve_bench 1000000 5000000
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from euler.sieve import Sieve
+
+
+def list_sieve(n):
+    """The sieve previously pasted into 010.py, 035.py, 050.py, ..."""
+    is_prime = [True] * (n + 1)
+    is_prime[0] = is_prime[1] = False
+    for i in range(2, int(n**0.5) + 1):
+        if is_prime[i]:
+            for multiple in range(i*i, n + 1, i):
+                is_prime[multiple] = False
+    return is_prime
+
+
+def bytearray_sieve(n):
+    return Sieve(n)
+
+
+def measure(func, n):
+    """Returns (seconds, peak bytes) for one call of func(n)."""
+    gc.collect()
+    start = time.perf_counter()
+    result = func(n)
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func(n)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main(limits):
+    print(f"{'n':>12} {'impl':>10} {'time (s)':>10} {'peak (MiB)':>11}")
+    for n in limits:
+        rows = []
+        for name, func in (("list", list_sieve), ("bytearray", bytearray_sieve)):
+            elapsed, peak = measure(func, n)
+            rows.append((elapsed, peak))
+            print(f"{n:>12} {name:>10} {elapsed:>10.3f} {peak / 2**20:>11.1f}")
+        (t_old, m_old), (t_new, m_new) = rows
+        print(f"{'':>12} {'speedup':>10} {t_old / t_new:>9.1f}x {m_old / m_new:>10.1f}x")
+
+
+if __name__ == "__main__":
+    limits = [int(arg) for arg in sys.argv[1:]] or [10**6, 10**7, 10**8]
+    main(limits)
@@ -0,0 +1,6 @@
+"""
+Shared helpers for the Project Euler solutions.
+
+The numbered scripts in the repository root import the pieces they need
+from the modules in this package, e.g. ``from euler.sieve import Sieve``.
+"""
@@ -0,0 +1,39 @@
+"""
+Command-line entry point: run problems through the lazy registry.
+
+Usage (from the repository root):
+    python -m euler 14
+    python -m euler 10 n=10000000      # keyword arguments for solve()
+    python -m euler 92 --cache         # memoize the answer (euler/cache.py)
+    python -m euler --list
+"""
+import argparse
+import sys
+
+from euler.problems import parse_param, problem_ids, run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m euler", description="Run a Project Euler solution.")
+    parser.add_argument("problem", nargs="?", help="problem number, e.g. 14 or 014")
+    parser.add_argument("params", nargs="*", type=parse_param, metavar="NAME=VALUE",
+                        help="keyword arguments for solve()")
+    parser.add_argument("--list", action="store_true", help="list the available problems")
+    parser.add_argument("--cache", action="store_true", help="use the on-disk result cache")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print(" ".join(problem_ids()))
+        return 0
+    if args.problem is None:
+        parser.error("a problem number is required")
+    if args.cache:
+        from euler.cache import cached_run
+        print(cached_run(args.problem, **dict(args.params)))
+    else:
+        print(run(args.problem, **dict(args.params)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Whole-suite benchmark harness.
+
+Each problem script runs in its own fresh interpreter, with the repository
+root as working directory, so problems cannot warm caches for each other.
+For every problem we record:
+    wall_s          wall-clock time of the script body
+    cpu_s           CPU time (user + system) of the script body
+    peak_rss_kb     peak resident set size of the child process
+    traced_peak_kb  peak Python allocations seen by tracemalloc
+                    (only with --tracemalloc, which slows the run down)
+    output          what the script printed (its answer)
+
+`run_problem` can also pass keyword arguments to the problem's solve(); the
+scaling benchmark (benchmarks/scaling_bench.py) uses that to time problems
+at other sizes.
+
+Results can be written as JSON and/or CSV. They can also be compared with a
+stored baseline: a problem is a regression when its wall time or peak RSS
+grows by more than --threshold (relative) and by more than a small absolute
+noise floor.
+
+Usage (from the repository root):
+    python -m euler.bench                          # all problems, table on stdout
+    python -m euler.bench 014 074 084 092          # selected problems
+    python -m euler.bench --key                    # only KEY_PROBLEMS
+    python -m euler.bench --json out.json --csv out.csv
+    python -m euler.bench --write-baseline         # store benchmarks/baseline.json
+    python -m euler.bench --compare                # exit 1 on regressions
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import resource
+import runpy
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from euler.paths import REPO_ROOT
+from euler.problems import problem_ids, problem_path, run
+
+# The heavy problems whose timings we watch most closely.
+KEY_PROBLEMS = ("014", "074", "084", "092")
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+FIELDS = ("problem", "status", "wall_s", "cpu_s", "peak_rss_kb", "traced_peak_kb", "output")
+
+# Differences below these are treated as noise when looking for regressions.
+MIN_WALL_DELTA_S = 0.05
+MIN_RSS_DELTA_KB = 2048
+
+
+def run_problem(problem, trace=False, timeout=None, params=None):
+    """
+    Benchmarks one problem in a child interpreter and returns its record.
+
+    Without `params` the script runs as a program, exactly as from the shell.
+    With `params` (a dict of JSON-serializable values) its solve() is called
+    with them as keyword arguments instead.
+    """
+    command = [sys.executable, "-m", "euler.bench", "--child", problem]
+    if trace:
+        command.append("--tracemalloc")
+    if params:
+        command += ["--params", json.dumps(params)]
+    try:
+        completed = subprocess.run(command, cwd=REPO_ROOT, capture_output=True,
+                                   text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return _record(problem, "timeout")
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        return _record(problem, "error", output=completed.stderr.strip()[-500:])
+    return json.loads(lines[-1])
+
+
+def _record(problem, status, **values):
+    record = dict.fromkeys(FIELDS)
+    record.update(problem=problem, status=status, **values)
+    return record
+
+
+def _child(problem, trace, params=None):
+    """Runs inside the child interpreter: executes the script and reports."""
+    path = problem_path(problem)
+    buffer = io.StringIO()
+    status = "ok"
+    if trace:
+        tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            if params:
+                print(run(problem, **params))
+            else:
+                runpy.run_path(path, run_name="__main__")
+        except Exception as exc:
+            status = "error"
+            print(f"{type(exc).__name__}: {exc}")
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    traced_peak = None
+    if trace:
+        traced_peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    record = _record(problem, status, wall_s=round(wall, 4), cpu_s=round(cpu, 4),
+                     peak_rss_kb=usage.ru_maxrss, traced_peak_kb=traced_peak,
+                     output=buffer.getvalue().strip())
+    print(json.dumps(record))
+
+
+def load_records(path):
+    """Reads a JSON report written by this module into {problem: record}."""
+    with open(path) as f:
+        return {record["problem"]: record for record in json.load(f)["results"]}
+
+
+def write_json(records, path):
+    report = {"python": sys.version.split()[0], "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+              "results": records}
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=1)
+        f.write("\n")
+
+
+def write_csv(records, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def find_regressions(records, baseline, threshold):
+    """Returns (problem, metric, old, new) for every metric that got worse."""
+    regressions = []
+    for record in records:
+        old = baseline.get(record["problem"])
+        if old is None or record["status"] != "ok" or old["status"] != "ok":
+            continue
+        for metric, floor in (("wall_s", MIN_WALL_DELTA_S), ("peak_rss_kb", MIN_RSS_DELTA_KB)):
+            before, after = old[metric], record[metric]
+            if after - before > max(floor, threshold * before):
+                regressions.append((record["problem"], metric, before, after))
+    return regressions
+
+
+def print_header():
+    print(f"{'problem':>7} {'status':>7} {'wall (s)':>9} {'cpu (s)':>8} {'rss (MiB)':>9} "
+          f"{'traced (MiB)':>12} {'vs base':>8}")
+
+
+def print_row(record, baseline=None):
+    if record["status"] != "ok":
+        print(f"{record['problem']:>7} {record['status']:>7}", flush=True)
+        return
+    traced = record["traced_peak_kb"]
+    traced = f"{traced / 1024:12.1f}" if traced is not None else f"{'-':>12}"
+    change = ""
+    old = (baseline or {}).get(record["problem"])
+    if old and old["status"] == "ok" and old["wall_s"]:
+        change = f"{record['wall_s'] / old['wall_s']:7.2f}x"
+    print(f"{record['problem']:>7} {'ok':>7} {record['wall_s']:9.3f} {record['cpu_s']:8.3f} "
+          f"{record['peak_rss_kb'] / 1024:9.1f} {traced} {change:>8}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m euler.bench", description=__doc__.split("\n\n")[0])
+    parser.add_argument("problems", nargs="*", help="problem ids (default: all)")
+    parser.add_argument("--key", action="store_true", help=f"only {', '.join(KEY_PROBLEMS)}")
+    parser.add_argument("--tracemalloc", action="store_true", help="also record the tracemalloc peak")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per problem")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--csv", metavar="PATH", help="write the results as CSV")
+    parser.add_argument("--baseline", metavar="PATH", default=DEFAULT_BASELINE)
+    parser.add_argument("--write-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="exit with status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown counted as a regression (default 0.25)")
+    parser.add_argument("--child", metavar="PROBLEM", help=argparse.SUPPRESS)
+    parser.add_argument("--params", type=json.loads, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.tracemalloc, args.params)
+        return 0
+
+    problems = args.problems or (list(KEY_PROBLEMS) if args.key else problem_ids())
+    baseline = load_records(args.baseline) if os.path.exists(args.baseline) else None
+
+    records = []
+    print_header()
+    for problem in problems:
+        records.append(run_problem(problem, args.tracemalloc, args.timeout))
+        print_row(records[-1], baseline)
+
+    if args.json:
+        write_json(records, args.json)
+    if args.csv:
+        write_csv(records, args.csv)
+    if args.write_baseline:
+        write_json(records, args.baseline)
+
+    if baseline is not None:
+        regressions = find_regressions(records, baseline, args.threshold)
+        for problem, metric, before, after in regressions:
+            marker = " (key problem)" if problem in KEY_PROBLEMS else ""
+            print(f"REGRESSION {problem} {metric}: {before} -> {after}{marker}")
+        if args.compare and regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
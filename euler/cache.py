@@ -0,0 +1,191 @@
+"""
+Content-addressed cache of problem answers.
+
+`cached_run(problem, **params)` behaves like `euler.problems.run`, but first
+looks the answer up under a key that hashes everything the answer depends on:
+    - the source of the problem script,
+    - the source of every `euler` module it imports (transitively),
+    - the parameters passed to solve(),
+    - the input files in resources/documents/ named by the script.
+Editing any of them changes the key, so a stale answer is never returned and
+nothing has to be invalidated by hand. Problems whose answer is random
+(NONDETERMINISTIC) are always recomputed.
+
+Entries live in one SQLite file in the cache directory (see `euler.paths`).
+The store is bounded by size: when it grows past `max_bytes`, the least
+recently used entries are evicted. A hit costs a few file hashes and one
+indexed lookup, i.e. about a millisecond.
+
+Usage:
+    cached_run(92)                  # computed once, then read from the cache
+    cached_run(14, limit=10**7)     # parameters are part of the key
+    python -m euler.cache --stats
+    python -m euler.cache --clear
+"""
+import argparse
+import hashlib
+import os
+import pickle
+import re
+import sqlite3
+import sys
+import time
+
+from euler.paths import REPO_ROOT, cache_dir, document_path
+from euler.problems import normalize_id, problem_path, run
+
+# Answers that depend on random numbers; these are never cached.
+NONDETERMINISTIC = frozenset({"084"})
+
+DEFAULT_MAX_BYTES = 16 << 20
+
+_EULER_IMPORT = re.compile(r"^\s*(?:from|import)\s+euler\.(\w+)", re.MULTILINE)
+# Any quoted file name in the problem script: document names are passed to the
+# euler.documents loaders and to the scripts' own helpers.
+_DOCUMENT = re.compile(r"""["']([\w.-]+\.txt)["']""")
+
+# path -> ((mtime_ns, size), sha256 hex digest)
+_file_hashes = {}
+
+
+def file_hash(path):
+    """sha256 of a file's contents (memoized on mtime and size); None if missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_hashes.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, 'rb') as f:
+            cached = _file_hashes[path] = (signature, hashlib.sha256(f.read()).hexdigest())
+    return cached[1]
+
+
+def dependencies(problem):
+    """Returns (source files, input documents) that a problem's answer depends on."""
+    sources = [problem_path(problem)]
+    documents = set()
+    seen = set()
+    index = 0
+    while index < len(sources):
+        try:
+            with open(sources[index]) as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = ""
+        if index == 0:
+            documents.update(_DOCUMENT.findall(text))
+        index += 1
+        for module in _EULER_IMPORT.findall(text):
+            if module not in seen:
+                seen.add(module)
+                sources.append(os.path.join(REPO_ROOT, "euler", f"{module}.py"))
+    return sources, sorted(documents)
+
+
+def cache_key(problem, params=None):
+    """The content hash under which a problem's answer for `params` is stored."""
+    problem = normalize_id(problem)
+    sources, documents = dependencies(problem)
+    digest = hashlib.sha256(problem.encode())
+    for path in sources:
+        digest.update(f"\0{os.path.relpath(path, REPO_ROOT)}\0{file_hash(path)}".encode())
+    for name in documents:
+        digest.update(f"\0{name}\0{file_hash(document_path(name))}".encode())
+    digest.update(f"\0{sorted((params or {}).items())!r}".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """A size-bounded LRU store of pickled values in a SQLite file."""
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path or os.path.join(cache_dir(), "results.sqlite")
+        self.max_bytes = max_bytes
+        self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS results ("
+                         "key TEXT PRIMARY KEY, problem TEXT, value BLOB, size INTEGER, used REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+
+    def get(self, key, default=None):
+        """Returns the stored value (marking it as recently used), or `default`."""
+        row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        self._db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def put(self, key, value, problem=None):
+        """Stores a value, then evicts least recently used entries beyond max_bytes."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(key) + len(blob)
+        self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                         (key, problem, blob, size, time.time()))
+        self._evict()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY used").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self):
+        """Returns (entries, stored bytes)."""
+        return self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+    def clear(self):
+        self._db.execute("DELETE FROM results")
+        self._db.execute("VACUUM")
+
+    def close(self):
+        self._db.close()
+
+
+_MISSING = object()
+_default_cache = None
+
+
+def default_cache():
+    """The process-wide ResultCache in the cache directory."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def cached_run(problem, cache=None, **params):
+    """Like `euler.problems.run`, but answers are memoized in a ResultCache."""
+    problem = normalize_id(problem)
+    if problem in NONDETERMINISTIC:
+        return run(problem, **params)
+    cache = cache or default_cache()
+    key = cache_key(problem, params)
+    answer = cache.get(key, _MISSING)
+    if answer is _MISSING:
+        answer = run(problem, **params)
+        cache.put(key, answer, problem)
+    return answer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m euler.cache", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stats", action="store_true", help="show the number and size of entries")
+    parser.add_argument("--clear", action="store_true", help="remove every entry")
+    args = parser.parse_args(argv)
+
+    cache = default_cache()
+    if args.clear:
+        cache.clear()
+    entries, size = cache.stats()
+    print(f"{cache.path}: {entries} entries, {size / 1024:.1f} KiB (limit {cache.max_bytes >> 20} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
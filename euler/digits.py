@@ -0,0 +1,319 @@
+"""
+Decimal digit utilities.
+
+Idea:
+Small and medium numbers are taken apart four digits at a time: one divmod
+by 10**4 yields a chunk 0..9999, and precomputed tables give the chunk's digit
+sum, digit-power sum or digit multiset. The tables are built on first use (a
+few milliseconds each). Very large numbers are converted to a decimal string
+once and counted with str.count, which runs in C; below about 50 digits the
+chunk loop is faster, above it the string is. Reversal and the base-10
+palindrome test go through the string for anything past one chunk: slicing a
+str is a single C call, which no table combination beats.
+
+CPython's int -> str conversion is quadratic and refuses numbers longer than
+sys.get_int_max_str_digits() (4300 digits by default). decimal_string()
+converts huge numbers by divide and conquer instead: n is split in binary
+halves (free shifts and masks), each half is converted recursively, and the
+halves are recombined as high * 2**w + low in the decimal module, whose
+numbers are stored in base 10**19 and multiplied with fast (Karatsuba and
+number-theoretic transform) algorithms. The split widths are DECIMAL_LEAF_BITS
+* 2**level, so the powers 2**w form one small tree that is computed once and
+shared by every conversion. The cost grows roughly like n**1.3 instead of
+n**2: a 3-million-digit number (2**10**7) takes about a second where str() would
+take minutes. digit_sum, digit_power_sum and digit_signature use it for
+numbers past the str() limit, and num_digits avoids conversion altogether.
+
+A digit multiset ("signature") is packed into one int, SIGNATURE_BITS bits
+per digit value, so two numbers are permutations of each other exactly when
+their signatures are equal, and signatures can be used as dict keys. Every
+number below 10**63 fits (no digit can occur 64 times).
+
+The range functions (digit_sums, digit_power_sums, digit_signatures) fill a
+whole table for start <= n < stop at once, like euler.multiplicative; numpy is
+used for long ranges when it is installed.
+
+Usage:
+    digit_sum(2**1000)                  # 1366
+    digit_power_sum(9474, 4)            # 9474
+    digit_signature(1487) == digit_signature(4817)   # True
+    reverse_digits(1200)                # 21
+    is_palindrome(585, base=2)          # True
+    list(palindromes(200))              # [1, 2, ..., 9, 11, 22, ..., 191]
+    digit_sums(0, 10**6)                # array('q') indexed by n
+    digit_sum(2**10**7)                 # no str() limit, about a second
+    decimal_string(math.factorial(100000))          # 456574 digits
+"""
+import decimal
+import functools
+import math
+import sys
+from array import array
+
+from euler.optional import numpy
+
+CHUNK_DIGITS = 4
+CHUNK = 10 ** CHUNK_DIGITS
+
+SIGNATURE_BITS = 6
+_SIGNATURE_MASK = (1 << SIGNATURE_BITS) - 1
+
+# Numbers with more bits than this go through a decimal string instead.
+_STRING_BITS = 160
+
+# Below this range length the pure-Python pass beats importing numpy.
+_NUMPY_THRESHOLD = 1 << 16
+
+# decimal_string: leaves of this many bits are converted directly; numbers up
+# to _DECIMAL_BITS (about 4200 digits) are left to str() when it accepts them.
+DECIMAL_LEAF_BITS = 1024
+_DECIMAL_BITS = 14000
+
+
+@functools.cache
+def _sum_table():
+    table = bytearray(CHUNK)
+    for i in range(1, CHUNK):
+        table[i] = table[i // 10] + i % 10
+    return bytes(table)
+
+
+@functools.cache
+def _power_table(power):
+    if power < 1:
+        raise ValueError("power must be at least 1")
+    table = [0] * CHUNK
+    powers = [d ** power for d in range(10)]
+    for i in range(1, CHUNK):
+        table[i] = table[i // 10] + powers[i % 10]
+    return table
+
+
+@functools.cache
+def _signature_tables():
+    """(full, top): signatures of chunks with and without leading zeros."""
+    top = [0] * CHUNK
+    top[0] = 1  # the number 0 has one digit, a zero
+    for i in range(1, CHUNK):
+        top[i] = (top[i // 10] if i >= 10 else 0) + (1 << (SIGNATURE_BITS * (i % 10)))
+    length = _length_table()
+    full = [top[i] + (CHUNK_DIGITS - length[i]) for i in range(CHUNK)]
+    return full, top
+
+
+@functools.cache
+def _length_table():
+    table = bytearray(CHUNK)
+    table[0] = 1
+    for i in range(1, CHUNK):
+        table[i] = table[i // 10] + 1 if i >= 10 else 1
+    return bytes(table)
+
+
+@functools.cache
+def _reverse_table():
+    table = [0] * CHUNK
+    length = _length_table()
+    for i in range(1, CHUNK):
+        table[i] = (i % 10) * 10 ** (length[i] - 1) + table[i // 10]
+    return table
+
+
+@functools.cache
+def _decimal_power(level):
+    """2**(DECIMAL_LEAF_BITS * 2**level) as a Decimal (needs the exact context)."""
+    if level == 0:
+        return decimal.Decimal(1 << DECIMAL_LEAF_BITS)
+    half = _decimal_power(level - 1)
+    return half * half
+
+
+def _to_decimal(n, level):
+    """Converts 0 <= n < 2**(DECIMAL_LEAF_BITS * 2**(level + 1)) to a Decimal."""
+    if n.bit_length() <= DECIMAL_LEAF_BITS:
+        return decimal.Decimal(n)
+    width = DECIMAL_LEAF_BITS << level
+    high = n >> width
+    low = n & ((1 << width) - 1)
+    return _to_decimal(high, level - 1) * _decimal_power(level) + _to_decimal(low, level - 1)
+
+
+def decimal_string(n):
+    """
+    str(n) for an int n >= 0, in subquadratic time and without the
+    sys.get_int_max_str_digits() limit.
+    """
+    bits = n.bit_length()
+    limit = sys.get_int_max_str_digits()
+    if bits <= _DECIMAL_BITS and (not limit or bits * math.log10(2) < limit - 1):
+        return str(n)
+    level = 0
+    while bits > DECIMAL_LEAF_BITS << (level + 1):
+        level += 1
+    with decimal.localcontext() as context:
+        context.prec = decimal.MAX_PREC
+        context.Emax = decimal.MAX_EMAX
+        context.Emin = decimal.MIN_EMIN
+        context.traps[decimal.Inexact] = True
+        return str(_to_decimal(n, level))
+
+
+def digit_sum(n):
+    """Sum of the decimal digits of n >= 0."""
+    if n.bit_length() > _STRING_BITS:
+        s = decimal_string(n)
+        return sum(d * s.count(c) for d, c in enumerate("0123456789") if d)
+    table = _sum_table()
+    total = 0
+    while n >= CHUNK:
+        n, low = divmod(n, CHUNK)
+        total += table[low]
+    return total + table[n]
+
+
+def digit_power_sum(n, power):
+    """Sum of d**power over the decimal digits d of n >= 0 (power >= 1)."""
+    table = _power_table(power)
+    if n.bit_length() > _STRING_BITS:
+        s = decimal_string(n)
+        return sum(d ** power * s.count(c) for d, c in enumerate("0123456789") if d)
+    total = 0
+    while n >= CHUNK:
+        n, low = divmod(n, CHUNK)
+        total += table[low]
+    return total + table[n]
+
+
+def digit_signature(n):
+    """
+    The multiset of decimal digits of n >= 0, packed into an int.
+
+    Digit d's count occupies bits SIGNATURE_BITS*d and up.
+    """
+    if n.bit_length() > _STRING_BITS:
+        s = decimal_string(n)
+        counts = [s.count(c) for c in "0123456789"]
+        if max(counts) > _SIGNATURE_MASK:
+            raise ValueError(f"a digit occurs more than {_SIGNATURE_MASK} times")
+        return sum(count << (SIGNATURE_BITS * d) for d, count in enumerate(counts))
+    full, top = _signature_tables()
+    signature = 0
+    while n >= CHUNK:
+        n, low = divmod(n, CHUNK)
+        signature += full[low]
+    return signature + top[n]
+
+
+def digit_counts(signature):
+    """Unpacks a signature into the list of counts of the digits 0..9."""
+    return [(signature >> (SIGNATURE_BITS * d)) & _SIGNATURE_MASK for d in range(10)]
+
+
+def num_digits(n):
+    """Number of decimal digits of n >= 0 (1 for 0)."""
+    if n.bit_length() > _STRING_BITS:
+        # floor(log10(n)) + 1, unless n is too close to a power of ten 10**k
+        # for the float to tell (log10 may round to k from either side), in
+        # which case one exact comparison decides.
+        estimate = math.log10(n)
+        k = round(estimate)
+        if abs(estimate - k) > 1e-12 * estimate:
+            return int(estimate) + 1
+        return k + 1 if n >= 10 ** k else k
+    count = 0
+    while n >= CHUNK:
+        n //= CHUNK
+        count += CHUNK_DIGITS
+    return count + _length_table()[n]
+
+
+def reverse_digits(n, base=10):
+    """The number whose base-`base` digits are those of n >= 0 reversed (1200 -> 21)."""
+    if base != 10:
+        reversed_n = 0
+        while n:
+            n, digit = divmod(n, base)
+            reversed_n = reversed_n * base + digit
+        return reversed_n
+    # Past one chunk, slicing the decimal string beats combining table entries.
+    if n < CHUNK:
+        return _reverse_table()[n]
+    return int(str(n)[::-1])
+
+
+def is_palindrome(n, base=10):
+    """True if n >= 0 reads the same in both directions in the given base."""
+    if base == 10:
+        s = str(n)
+    elif base == 2:
+        s = format(n, 'b')
+    else:
+        return n == reverse_digits(n, base)
+    return s == s[::-1]
+
+
+def palindromes(stop, base=10):
+    """Yields the positive palindromes below `stop` in the given base, ascending."""
+    length = 1
+    while True:
+        half = (length + 1) // 2
+        shift = base ** (length - half)
+        for first_half in range(base ** (half - 1), base ** half):
+            # Mirror the first half, without its last digit for odd lengths.
+            mirrored = first_half // base if length % 2 else first_half
+            value = first_half * shift + reverse_digits(mirrored, base)
+            if value >= stop:
+                return
+            yield value
+        length += 1
+
+
+def _range_table(start, stop, table, typecode, top=None, use_numpy=None):
+    """
+    Sums table[chunk] over the base-10**4 chunks of every n in start..stop-1.
+
+    `top` (if given) replaces `table` for the most significant chunk.
+    """
+    size = max(0, stop - start)
+    if use_numpy is None:
+        use_numpy = size >= _NUMPY_THRESHOLD and numpy() is not None
+    if use_numpy:
+        np = numpy()
+        values = np.arange(start, stop, dtype=np.int64)
+        lookup = np.fromiter(table, dtype=np.int64, count=CHUNK)
+        top_lookup = lookup if top is None else np.fromiter(top, dtype=np.int64, count=CHUNK)
+        result = np.zeros(size, dtype=np.int64)
+        # Indices of the numbers that still have more than one chunk left.
+        active = np.arange(size)
+        while active.size:
+            high, low = np.divmod(values[active], CHUNK)
+            last = high == 0
+            result[active] += np.where(last, top_lookup[low], lookup[low])
+            values[active] = high
+            active = active[~last]
+        return array(typecode, result.tobytes())
+    top = table if top is None else top
+    result = array(typecode, bytes(size * array(typecode).itemsize))
+    for i, n in enumerate(range(start, stop)):
+        total = 0
+        while n >= CHUNK:
+            n, low = divmod(n, CHUNK)
+            total += table[low]
+        result[i] = total + top[n]
+    return result
+
+
+def digit_sums(start, stop, use_numpy=None):
+    """array('q') of digit_sum(n) for start <= n < stop (0 <= start)."""
+    return _range_table(start, stop, _sum_table(), 'q', use_numpy=use_numpy)
+
+
+def digit_power_sums(start, stop, power, use_numpy=None):
+    """array('q') of digit_power_sum(n, power) for start <= n < stop."""
+    return _range_table(start, stop, _power_table(power), 'q', use_numpy=use_numpy)
+
+
+def digit_signatures(start, stop, use_numpy=None):
+    """array('q') of digit_signature(n) for start <= n < stop (stop <= 10**18)."""
+    full, top = _signature_tables()
+    return _range_table(start, stop, full, 'q', top=top, use_numpy=use_numpy)
@@ -0,0 +1,329 @@
+"""
+Cached loader for the input files in resources/documents/.
+
+Idea:
+The text files are parsed once into a compact binary form that is stored in
+the cache directory (see `euler.paths`) and memory-mapped on later loads, so
+no script splits, strips and int()s the same tokens on every run:
+    words     '"MARY","PATRICIA",...'  -> newline-joined UTF-8 bytes
+    lines     one item per line        -> newline-joined UTF-8 bytes
+    ints      rows of integers         -> int64 row offsets + int64 values
+A cache file is named after the document, the kind, the source's size and
+modification time and the format version, so editing a document makes its
+old cache file unused (it is removed when the new one is written). Nothing
+is ever written into resources/. If the cache directory cannot be written,
+the document is parsed directly.
+
+The integers of a row may be separated by commas and/or whitespace (extra
+separators at the start or end of a line are ignored), and rows may differ
+in length (067's triangle). int_matrix() and int_array() map a
+rectangular file straight into a flat memoryview or a read-only numpy array
+without copying.
+
+Integer documents of a megabyte or more are parsed with numpy when it is
+installed: the file is read in 4 MB chunks of whole lines, each chunk is
+split into tokens and converted with whole-array operations, and the values
+are written out as they come, so neither the text nor the values are ever
+held in memory whole. That parses a 470 MB matrix in about 13 s (the
+line-by-line parser needs about a minute). stream_int_rows() runs the same
+chunked parser but hands the rows out instead of caching them, for
+documents too large to keep even in binary form.
+
+Usage:
+    words("0022_names.txt")             # ['MARY', 'PATRICIA', ...]
+    lines("0054_poker.txt")             # ['8C TS KC 9H 4S 7D 2S 5D 3S AC', ...]
+    int_rows("0067_triangle.txt")       # [[59], [73, 41], ...], fresh lists
+    stream_int_rows("0067_triangle.txt")    # the same rows one at a time, no cache
+    int_matrix("0081_matrix.txt")       # (80, 80, int64 memoryview, row-major)
+    int_array("0081_matrix.txt")        # 80x80 int64 ndarray (needs numpy)
+"""
+import functools
+import io
+import itertools
+import mmap
+import os
+import re
+import shutil
+import struct
+import tempfile
+from array import array
+
+from euler.optional import numpy, require_numpy
+from euler.paths import cache_dir, document_path
+
+_MAGIC = b"EDC2"
+# magic, padding, number of rows, number of values: 24 bytes, so the int64
+# offsets and values after it are 8-byte aligned in the mapping (numpy runs
+# its fast loops only on aligned buffers).
+_HEADER = struct.Struct("<4s4xqq")
+# Part of every cache file name; raised when the binary forms change, so
+# files in an older format are never opened (and get replaced).
+_FORMAT = 2
+_SEPARATOR = re.compile(rb"[,\s]+")
+
+# Integer documents of at least this many bytes are parsed with numpy, in
+# chunks of about _CHUNK_BYTES.
+_BULK_PARSE_BYTES = 1 << 20
+_CHUNK_BYTES = 1 << 22
+
+
+def _source_key(name):
+    """(path, size, mtime_ns) of a document; FileNotFoundError if it is missing."""
+    path = document_path(name)
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _parse_words(source, out):
+    data = _read(source)
+    out.write(b"\n".join(word.strip().strip(b'"') for word in data.split(b",")))
+
+
+def _parse_lines(source, out):
+    data = _read(source)
+    out.write(b"\n".join(line.strip() for line in data.splitlines() if line.strip()))
+
+
+def _int_lines(data):
+    """(row lengths, values) of the non-blank lines of data, as array('q')s."""
+    lengths = array('q')
+    values = array('q')
+    for line in data.splitlines():
+        # Separators at either end of a line (e.g. a trailing comma) are
+        # ignored, as in _ints_from_bytes.
+        tokens = [token for token in _SEPARATOR.split(line) if token]
+        if tokens:
+            values.extend(map(int, tokens))
+            lengths.append(len(tokens))
+    return lengths, values
+
+
+def _parse_ints(source, out):
+    if os.path.getsize(source) >= _BULK_PARSE_BYTES and numpy() is not None:
+        _parse_ints_numpy(source, out)
+        return
+    lengths, values = _int_lines(_read(source))
+    offsets = array('q', [0])
+    offsets.extend(itertools.accumulate(lengths))
+    out.write(_HEADER.pack(_MAGIC, len(lengths), len(values)))
+    out.write(offsets.tobytes())
+    out.write(values.tobytes())
+
+
+def _parse_ints_numpy(source, out):
+    """
+    _parse_ints for large files: the source is read in chunks of whole lines,
+    each parsed by _ints_from_bytes. The values wait in a spill file until
+    the row count, which precedes them in the binary form, is known, so
+    memory stays O(chunk + rows).
+    """
+    np = numpy()
+    lengths = []
+    with open(source, 'rb') as f, tempfile.TemporaryFile() as spill:
+        for chunk in _line_chunks(f):
+            chunk_lengths, values = _ints_from_bytes(np, chunk)
+            lengths.append(chunk_lengths)
+            spill.write(values.tobytes())
+        lengths = np.concatenate(lengths) if lengths else np.zeros(0, dtype=np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        out.write(_HEADER.pack(_MAGIC, len(lengths), int(offsets[-1])))
+        out.write(offsets.tobytes())
+        spill.seek(0)
+        shutil.copyfileobj(spill, out, _CHUNK_BYTES)
+
+
+def _line_chunks(f, size=_CHUNK_BYTES):
+    """Yields the contents of a binary file in pieces of about size bytes,
+    each ending at a line break (the last one may not)."""
+    rest = b""
+    while True:
+        block = f.read(size)
+        if not block:
+            if rest:
+                yield rest
+            return
+        block = rest + block
+        cut = block.rfind(b"\n") + 1
+        if cut:
+            yield block[:cut]
+            rest = block[cut:]
+        else:
+            rest = block
+
+
+def _ints_from_bytes(np, data):
+    """
+    (row lengths, values) of the non-blank lines of data as int64 arrays,
+    parsed with whole-array operations. Tokens are runs of digits with an
+    optional leading '-'; their values are summed up one digit place at a
+    time, from the last digit of every token to the first. Data with
+    anything else in it (other characters, numbers past 18 digits) goes to
+    the line-by-line parser, which raises as usual.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # 0: other, 1: separator (\t \n \v \f \r, space, comma), 2: digit, 3: '-'
+    classes = np.zeros(256, dtype=np.uint8)
+    classes[[9, 10, 11, 12, 13, 32, 44]] = 1
+    classes[48:58] = 2
+    classes[45] = 3
+    kinds = classes[buf]
+    edges = np.diff((kinds >= 2).view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    negative = buf[starts] == 45
+    digits = ends - starts - negative
+    most = int(digits.max(initial=0))
+    if (not kinds.all() or np.count_nonzero(kinds == 3) != np.count_nonzero(negative)
+            or (digits == 0).any() or most > 18):
+        lengths, values = _int_lines(data)
+        return np.frombuffer(lengths, dtype=np.int64), np.frombuffer(values, dtype=np.int64)
+    values = np.zeros(len(starts), dtype=np.int64)
+    shortest = int(digits.min(initial=0))
+    for place in range(most):
+        digit = buf[ends - 1 - place].astype(np.int64) - 48
+        if place >= shortest:
+            digit[digits <= place] = 0
+        values += digit * 10 ** place
+    values[negative] *= -1
+    # Like bytes.splitlines(), break lines at \n, \r\n and a lone \r.
+    breaks = np.flatnonzero(buf == 10)
+    returns = np.flatnonzero(buf == 13)
+    if len(returns):
+        following = buf[np.minimum(returns + 1, len(buf) - 1)]
+        lone = (following != 10) | (returns == len(buf) - 1)
+        breaks = np.union1d(breaks, returns[lone])
+    lengths = np.bincount(np.searchsorted(breaks, starts))
+    return lengths[lengths > 0], values
+
+
+_PARSERS = {"words": _parse_words, "lines": _parse_lines, "ints": _parse_ints}
+
+
+def _write_cache(directory, prefix, path, write):
+    """Creates a cache file atomically; write(f) fills it."""
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # Forms built from earlier versions of the document are never read again.
+    for other in os.listdir(directory):
+        if other.startswith(prefix) and os.path.join(directory, other) != path:
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass
+
+
+@functools.lru_cache(maxsize=None)
+def _load(source, size, mtime_ns, kind):
+    """Returns the binary form of a document: an mmap, or bytes as a fallback."""
+    name = os.path.basename(source)
+    parse = functools.partial(_PARSERS[kind], source)
+    try:
+        directory = cache_dir("documents")
+        prefix = f"{name}.{kind}."
+        path = os.path.join(directory, f"{prefix}{size}-{mtime_ns}.v{_FORMAT}.bin")
+        if not os.path.exists(path):
+            _write_cache(directory, prefix, path, parse)
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        if not os.path.exists(source):
+            raise
+        buffer = io.BytesIO()
+        parse(buffer)
+        return buffer.getvalue()
+
+
+def _binary(name, kind):
+    return _load(*_source_key(name), kind)
+
+
+def _split_text(data):
+    return bytes(data).decode().split("\n") if len(data) else []
+
+
+def words(name):
+    """The quoted, comma-separated words of a document, as a new list of str."""
+    return _split_text(_binary(name, "words"))
+
+
+def lines(name):
+    """The non-blank lines of a document, stripped, as a new list of str."""
+    return _split_text(_binary(name, "lines"))
+
+
+def _int_views(name):
+    """(row offsets, values) as int64 memoryviews of the cached form."""
+    data = memoryview(_binary(name, "ints"))
+    magic, rows, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(f"corrupt cache file for {name}")
+    start = _HEADER.size
+    offsets = data[start:start + 8 * (rows + 1)].cast('q')
+    values = data[start + 8 * (rows + 1):start + 8 * (rows + 1 + count)].cast('q')
+    return offsets, values
+
+
+def int_rows(name):
+    """The integers of each line of a document, as new lists (safe to modify)."""
+    offsets, values = _int_views(name)
+    return [values[offsets[i]:offsets[i + 1]].tolist() for i in range(len(offsets) - 1)]
+
+
+def stream_int_rows(name):
+    """
+    Yields the integers of each non-blank line of a document, top to bottom,
+    reading the source in chunks and without a cache file, so memory stays
+    O(chunk + longest row) however long the document is.
+
+    Rows are int64 numpy arrays for documents parsed with numpy (see above),
+    otherwise lists.
+    """
+    path = document_path(name)
+    np = numpy() if os.path.getsize(path) >= _BULK_PARSE_BYTES else None
+    with open(path, 'rb') as f:
+        for chunk in _line_chunks(f):
+            if np is not None:
+                lengths, values = _ints_from_bytes(np, chunk)
+                # A chunk of blank lines has no rows (np.split would give one empty row).
+                if len(lengths):
+                    yield from np.split(values, np.cumsum(lengths)[:-1])
+                continue
+            lengths, values = _int_lines(chunk)
+            start = 0
+            for length in lengths:
+                yield values[start:start + length].tolist()
+                start += length
+
+
+def int_matrix(name):
+    """
+    A rectangular document as (rows, cols, values), where values is a
+    read-only int64 memoryview of the cached form in row-major order.
+    """
+    offsets, values = _int_views(name)
+    rows = len(offsets) - 1
+    width = offsets[1] if rows else 0
+    if any(offsets[i + 1] - offsets[i] != width for i in range(rows)):
+        raise ValueError(f"{name} is not rectangular")
+    return rows, width, values
+
+
+def int_array(name):
+    """A rectangular document as a read-only 2-D int64 numpy array (no copy)."""
+    np = require_numpy("int_array")
+    rows, width, values = int_matrix(name)
+    return np.frombuffer(values, dtype=np.int64).reshape(rows, width)
@@ -0,0 +1,137 @@
+"""
+Polygonal (figurate) numbers: generation, membership and range queries.
+
+Idea:
+The n-th s-gonal number is P(s, n) = ((s-2) n^2 - (s-4) n) / 2. Solving for n
+gives
+    n = ((s-4) + sqrt(8 (s-2) x + (s-4)^2)) / (2 (s-2)),
+so x is s-gonal exactly when the discriminant 8 (s-2) x + (s-4)^2 is a
+perfect square r^2 and r + s - 4 is divisible by 2 (s-2). One isqrt answers
+the membership test for any x, so no set of precomputed numbers (and no cap
+on its size) is needed. The same root rounded down is the number of s-gonal
+numbers <= x, which turns range queries into index arithmetic.
+
+For numpy integer arrays is_polygonal() works element-wise: the root is taken
+in float64 and corrected by one step either way, which is exact while the
+discriminant fits in int64.
+
+prefix_index() groups the s-gonal numbers of a fixed length by their leading
+half (e.g. 2821 under 28), for chains where the end of one number must be
+the start of the next.
+
+Usage:
+    polygonal(5, 4)                     # 22
+    is_polygonal(3, 55)                 # True
+    polygonal_index(6, 40755)           # 143
+    list(polygonals(8, 1000, 1500))     # [1045, 1160, 1281, 1408]
+    count_polygonals(3, 1, 10**18)      # 1414213561
+    prefix_index(8)[28]                 # [2821]
+    is_polygonal(5, numpy_array)        # numpy bool array
+    is_pentagonal = polygonal_tester(5)  # fast scalar test for hot loops
+"""
+import math
+
+from euler.optional import is_ndarray, numpy
+
+
+def _check_sides(s):
+    if s < 3:
+        raise ValueError(f"s must be at least 3, got {s}")
+
+
+def polygonal(s, n):
+    """The n-th s-gonal number."""
+    return ((s - 2) * n * n - (s - 4) * n) // 2
+
+
+def polygonal_root(s, x):
+    """The largest n >= 0 with polygonal(s, n) <= x."""
+    _check_sides(s)
+    if x < 1:
+        return 0
+    root = math.isqrt(8 * (s - 2) * x + (s - 4) ** 2)
+    return (root + s - 4) // (2 * (s - 2))
+
+
+def polygonal_index(s, x):
+    """n if x is the n-th s-gonal number (n >= 1), otherwise 0."""
+    _check_sides(s)
+    if x < 1:
+        return 0
+    discriminant = 8 * (s - 2) * x + (s - 4) ** 2
+    root = math.isqrt(discriminant)
+    if root * root != discriminant:
+        return 0
+    n, rest = divmod(root + s - 4, 2 * (s - 2))
+    return 0 if rest else n
+
+
+def is_polygonal(s, x):
+    """
+    True if x is an s-gonal number.
+
+    A numpy integer array gives a numpy bool array of the same shape.
+    """
+    if is_ndarray(x):
+        return _is_polygonal_array(s, x)
+    return polygonal_index(s, x) != 0
+
+
+def polygonal_tester(s):
+    """
+    A scalar-only is_polygonal(s, x) with the constants for s folded in,
+    for hot loops over Python ints (no type or argument checks per call).
+    """
+    _check_sides(s)
+    scale, shift, divisor = 8 * (s - 2), (s - 4) ** 2, 2 * (s - 2)
+    offset = s - 4
+    isqrt = math.isqrt
+
+    def test(x):
+        if x < 1:
+            return False
+        discriminant = scale * x + shift
+        root = isqrt(discriminant)
+        return root * root == discriminant and (root + offset) % divisor == 0
+
+    return test
+
+
+def _is_polygonal_array(s, values):
+    _check_sides(s)
+    np = numpy()
+    values = values.astype(np.int64, copy=False)
+    discriminant = 8 * (s - 2) * values + (s - 4) ** 2
+    root = np.sqrt(np.maximum(discriminant, 0).astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+    return (values >= 1) & (root * root == discriminant) & ((root + s - 4) % (2 * (s - 2)) == 0)
+
+
+def count_polygonals(s, start, stop):
+    """The number of s-gonal numbers x with start <= x < stop."""
+    return max(0, polygonal_root(s, stop - 1) - polygonal_root(s, start - 1))
+
+
+def polygonals(s, start, stop):
+    """Yields the s-gonal numbers x with start <= x < stop in increasing order."""
+    n = polygonal_root(s, start - 1) + 1
+    x = polygonal(s, n)
+    while x < stop:
+        yield x
+        n += 1
+        x = polygonal(s, n)
+
+
+def prefix_index(s, digits=4):
+    """
+    The s-gonal numbers with `digits` digits, grouped by their leading half.
+
+    Returns a dict mapping the first digits // 2 digits (as an int) to the
+    increasing list of numbers that start with them.
+    """
+    split = 10 ** (digits - digits // 2)
+    index = {}
+    for x in polygonals(s, 10 ** (digits - 1), 10 ** digits):
+        index.setdefault(x // split, []).append(x)
+    return index
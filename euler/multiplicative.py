@@ -0,0 +1,172 @@
+"""
+One-pass sieve for the classic multiplicative functions.
+
+Functions:
+    sigma   sum of divisors             array('q')
+    sigma0  number of divisors, d(n)    array('H')
+    phi     Euler's totient             array('I')
+    omega   distinct prime factors      array('B')
+    mu      Moebius function            array('b')
+
+Idea:
+Every n >= 2 is written as n = p * m with p = spf[n], its smallest prime
+factor (from `euler.factor.FactorTable`). Whether p still divides m decides
+how each function extends from m to n:
+    phi(n)   = phi(m) * p          if p | m, else phi(m) * (p - 1)
+    omega(n) = omega(m)            if p | m, else omega(m) + 1
+    mu(n)    = 0                   if p | m, else -mu(m)
+sigma and sigma0 also track the full power p^e dividing n and the cofactor
+r = n / p^e, and multiply: sigma(n) = sigma(r) * sigma(p^e).
+
+All requested functions are filled in the same pass over n. Without numpy the
+pass is a plain loop. With numpy, the numbers are grouped by their count of
+prime factors (with multiplicity). m always belongs to an earlier group than n,
+so each group is filled by one vectorized step, and about log2(limit) steps
+cover the whole table.
+
+Usage:
+    tables = multiplicative_tables(10**6, ("phi", "sigma"))
+    tables["phi"][36]      # 12
+    tables["sigma"][28]    # 56
+"""
+from array import array
+
+from euler.factor import FactorTable
+from euler.optional import numpy
+
+FUNCTIONS = ("sigma", "sigma0", "phi", "omega", "mu")
+
+_TYPECODES = {"sigma": 'q', "sigma0": 'H', "phi": 'I', "omega": 'B', "mu": 'b'}
+
+# Below this limit the pure-Python pass beats importing numpy.
+_NUMPY_THRESHOLD = 1 << 18
+
+
+def multiplicative_tables(limit, functions=FUNCTIONS, factor_table=None, use_numpy=None):
+    """
+    Returns {name: table} for each requested function, indexed 0..limit.
+
+    Entry 0 of every table is 0. Pass `factor_table` to reuse an existing
+    FactorTable of at least `limit`. `use_numpy` forces the backend; by
+    default numpy is used for large limits when it is installed.
+    """
+    functions = tuple(functions)
+    unknown = set(functions) - set(FUNCTIONS)
+    if unknown:
+        raise ValueError(f"unknown functions: {sorted(unknown)}")
+    if factor_table is None or factor_table.limit < limit:
+        factor_table = FactorTable(limit)
+
+    if use_numpy is None:
+        use_numpy = limit >= _NUMPY_THRESHOLD and numpy() is not None
+    if use_numpy:
+        return _numpy_tables(limit, functions, factor_table)
+    return _python_tables(limit, functions, factor_table)
+
+
+def _python_tables(limit, functions, factor_table):
+    spf = factor_table.spf
+    size = limit + 1
+    tables = {name: array(_TYPECODES[name], bytes(size * array(_TYPECODES[name]).itemsize))
+              for name in functions}
+    sigma = tables.get("sigma")
+    sigma0 = tables.get("sigma0")
+    phi = tables.get("phi")
+    omega = tables.get("omega")
+    mu = tables.get("mu")
+    powers = sigma is not None or sigma0 is not None
+    if powers:
+        # rest[n] = n / p^e, power_sigma[n] = sigma(p^e), power_count[n] = e + 1
+        rest = array('I', bytes(4 * size))
+        power_sigma = array('q', bytes(8 * size))
+        power_count = array('B', bytes(size))
+    if size > 1:
+        for table in tables.values():
+            table[1] = 0 if table is omega else 1
+        if powers:
+            rest[1] = power_sigma[1] = power_count[1] = 1
+
+    for n in range(2, size):
+        p = spf[n]
+        m = n // p
+        if spf[m] == p:
+            if phi is not None:
+                phi[n] = phi[m] * p
+            if omega is not None:
+                omega[n] = omega[m]
+            if powers:
+                r = rest[n] = rest[m]
+                power_sigma[n] = power_sigma[m] * p + 1
+                power_count[n] = power_count[m] + 1
+        else:
+            if phi is not None:
+                phi[n] = phi[m] * (p - 1)
+            if omega is not None:
+                omega[n] = omega[m] + 1
+            if mu is not None:
+                mu[n] = -mu[m]
+            if powers:
+                r = rest[n] = m
+                power_sigma[n] = p + 1
+                power_count[n] = 2
+        if sigma is not None:
+            sigma[n] = sigma[r] * power_sigma[n]
+        if sigma0 is not None:
+            sigma0[n] = sigma0[r] * power_count[n]
+    return tables
+
+
+def _numpy_tables(limit, functions, factor_table):
+    np = numpy()
+    size = limit + 1
+    spf = factor_table.as_numpy().astype(np.int64)
+    dtypes = {"sigma": np.int64, "sigma0": np.uint16, "phi": np.uint32,
+              "omega": np.uint8, "mu": np.int8}
+    # int64 work arrays; converted to the compact types at the end.
+    work = {name: np.zeros(size, dtype=np.int64) for name in functions}
+    powers = "sigma" in work or "sigma0" in work
+    if powers:
+        rest = np.zeros(size, dtype=np.int64)
+        power_sigma = np.zeros(size, dtype=np.int64)
+        power_count = np.zeros(size, dtype=np.int64)
+    if size > 1:
+        for name, table in work.items():
+            table[1] = 0 if name == "omega" else 1
+        if powers:
+            rest[1] = power_sigma[1] = power_count[1] = 1
+
+    # Group 2..limit by the number of prime factors counted with multiplicity.
+    numbers = np.arange(2, size, dtype=np.int64)
+    factor_count = np.zeros(numbers.size, dtype=np.int64)
+    remaining = numbers.copy()
+    while True:
+        active = np.flatnonzero(remaining > 1)
+        if not active.size:
+            break
+        factor_count[active] += 1
+        remaining[active] //= spf[remaining[active]]
+    order = numbers[np.argsort(factor_count, kind='stable')]
+    bounds = np.cumsum(np.bincount(factor_count))
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        n = order[start:stop]
+        p = spf[n]
+        m = n // p
+        same = spf[m] == p
+        if "phi" in work:
+            work["phi"][n] = work["phi"][m] * np.where(same, p, p - 1)
+        if "omega" in work:
+            work["omega"][n] = work["omega"][m] + ~same
+        if "mu" in work:
+            work["mu"][n] = np.where(same, 0, -work["mu"][m])
+        if powers:
+            r = rest[n] = np.where(same, rest[m], m)
+            power_sigma[n] = np.where(same, power_sigma[m] * p + 1, p + 1)
+            power_count[n] = np.where(same, power_count[m] + 1, 2)
+            if "sigma" in work:
+                work["sigma"][n] = work["sigma"][r] * power_sigma[n]
+            if "sigma0" in work:
+                work["sigma0"][n] = work["sigma0"][r] * power_count[n]
+
+    return {name: array(_TYPECODES[name], table.astype(dtypes[name]).tobytes())
+            for name, table in work.items()}
@@ -0,0 +1,45 @@
+"""
+Optional third-party dependencies.
+
+numpy speeds up some helpers but is never required. Importing it takes about
+0.1 s, more than many of the scripts need for their whole run, so it is only
+imported the first time a helper actually asks for it. matplotlib is only
+used to draw benchmark plots.
+"""
+import functools
+import importlib
+import sys
+
+
+@functools.cache
+def numpy():
+    """Returns the numpy module, or None if it is not installed."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+@functools.cache
+def pyplot():
+    """Returns matplotlib.pyplot on a file-only backend, or None if missing."""
+    try:
+        matplotlib = importlib.import_module("matplotlib")
+    except ImportError:
+        return None
+    matplotlib.use("Agg")
+    return importlib.import_module("matplotlib.pyplot")
+
+
+def require_numpy(feature):
+    """Returns the numpy module, or raises ImportError naming `feature`."""
+    np = numpy()
+    if np is None:
+        raise ImportError(f"{feature} requires numpy")
+    return np
+
+
+def is_ndarray(obj):
+    """True if obj is a numpy array. Never imports numpy by itself."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
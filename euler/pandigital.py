@@ -0,0 +1,72 @@
+"""
+Pandigital numbers whose digit windows are divisible by given divisors
+(043's sub-string divisibility, in any base).
+
+Idea:
+In base b a pandigital number uses each digit 0..b-1 exactly once, with no
+leading zero. The property asks that the window of `width` digits starting
+at digit i + 2 (counting from 1 on the left) is divisible by divisors[i]:
+for 043, d2d3d4 by 2, d3d4d5 by 3, ..., d8d9d10 by 17.
+
+Instead of testing all b! digit orders, the numbers are built from the
+right, one digit at a time. The digit placed at position i completes the
+window starting there, so each partial number is checked as soon as a
+constraint applies to it and dropped otherwise. Going right to left meets
+the largest divisors, which prune most, first. In base 10 at most a few
+hundred partial numbers survive each step, against 3,628,800 permutations
+for the brute force (4 ms against 3.4 s). Digits after the last window are
+unconstrained, so with few divisors the result itself grows factorially.
+
+Usage:
+    sum(substring_divisible_pandigitals())          # 16695334890 (043)
+    substring_divisible_pandigitals()[0]            # 1406357289
+    substring_divisible_pandigitals(base=12)        # [] -- none with the first 9 primes
+    len(substring_divisible_pandigitals(12, first_primes(7)))                # 432
+    len(substring_divisible_pandigitals(16, first_primes(11)))               # 60, in 0.2 s
+"""
+import itertools
+
+from euler.primality import is_prime
+
+
+def first_primes(count):
+    """The first `count` primes."""
+    return list(itertools.islice(filter(is_prime, itertools.count(2)), count))
+
+
+def substring_divisible_pandigitals(base=10, divisors=None, width=3):
+    """
+    Increasing list of the base-`base` pandigital numbers whose window of
+    `width` digits starting at digit i + 2 is divisible by divisors[i].
+
+    By default divisors are the first base - width primes, one per window
+    from the second digit to the end (043 for base 10).
+    """
+    if width < 1 or width > base:
+        raise ValueError(f"width must be between 1 and the base, got {width}")
+    if divisors is None:
+        divisors = first_primes(base - width)
+    if len(divisors) > base - width:
+        raise ValueError(f"at most {base - width} windows fit after the first digit, got {len(divisors)}")
+    # The divisor of the window starting at each position (1 is the leftmost).
+    window_divisors = {position: divisor for position, divisor in enumerate(divisors, 2)}
+    top = base ** (width - 1)
+    # (value, bitmask of used digits) of every valid right part placed so far.
+    states = [(0, 0)]
+    for position in range(base, 0, -1):
+        placed = base - position
+        scale = base ** placed
+        divisor = window_divisors.get(position)
+        # The first width - 1 placed digits complete the window with the new digit.
+        shift = base ** (placed - width + 1) if divisor else 1
+        extended = []
+        for value, used in states:
+            head = value // shift
+            for digit in range(1 if position == 1 else 0, base):
+                if used >> digit & 1:
+                    continue
+                if divisor and (digit * top + head) % divisor:
+                    continue
+                extended.append((digit * scale + value, used | 1 << digit))
+        states = extended
+    return sorted(value for value, _ in states)
@@ -0,0 +1,371 @@
+"""
+Minimal and maximal path sums through cost grids and number triangles.
+
+Idea:
+CostGrid stores a rows x cols grid of non-negative integer costs row-major
+in one contiguous int64 buffer: an array('q'), or for a grid loaded with
+from_document() the memory-mapped cache file of the document itself, so a
+large matrix is paged in from disk as it is scanned rather than loaded
+whole. as_numpy() views the same memory as a 2-D int64 array. A path's cost
+is the sum of the cells it visits, start and end included.
+
+When the moves are monotone the cells can be filled in order, and a whole
+row (or column) at once. Within a row, moving right only adds the cells
+passed, so with the inclusive prefix sums S of the row
+    best[j] = min over k <= j of (from_above[k] - S[k]) + S[j],
+a running minimum (np.minimum.accumulate) over the row. The same scan, once
+in each direction, relaxes a column against moves up and down. Each row or
+column is then a handful of vectorized operations:
+    min_path_right_down    moves right and down (corner to corner)
+    min_path_three_way     moves up, down and right (left column to right)
+min_path_three_way copies the columns out of the row-major buffer in blocks
+of about _BLOCK_CELLS cells, so memory stays O(rows * block) and each row is
+read in pieces rather than one strided element per column. A 10**4 x 10**4
+matrix (800 MB of cells, 470 MB of text) takes about 3 s once the document's
+cache file exists; building that with the chunked numpy parser of
+euler.documents adds about 14 s (python -m benchmarks.path_bench --three-way).
+Without numpy the same recurrences run as plain loops.
+
+With moves in all four directions (min_path_four_way) there is no fill order,
+so Dijkstra's algorithm runs over flat cell indices: neighbours are i +- 1 and
+i +- cols and the distances live in one flat list. Cell costs are small
+non-negative integers, so the default queue is Dial's bucket queue: a ring of
+max_cost + 1 lists, where bucket d % (max_cost + 1) holds the cells at
+distance d. Every queued distance lies within max_cost of the one being
+popped, so the ring never mixes two distances, and pushing is a list append.
+The empty buckets are skipped at C speed (itertools.compress over a cycle of
+the ring). queue="heap" keeps heapq with (distance, index) pairs for grids
+with large costs.
+
+heuristic=True turns either queue into A*: keys are distance + min_cost *
+(Manhattan distance to the end cell), a consistent lower bound, so keys still
+pop in order. It pays off when the end lies inside the grid and costs do not
+vary much; from corner to corner nearly every cell is visited anyway. On
+2000 x 2000 grids (python -m benchmarks.path_bench) the bucket queue takes
+11 s corner to corner against 15 s for the original tuple-based heapq loop,
+and A* between two middle cells 1.4 s against 7.8 s.
+
+max_triangle_path() collapses a number triangle from the bottom up, one row
+per step: row + max(below[:-1], below[1:]). That needs the whole triangle in
+memory; max_triangle_path_top_down() instead runs the same recurrence
+downwards (each cell adds the better of its two parents, the ends their only
+one) over an iterable of rows, so with documents.stream_int_rows() a
+triangle of any depth is read once in chunks and only one row of totals is
+ever held: O(width) memory.
+
+Usage:
+    grid = CostGrid.from_document("0081_matrix.txt")
+    grid.min_path_right_down()          # 427337
+    grid.min_path_three_way()           # on 0082_matrix.txt: 260324
+    grid.min_path_four_way()            # on 0083_matrix.txt: 425185
+    grid.min_path_four_way(start, end, queue="heap", heuristic=True)
+    CostGrid([[1, 2], [3, 4]]).as_numpy()           # zero-copy int64 view
+    max_triangle_path([[3], [7, 4], [2, 4, 6], [8, 5, 9, 3]])   # 23
+    max_triangle_path_top_down(stream_int_rows("0067_triangle.txt"))   # 7273
+"""
+import heapq
+import itertools
+from array import array
+
+from euler.documents import int_matrix
+from euler.optional import is_ndarray, numpy, require_numpy
+
+# Below this many cells the pure-Python loops beat importing numpy.
+_NUMPY_THRESHOLD = 1 << 16
+
+_INFINITY = (1 << 63) - 1
+
+# Cells per block of columns that min_path_three_way() copies out at once.
+_BLOCK_CELLS = 1 << 20
+
+# Row width from which max_triangle_path_top_down() switches to numpy.
+_TRIANGLE_NUMPY_WIDTH = 256
+
+# Largest cell cost for which min_path_four_way() defaults to a bucket queue.
+_MAX_BUCKET_COST = 1 << 16
+
+
+class CostGrid:
+    """A rectangular grid of non-negative integer cell costs."""
+
+    def __init__(self, rows):
+        """rows: a list of equal-length lists, or a 2-D numpy array."""
+        if is_ndarray(rows):
+            np = numpy()
+            if rows.ndim != 2:
+                raise ValueError("a cost grid must be 2-D")
+            self.rows, self.cols = rows.shape
+            self.cells = array('q', np.ascontiguousarray(rows, dtype=np.int64).tobytes())
+            return
+        self.rows = len(rows)
+        self.cols = len(rows[0]) if rows else 0
+        if any(len(row) != self.cols for row in rows):
+            raise ValueError("a cost grid must be rectangular")
+        self.cells = array('q', itertools.chain.from_iterable(rows))
+
+    @classmethod
+    def from_cells(cls, cells, cols):
+        """A grid from its cells in row-major order: an array('q') or int64
+        memoryview (kept, not copied) or any bytes-like int64 buffer."""
+        grid = cls.__new__(cls)
+        if not isinstance(cells, array) and not (isinstance(cells, memoryview) and cells.format == 'q'):
+            cells = array('q', bytes(cells))
+        grid.cells = cells
+        grid.cols = cols
+        grid.rows = len(cells) // cols if cols else 0
+        return grid
+
+    @classmethod
+    def from_document(cls, name):
+        """
+        The grid stored in resources/documents/name (comma-separated rows).
+
+        The cells stay in the memory-mapped cache file of the document, so
+        they are read from disk as the solvers reach them.
+        """
+        _, cols, values = int_matrix(name)
+        return cls.from_cells(values, cols)
+
+    def as_numpy(self):
+        """Returns the grid as a rows x cols int64 numpy array sharing the same memory."""
+        np = require_numpy("CostGrid.as_numpy()")
+        return np.frombuffer(self.cells, dtype=np.int64).reshape(self.rows, self.cols)
+
+    def _use_numpy(self, use_numpy):
+        if use_numpy is None:
+            return len(self.cells) >= _NUMPY_THRESHOLD and numpy() is not None
+        return use_numpy
+
+    def min_path_right_down(self, use_numpy=None):
+        """Minimal path sum from the top left to the bottom right, moving right and down."""
+        if self._use_numpy(use_numpy):
+            np = numpy()
+            grid = self.as_numpy()
+            best = np.cumsum(grid[0])
+            for row in grid[1:]:
+                prefix = np.cumsum(row)
+                best = np.minimum.accumulate(best + row - prefix) + prefix
+            return int(best[-1])
+        cells, cols = self.cells, self.cols
+        best = list(itertools.accumulate(cells[:cols]))
+        for start in range(cols, len(cells), cols):
+            left = best[0] = best[0] + cells[start]
+            for j in range(1, cols):
+                above = best[j]
+                left = best[j] = (left if left < above else above) + cells[start + j]
+        return best[-1]
+
+    def min_path_three_way(self, use_numpy=None):
+        """Minimal path sum from any cell of the left column to any cell of the
+        right column, moving up, down and right."""
+        if self._use_numpy(use_numpy):
+            np = numpy()
+            grid = self.as_numpy()
+            best = grid[:, 0].copy()
+            # Columns are strided in the row-major cells: copy them out a
+            # block at a time, reading each row's piece of the block in one go.
+            width = max(1, _BLOCK_CELLS // max(1, self.rows))
+            for start in range(1, self.cols, width):
+                for column in np.ascontiguousarray(grid[:, start:start + width].T):
+                    best = _relax_column(np, best + column, column)
+            return int(best.min())
+        cells, rows, cols = self.cells, self.rows, self.cols
+        best = list(cells[0::cols])
+        for j in range(1, cols):
+            column = cells[j::cols]
+            best = [value + cost for value, cost in zip(best, column)]
+            for i in range(1, rows):
+                below = best[i - 1] + column[i]
+                if below < best[i]:
+                    best[i] = below
+            for i in range(rows - 2, -1, -1):
+                above = best[i + 1] + column[i]
+                if above < best[i]:
+                    best[i] = above
+        return min(best)
+
+    def min_path_four_way(self, start=0, end=None, queue=None, heuristic=False):
+        """
+        Minimal path sum between two cells, moving in all four directions.
+
+        start and end are flat cell indices (row * cols + col); by default the
+        top-left and bottom-right corners.
+
+        queue picks the priority queue: "heap" (heapq) or "buckets" (Dial's
+        bucket queue). By default buckets are used while the largest cell
+        cost is at most _MAX_BUCKET_COST. heuristic=True runs A*, with the
+        smallest cell cost times the Manhattan distance to end as lower bound.
+        """
+        cells = self.cells
+        if end is None:
+            end = len(cells) - 1
+        if not (0 <= start < len(cells) and 0 <= end < len(cells)):
+            raise ValueError("start and end must be cell indices of the grid")
+        lowest, highest = min(cells), max(cells)
+        if lowest < 0:
+            raise ValueError("four-way path sums need non-negative costs")
+        if queue is None:
+            queue = "buckets" if highest <= _MAX_BUCKET_COST else "heap"
+        if queue not in ("heap", "buckets"):
+            raise ValueError(f"unknown queue {queue!r}, expected 'heap' or 'buckets'")
+        weight = lowest if heuristic else 0
+        if queue == "heap":
+            return self._four_way_heap(start, end, weight)
+        return self._four_way_buckets(start, end, weight, highest)
+
+    def _four_way_heap(self, start, end, weight):
+        cells, cols = self.cells.tolist(), self.cols
+        size = len(cells)
+        end_row, end_col = divmod(end, cols)
+        # keys[i] is the best path sum to i found so far plus the heuristic at
+        # i, which is fixed per cell, so keys order paths like path sums do.
+        keys = [_INFINITY] * size
+        row, col = divmod(start, cols)
+        keys[start] = cells[start] + weight * (abs(row - end_row) + abs(col - end_col))
+        heap = [(keys[start], start)]
+        steps = (0, 0, 0, 0)
+        while heap:
+            key, index = heapq.heappop(heap)
+            if index == end:
+                return key
+            if key > keys[index]:
+                continue
+            col = index % cols
+            neighbours = (index - cols, index + cols,
+                          index - 1 if col else -1, index + 1 if col + 1 < cols else -1)
+            if weight:
+                # A step towards end lowers the heuristic by weight, any other raises it.
+                row = index // cols
+                steps = (weight if row <= end_row else -weight, -weight if row < end_row else weight,
+                         weight if col <= end_col else -weight, -weight if col < end_col else weight)
+            for neighbour, step in zip(neighbours, steps):
+                if 0 <= neighbour < size:
+                    candidate = key + cells[neighbour] + step
+                    if candidate < keys[neighbour]:
+                        keys[neighbour] = candidate
+                        heapq.heappush(heap, (candidate, neighbour))
+        raise ValueError(f"cell {end} is not reachable")
+
+    def _four_way_buckets(self, start, end, weight, highest):
+        cells, cols = self.cells.tolist(), self.cols
+        size = len(cells)
+        end_row, end_col = divmod(end, cols)
+        # Cells in rows up to (before) end's row start below these indices.
+        to_end_row, past_end_row = end_row * cols, (end_row + 1) * cols
+        last_row = size - cols
+        keys = [_INFINITY] * size
+        row, col = divmod(start, cols)
+        key = keys[start] = cells[start] + weight * (abs(row - end_row) + abs(col - end_col))
+        # A step raises the key by at most highest + weight, so the keys
+        # waiting in the queue span fewer than `span` values and bucket
+        # key % span holds the single key it stands for.
+        span = highest + weight + 1
+        buckets = [[] for _ in range(span)]
+        buckets[key % span].append(start)
+        # The non-empty buckets in key order, checked lazily as the keys come up.
+        # A grid is connected, so end is popped before the queue runs dry.
+        offset = key % span
+        for key in itertools.compress(itertools.count(key),
+                                      itertools.cycle(buckets[offset:] + buckets[:offset])):
+            bucket = buckets[key % span]
+            # Zero-cost cells push onto the bucket being emptied.
+            while bucket:
+                index = bucket.pop()
+                if keys[index] != key:
+                    continue
+                if index == end:
+                    return key
+                col = index % cols
+                # The four moves are spelled out: this loop is the whole solver.
+                if index >= cols:
+                    neighbour = index - cols
+                    candidate = key + cells[neighbour] + (weight if index < past_end_row else -weight)
+                    if candidate < keys[neighbour]:
+                        keys[neighbour] = candidate
+                        buckets[candidate % span].append(neighbour)
+                if index < last_row:
+                    neighbour = index + cols
+                    candidate = key + cells[neighbour] + (-weight if index < to_end_row else weight)
+                    if candidate < keys[neighbour]:
+                        keys[neighbour] = candidate
+                        buckets[candidate % span].append(neighbour)
+                if col:
+                    neighbour = index - 1
+                    candidate = key + cells[neighbour] + (weight if col <= end_col else -weight)
+                    if candidate < keys[neighbour]:
+                        keys[neighbour] = candidate
+                        buckets[candidate % span].append(neighbour)
+                if col + 1 < cols:
+                    neighbour = index + 1
+                    candidate = key + cells[neighbour] + (-weight if col < end_col else weight)
+                    if candidate < keys[neighbour]:
+                        keys[neighbour] = candidate
+                        buckets[candidate % span].append(neighbour)
+
+
+def _relax_column(np, best, column):
+    """
+    Relaxes best (paths entering each cell of a column from the left) against
+    moves down and up the column.
+    """
+    prefix = np.cumsum(column)
+    down = np.minimum.accumulate(best - prefix) + prefix
+    # Moving up from k to i costs column[i..k-1]: exclusive prefix sums.
+    exclusive = prefix - column
+    up = np.minimum.accumulate((best + exclusive)[::-1])[::-1] - exclusive
+    return np.minimum(down, up)
+
+
+def max_triangle_path(rows, use_numpy=None):
+    """Maximal total from the top of a number triangle to its bottom row,
+    moving to one of the two adjacent numbers in the row below."""
+    if not rows:
+        return 0
+    if use_numpy is None:
+        use_numpy = len(rows) * len(rows[-1]) >= 2 * _NUMPY_THRESHOLD and numpy() is not None
+    if use_numpy:
+        np = numpy()
+        best = np.asarray(rows[-1], dtype=np.int64)
+        for row in reversed(rows[:-1]):
+            best = np.asarray(row, dtype=np.int64) + np.maximum(best[:-1], best[1:])
+        return int(best[0])
+    best = list(rows[-1])
+    for row in reversed(rows[:-1]):
+        best = [value + (a if a > b else b) for value, a, b in zip(row, best, best[1:])]
+    return best[0]
+
+
+def max_triangle_path_top_down(rows, use_numpy=None):
+    """
+    max_triangle_path() for a triangle given as an iterable of rows, top
+    row first, such as documents.stream_int_rows(). Only the best totals of
+    the current row are kept. By default numpy takes over once the rows are
+    _TRIANGLE_NUMPY_WIDTH wide.
+    """
+    if use_numpy:
+        require_numpy("max_triangle_path_top_down(use_numpy=True)")
+    np = None
+    best = []
+    for depth, row in enumerate(rows):
+        if len(row) != depth + 1:
+            raise ValueError(f"row {depth} of the triangle has {len(row)} numbers, not {depth + 1}")
+        if np is None and use_numpy is not False and (use_numpy or depth >= _TRIANGLE_NUMPY_WIDTH):
+            np = numpy()
+            if np is not None:
+                best = np.array(best, dtype=np.int64)
+        if np is not None:
+            below = np.empty(depth + 1, dtype=np.int64)
+            below[0] = best[0] if depth else 0
+            below[-1] = best[-1] if depth else 0
+            np.maximum(best[:-1], best[1:], out=below[1:-1])
+            below += row
+            best = below
+            continue
+        if is_ndarray(row):
+            row = row.tolist()
+        if not depth:
+            best = list(row)
+            continue
+        middle = [value + (a if a > b else b) for value, a, b in zip(row[1:-1], best, best[1:])]
+        best = [row[0] + best[0]] + middle + [row[-1] + best[-1]]
+    return int(max(best)) if len(best) else 0
@@ -0,0 +1,30 @@
+"""
+Filesystem locations shared by the helpers.
+
+Input files for the problems live in resources/documents/ and are always
+resolved against the repository root, so scripts work from any directory.
+
+The on-disk caches live under $EULER_CACHE_DIR when it is set, otherwise under
+$XDG_CACHE_HOME/euler (normally ~/.cache/euler).
+"""
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DOCUMENTS_DIR = os.path.join(REPO_ROOT, "resources", "documents")
+
+
+def document_path(name):
+    """Returns the absolute path of an input file in resources/documents/."""
+    return os.path.join(DOCUMENTS_DIR, name)
+
+
+def cache_dir(*parts):
+    """Returns (and creates) a directory inside the cache root."""
+    root = os.environ.get("EULER_CACHE_DIR")
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(xdg, "euler")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
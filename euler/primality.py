@@ -0,0 +1,114 @@
+"""
+Deterministic Miller-Rabin primality test.
+
+Idea:
+Numbers below SMALL_LIMIT are answered by a lookup in a sieve table that is
+built on first use. Larger numbers are first checked against a few small
+primes and then run through Miller-Rabin with a fixed set of bases. For every
+n below 3.3 * 10**24 (in particular every 64-bit integer) the chosen bases are
+known to make the test exact; above that it is a strong probable-prime test.
+
+Usage:
+    is_prime(2**61 - 1)             # True
+    are_prime([97, 561, 7919])      # [True, False, True]
+    are_prime(numpy_array)          # numpy bool array
+"""
+from euler.optional import is_ndarray, numpy
+from euler.sieve import Sieve
+
+# Numbers below this are looked up in a sieve table (about 1 MB).
+SMALL_LIMIT = 1 << 20
+
+# (bound, bases): the bases make Miller-Rabin exact for every n < bound.
+_BASES = (
+    (2_047, (2,)),
+    (1_373_653, (2, 3)),
+    (25_326_001, (2, 3, 5)),
+    (3_215_031_751, (2, 3, 5, 7)),
+    (2_152_302_898_747, (2, 3, 5, 7, 11)),
+    (3_474_749_660_383, (2, 3, 5, 7, 11, 13)),
+    (341_550_071_728_321, (2, 3, 5, 7, 11, 13, 17)),
+    (3_825_123_056_546_413_051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318_665_857_834_031_151_167_461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+)
+_FALLBACK_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71)
+
+# Cheap trial division before the modular exponentiations.
+_TRIAL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+_small_table = None
+
+
+def _table():
+    global _small_table
+    if _small_table is None:
+        _small_table = Sieve(SMALL_LIMIT - 1).is_prime
+    return _small_table
+
+
+def is_prime(n):
+    """Returns True if n is prime."""
+    if n < SMALL_LIMIT:
+        return n >= 2 and _table()[n] == 1
+    if not n & 1:
+        return False
+    for p in _TRIAL_PRIMES:
+        if n % p == 0:
+            return False
+    return _miller_rabin(n)
+
+
+def _miller_rabin(n):
+    """Miller-Rabin for odd n > 2 with the deterministic bases for n."""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for bound, bases in _BASES:
+        if n < bound:
+            break
+    else:
+        bases = _FALLBACK_BASES
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def are_prime(candidates):
+    """
+    Tests a whole batch of candidates.
+
+    Returns a list of bools for a Python iterable. A numpy integer array gives
+    a numpy bool array of the same shape: small values are looked up in the
+    sieve table and the others are trial-divided in bulk before Miller-Rabin
+    runs on the survivors.
+    """
+    if is_ndarray(candidates):
+        return _are_prime_array(candidates)
+    return [is_prime(n) for n in candidates]
+
+
+def _are_prime_array(values):
+    np = numpy()
+    flat = values.ravel()
+    result = np.zeros(flat.shape, dtype=bool)
+
+    small = (flat >= 2) & (flat < SMALL_LIMIT)
+    table = np.frombuffer(_table(), dtype=np.uint8)
+    result[small] = table[flat[small].astype(np.intp)] == 1
+
+    large = np.flatnonzero(flat >= SMALL_LIMIT)
+    survivors = large[flat[large] % 2 == 1]
+    for p in _TRIAL_PRIMES:
+        survivors = survivors[flat[survivors] % p != 0]
+    for i in survivors:
+        result[i] = _miller_rabin(int(flat[i]))
+    return result.reshape(values.shape)
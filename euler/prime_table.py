@@ -0,0 +1,204 @@
+"""
+Persistent prime table shared by every script and process.
+
+Idea:
+Primality of the odd numbers up to some limit is kept on disk as a bitset:
+bit i (most significant bit first) tells whether 2*i + 1 is prime, so the
+table costs 1/16 byte per integer. The file lives under the cache directory
+(see `euler.paths`) and is named after the limit it covers. Later runs, and
+any number of sibling processes, memory-map it read-only instead of sieving.
+
+When a larger limit is requested, the existing bits are copied into a new
+file and only the missing range is sieved, one window at a time, so building
+a table never holds more than one window in memory. The new file is renamed
+into place atomically and the smaller one is removed.
+
+Usage:
+    sieve = cached_sieve(10**6)         # euler.sieve.Sieve, no re-sieving
+    table = prime_table(10**7)
+    9999991 in table                    # bit test straight on the mapping
+    sum(table.iter_primes(2 * 10**6))   # streamed, O(window) memory
+    prime_table(10**10, build=False)    # None unless already on disk
+"""
+import itertools
+import math
+import mmap
+import os
+import re
+import shutil
+import tempfile
+
+from euler.paths import cache_dir
+from euler.sieve import SEGMENT_SIZE, Sieve, sieve_window
+
+# Covered limits are rounded up to a multiple of this many integers. That keeps
+# every window of the bitset byte-aligned and avoids rewriting the file for
+# every small increase of the limit.
+GRANULE = 1 << 20
+
+_FILE_PATTERN = re.compile(r"^odd-bits-(\d+)\.bin$")
+_FLAG_TO_BIT = bytes.maketrans(b"\x00\x01", b"01")
+_BIT_TO_FLAG = bytes.maketrans(b"01", b"\x00\x01")
+
+# The largest table opened by this process, reused by later calls.
+_open_table = None
+
+
+class PrimeTable:
+    """Read-only, memory-mapped primality bitset for 0 <= n <= limit."""
+
+    def __init__(self, path, limit):
+        self.path = path
+        self.limit = limit
+        with open(path, 'rb') as f:
+            self._bits = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __contains__(self, n):
+        if n & 1:
+            if not 0 < n <= self.limit:
+                return False
+            i = n >> 1
+            return (self._bits[i >> 3] >> (7 - (i & 7))) & 1 == 1
+        return n == 2
+
+    def _check(self, limit):
+        if limit is None:
+            return self.limit
+        if limit > self.limit:
+            raise ValueError(f"limit {limit} exceeds the table limit {self.limit}")
+        return limit
+
+    def odd_flags(self, limit=None):
+        """Unpacks the bits of the odd numbers <= limit to one byte each."""
+        limit = self._check(limit)
+        return _unpack(self._bits, (limit + 1) // 2)
+
+    def sieve(self, limit=None):
+        """Returns a `euler.sieve.Sieve` for 0..limit built from the table."""
+        limit = self._check(limit)
+        return Sieve.from_odd_flags(limit, self.odd_flags(limit))
+
+    def iter_primes(self, limit=None, window=SEGMENT_SIZE):
+        """
+        Yields the primes <= limit, unpacking `window` odd numbers at a time.
+
+        window is rounded down to a multiple of 8 (at least 8) so that every
+        window starts on a byte of the bitset.
+        """
+        limit = self._check(limit)
+        window = max(8, window - window % 8)
+        if limit >= 2:
+            yield 2
+        count = (limit + 1) // 2
+        for lo in range(0, count, window):
+            hi = min(lo + window, count)
+            flags = _unpack(self._bits[lo // 8:(hi + 7) // 8], hi - lo)
+            yield from itertools.compress(range(2 * lo + 1, 2 * hi, 2), flags)
+
+    def close(self):
+        self._bits.close()
+
+
+def prime_table(limit, build=True):
+    """
+    Returns a PrimeTable covering at least 0..limit, building it if needed.
+
+    With build=False no table is written: None is returned unless a
+    covering table already exists.
+    """
+    global _open_table
+    if _open_table is not None and _open_table.limit >= limit:
+        return _open_table
+
+    try:
+        directory = cache_dir("primes")
+    except OSError:
+        if build:
+            raise
+        return None
+    while True:
+        limits = _cached_limits(directory)
+        covering = [cached for cached in limits if cached >= limit]
+        try:
+            if covering:
+                cached = min(covering)
+            elif not build:
+                return None
+            else:
+                base = max(limits, default=0)
+                cached = -(-max(limit, 1) // GRANULE) * GRANULE
+                _grow(directory, base, cached)
+            table = PrimeTable(_table_path(directory, cached), cached)
+        except FileNotFoundError:
+            # A sibling process replaced the file we were about to use.
+            continue
+        break
+
+    if _open_table is None or table.limit > _open_table.limit:
+        _open_table = table
+    return table
+
+
+def cached_sieve(limit):
+    """Same as `Sieve(limit)`, but served from the persistent table if possible."""
+    try:
+        table = prime_table(limit)
+    except OSError:
+        return Sieve(limit)
+    return table.sieve(limit)
+
+
+def _table_path(directory, limit):
+    return os.path.join(directory, f"odd-bits-{limit}.bin")
+
+
+def _cached_limits(directory):
+    limits = []
+    for name in os.listdir(directory):
+        match = _FILE_PATTERN.match(name)
+        if match:
+            limits.append(int(match.group(1)))
+    return sorted(limits)
+
+
+def _grow(directory, base_limit, new_limit):
+    """Writes the table for new_limit, reusing the bits of base_limit's table."""
+    base_primes = Sieve(math.isqrt(new_limit)).primes()[1:]
+    old_count = (base_limit + 1) // 2
+    new_count = (new_limit + 1) // 2
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            if base_limit:
+                with open(_table_path(directory, base_limit), 'rb') as f:
+                    shutil.copyfileobj(f, out)
+            for lo in range(old_count, new_count, SEGMENT_SIZE):
+                hi = min(lo + SEGMENT_SIZE, new_count)
+                out.write(_pack(sieve_window(lo, hi, base_primes)))
+        os.replace(tmp_path, _table_path(directory, new_limit))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    for cached in _cached_limits(directory):
+        if cached < new_limit:
+            try:
+                os.remove(_table_path(directory, cached))
+            except OSError:
+                pass
+
+
+def _pack(flags):
+    """Packs 0/1 bytes into bits, most significant bit first."""
+    nbytes = (len(flags) + 7) // 8
+    digits = (flags + bytes(8 * nbytes - len(flags))).translate(_FLAG_TO_BIT)
+    return int(digits or b"0", 2).to_bytes(nbytes, 'big')
+
+
+def _unpack(bits, count):
+    """Inverse of `_pack`: the first `count` bits of `bits` as 0/1 bytes."""
+    nbytes = (count + 7) // 8
+    # The sentinel bit keeps the leading zeros in the binary string.
+    value = int.from_bytes(bits[:nbytes], 'big') | (1 << (8 * nbytes))
+    return bytearray(bin(value)[3:3 + count].encode('ascii').translate(_BIT_TO_FLAG))
@@ -0,0 +1,104 @@
+"""
+Lazy registry of the problem scripts.
+
+The scripts 001.py ... 100.py are discovered from their file names only;
+nothing is imported until a problem is actually used, and then only that one
+script (plus whatever it imports itself) is loaded.
+
+Every script exposes `solve()` returning its answer, and running it as a
+program prints that answer. A few also keep a `main()` that prints. `run`
+gives all of them the same interface:
+
+    from euler.problems import run, problem_ids
+    run(14)                     # 837799
+    run("010", n=10**7)         # keyword arguments are passed to solve()
+"""
+import argparse
+import ast
+import contextlib
+import importlib.util
+import io
+import os
+import re
+import sys
+
+from euler.paths import REPO_ROOT
+
+_SCRIPT_PATTERN = re.compile(r"^(\d{3})\.py$")
+
+# Loaded problem modules, by id.
+_modules = {}
+
+
+def normalize_id(problem_id):
+    """Turns 14, "14" or "014" into "014"."""
+    return f"{int(problem_id):03d}"
+
+
+def parse_param(text):
+    """Parses a NAME=VALUE command-line argument; VALUE is a Python literal, or else a string."""
+    name, sep, value = text.partition("=")
+    if not sep or not name.isidentifier():
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def problem_ids():
+    """Returns the ids ("001" ... "100") of all problem scripts, sorted."""
+    ids = []
+    for name in os.listdir(REPO_ROOT):
+        match = _SCRIPT_PATTERN.match(name)
+        if match:
+            ids.append(match.group(1))
+    return sorted(ids)
+
+
+def problem_path(problem_id):
+    """Returns the absolute path of a problem's script."""
+    return os.path.join(REPO_ROOT, f"{normalize_id(problem_id)}.py")
+
+
+def load(problem_id):
+    """Imports a problem script (once) and returns its module."""
+    problem_id = normalize_id(problem_id)
+    module = _modules.get(problem_id)
+    if module is None:
+        path = problem_path(problem_id)
+        if not os.path.exists(path):
+            raise KeyError(f"no such problem: {problem_id}")
+        spec = importlib.util.spec_from_file_location(f"euler_problem_{problem_id}", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _modules[problem_id] = module
+    return module
+
+
+def entry_point(problem_id):
+    """Returns the problem's `solve` function, or `main` for print-only scripts."""
+    module = load(problem_id)
+    entry = getattr(module, "solve", None) or getattr(module, "main", None)
+    if entry is None:
+        raise AttributeError(f"problem {normalize_id(problem_id)} has no solve() or main()")
+    return entry
+
+
+def run(problem_id, **params):
+    """
+    Runs one problem and returns its answer.
+
+    `params` are passed to the entry point as keyword arguments. If the entry
+    point prints its answer instead of returning it, the last printed line is
+    returned.
+    """
+    entry = entry_point(problem_id)
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        answer = entry(**params)
+    if answer is None:
+        lines = buffer.getvalue().strip().splitlines()
+        answer = lines[-1] if lines else None
+    return answer
@@ -0,0 +1,222 @@
+"""
+Profiling hooks for a problem's solve()/main(), no editing of the script needed.
+
+Tools:
+    cprofile     deterministic per-function profile (cProfile); writes NNN.prof,
+                 which `python -m pstats`, snakeviz etc. can read
+    tracemalloc  peak of the Python allocations and the lines holding the most
+                 memory when the problem returns
+    sample       statistical profiler: a CPU-time timer (SIGPROF) interrupts the
+                 problem every `interval` seconds and records the running line
+                 and the whole call stack. Reports the hottest lines and writes
+                 NNN.collapsed, one "frame;frame;frame count" line per distinct
+                 stack, the input format of flamegraph.pl, speedscope and
+                 inferno. The operating system may round the interval up to
+                 its timer tick (often 4-10 ms).
+
+Each tool distorts timings in its own way, so the command line runs every
+tool in a fresh interpreter; that also keeps module-level memo tables (074's
+chain_lengths, for instance) from being warm for the second tool.
+`euler.runner --profile DIR` uses the sampler alone, whose overhead is small,
+for every problem it runs.
+
+Usage (from the repository root):
+    python -m euler.profiling 74                         # all three tools
+    python -m euler.profiling 92 --tool sample --interval 0.0005 limit=1000000
+    python -m euler.profiling 96 --tool cprofile --out profiles/
+    flamegraph.pl profiles/096.collapsed > 096.svg
+"""
+import argparse
+import collections
+import cProfile
+import io
+import json
+import linecache
+import os
+import pstats
+import signal
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from euler.paths import REPO_ROOT
+from euler.problems import normalize_id, parse_param, run
+
+TOOLS = ("cprofile", "tracemalloc", "sample")
+
+DEFAULT_INTERVAL = 0.001
+
+
+def _label(code):
+    filename = code.co_filename
+    if filename.startswith(REPO_ROOT + os.sep):
+        filename = os.path.relpath(filename, REPO_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class Sampler:
+    """
+    SIGPROF-based sampling profiler for code running in the main thread.
+
+    Only frames above `root` (a code object, normally euler.problems.run)
+    are recorded, so the stacks start at the problem's entry point.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL, root=run.__code__):
+        if not hasattr(signal, "setitimer"):
+            raise OSError("the sampling profiler needs signal.setitimer (Unix)")
+        self.interval = interval
+        self.root = root
+        self.stacks = collections.Counter()
+        self.lines = collections.Counter()
+        self._previous = None
+
+    def _sample(self, signum, frame):
+        stack = []
+        leaf = frame
+        while frame is not None and frame.f_code is not self.root:
+            stack.append(_label(frame.f_code))
+            frame = frame.f_back
+        if frame is None or not stack:
+            return
+        stack.reverse()
+        self.stacks[";".join(stack)] += 1
+        lineno = leaf.f_lineno or leaf.f_code.co_firstlineno
+        self.lines[leaf.f_code.co_filename, lineno, leaf.f_code.co_name] += 1
+
+    def start(self):
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def total(self):
+        return sum(self.stacks.values())
+
+    def write_collapsed(self, path):
+        """Writes the stacks in collapsed ("folded") flamegraph format."""
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def hot_lines(self, top=10):
+        """Returns [(count, "file:line function", source)] for the hottest lines."""
+        rows = []
+        for (filename, lineno, function), count in self.lines.most_common(top):
+            where = os.path.relpath(filename, REPO_ROOT) if filename.startswith(REPO_ROOT) else filename
+            rows.append((count, f"{where}:{lineno} {function}", linecache.getline(filename, lineno).strip()))
+        return rows
+
+
+def _output_path(out_dir, problem, suffix):
+    os.makedirs(out_dir, exist_ok=True)
+    return os.path.join(out_dir, f"{problem}{suffix}")
+
+
+def profile_problem(problem, tool, params=None, out_dir=".", top=15, interval=DEFAULT_INTERVAL):
+    """
+    Runs one problem under one tool in this process and returns a text report.
+
+    Files (NNN.prof, NNN.collapsed) are written to `out_dir`.
+    """
+    problem = normalize_id(problem)
+    params = params or {}
+    report = io.StringIO()
+    start = time.perf_counter()
+
+    if tool == "cprofile":
+        profiler = cProfile.Profile()
+        answer = profiler.runcall(run, problem, **params)
+        elapsed = time.perf_counter() - start
+        path = _output_path(out_dir, problem, ".prof")
+        profiler.dump_stats(path)
+        stats = pstats.Stats(profiler, stream=report)
+        stats.strip_dirs().sort_stats("tottime").print_stats(top)
+        report.write(f"profile written to {path}\n")
+
+    elif tool == "tracemalloc":
+        tracemalloc.start()
+        answer = run(problem, **params)
+        elapsed = time.perf_counter() - start
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report.write(f"peak traced memory {peak / 2**20:.2f} MiB\n")
+        report.write("largest allocations still held at return:\n")
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            report.write(f"{stat.size / 2**20:10.2f} MiB {stat.count:>9} blocks  "
+                         f"{os.path.relpath(frame.filename, REPO_ROOT)}:{frame.lineno}\n")
+
+    elif tool == "sample":
+        with Sampler(interval) as sampler:
+            answer = run(problem, **params)
+        elapsed = time.perf_counter() - start
+        path = _output_path(out_dir, problem, ".collapsed")
+        sampler.write_collapsed(path)
+        total = sampler.total or 1
+        report.write(f"{sampler.total} samples every {interval * 1000:g} ms of CPU time\n")
+        for count, where, source in sampler.hot_lines(top):
+            report.write(f"{100 * count / total:6.1f}%  {where:<40} {source}\n")
+        report.write(f"collapsed stacks written to {path}\n")
+
+    else:
+        raise ValueError(f"unknown tool {tool!r}, expected one of {TOOLS}")
+
+    header = f"== {problem} {tool}: answer {answer}, {elapsed:.3f} s\n"
+    return header + report.getvalue()
+
+
+def sample_call(problem, out_dir, interval=DEFAULT_INTERVAL, **params):
+    """Runs a problem under the sampler, writes NNN.collapsed and returns the answer."""
+    problem = normalize_id(problem)
+    with Sampler(interval) as sampler:
+        answer = run(problem, **params)
+    sampler.write_collapsed(_output_path(out_dir, problem, ".collapsed"))
+    return answer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m euler.profiling", description=__doc__.split("\n\n")[0])
+    parser.add_argument("problem", help="problem number, e.g. 74")
+    parser.add_argument("params", nargs="*", type=parse_param, metavar="NAME=VALUE",
+                        help="keyword arguments for solve()")
+    parser.add_argument("--tool", choices=TOOLS, action="append",
+                        help="tool to run (repeatable; default: all)")
+    parser.add_argument("--out", default=".", metavar="DIR", help="directory for .prof/.collapsed files")
+    parser.add_argument("--top", type=int, default=15, help="rows per report")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help="sampling interval in seconds of CPU time")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_intermixed_args(argv)
+    params = dict(args.params)
+
+    if args.child:
+        print(profile_problem(args.problem, args.tool[0], params, args.out, args.top, args.interval))
+        return 0
+
+    status = 0
+    for tool in args.tool or TOOLS:
+        command = [sys.executable, "-m", "euler.profiling", args.problem, "--child", "--tool", tool,
+                   "--out", os.path.abspath(args.out), "--top", str(args.top),
+                   "--interval", str(args.interval)]
+        command += [f"{name}={json.dumps(value)}" for name, value in params.items()]
+        status |= subprocess.run(command, cwd=REPO_ROOT).returncode
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Parallel runner: solves many problems at once and checks the answers.
+
+Problems are spread over a ProcessPoolExecutor. They are submitted
+longest-expected-first, using the wall times recorded by the benchmark
+harness (benchmarks/baseline.json), so the few heavy scripts start right away
+and the many quick ones fill the gaps; problems without a recorded time are
+submitted first. Each worker imports and runs its problems through
+`euler.problems.run`, and input files are resolved from the repository root,
+so the runner works from any directory.
+
+Answers are compared with benchmarks/answers.json, except those of the
+Monte Carlo problems (`euler.cache.NONDETERMINISTIC`), which vary from run to
+run and are reported as "unchecked". The report lists every
+problem as it finishes, then the makespan (wall time of the whole run), the
+summed CPU time of the problems and the resulting speedup. CPU time is used
+because wall times stretch when workers share a core.
+
+Usage:
+    python -m euler.runner                      # all problems, one worker per CPU
+    python -m euler.runner 14 74 92 --workers 2
+    python -m euler.runner --write-answers      # store the answers of this run
+    python -m euler.runner --cache              # reuse answers from euler/cache.py
+    python -m euler.runner 74 92 96 --profile profiles/   # flamegraph stacks, see euler/profiling.py
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from euler.bench import DEFAULT_BASELINE, load_records
+from euler.cache import NONDETERMINISTIC, cached_run
+from euler.paths import REPO_ROOT
+from euler.problems import normalize_id, problem_ids, run
+from euler.profiling import sample_call
+
+DEFAULT_ANSWERS = os.path.join(REPO_ROOT, "benchmarks", "answers.json")
+
+
+def solve_problem(problem, use_cache=False, profile_dir=None):
+    """
+    Runs in a worker: returns (problem, answer, wall seconds, cpu seconds, error).
+
+    With `profile_dir` the problem runs under the sampling profiler, which
+    writes <profile_dir>/NNN.collapsed; the cache is not used then.
+    """
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    answer, error = None, None
+    try:
+        if profile_dir:
+            answer = sample_call(problem, profile_dir)
+        elif use_cache:
+            answer = cached_run(problem)
+        else:
+            answer = run(problem)
+        answer = str(answer)
+    except Exception:
+        error = traceback.format_exc(limit=3).strip()
+    return problem, answer, time.perf_counter() - start, time.process_time() - cpu_start, error
+
+
+def expected_times(path):
+    """Returns {problem: wall seconds} from a benchmark report, or {}."""
+    if not os.path.exists(path):
+        return {}
+    return {problem: record["wall_s"] for problem, record in load_records(path).items()
+            if record["status"] == "ok"}
+
+
+def schedule(problems, expected):
+    """Longest expected time first; problems without a timing go in front."""
+    return sorted(problems, key=lambda problem: -expected.get(problem, float("inf")))
+
+
+def load_answers(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_answers(answers, path):
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(answers.items())), f, indent=1)
+        f.write("\n")
+
+
+def verdict(problem, answer, error, expected):
+    if error is not None:
+        return "error"
+    if problem in NONDETERMINISTIC:
+        return "unchecked"
+    if expected is None:
+        return "new"
+    return "ok" if answer == expected else "WRONG"
+
+
+def run_all(problems, workers=None, expected=None, answers=None, use_cache=False, profile_dir=None):
+    """
+    Solves the problems in parallel and prints one line per finished problem.
+
+    Returns (results, makespan), where results maps each problem to
+    (status, answer, wall seconds, cpu seconds, error).
+    """
+    expected = expected or {}
+    answers = answers or {}
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_problem, problem, use_cache, profile_dir) for problem in schedule(problems, expected)]
+        for future in as_completed(futures):
+            problem, answer, seconds, cpu, error = future.result()
+            status = verdict(problem, answer, error, answers.get(problem))
+            results[problem] = (status, answer, seconds, cpu, error)
+            print(f"{problem:>7} {status:>9} {seconds:9.3f}  {answer if error is None else ''}", flush=True)
+            if status == "WRONG":
+                print(f"{'':>7} expected {answers[problem]}", flush=True)
+            elif error is not None:
+                print(error, file=sys.stderr)
+    return results, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m euler.runner", description=__doc__.split("\n\n")[0])
+    parser.add_argument("problems", nargs="*", help="problem ids (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--answers", metavar="PATH", default=DEFAULT_ANSWERS, help="stored answers")
+    parser.add_argument("--timings", metavar="PATH", default=DEFAULT_BASELINE,
+                        help="benchmark report used for the schedule")
+    parser.add_argument("--write-answers", action="store_true",
+                        help="store the answers of this run in the answers file")
+    parser.add_argument("--cache", action="store_true",
+                        help="answer from the result cache where possible (see euler/cache.py)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="sample every problem and write DIR/NNN.collapsed flamegraph stacks")
+    args = parser.parse_args(argv)
+
+    problems = [normalize_id(problem) for problem in args.problems] or problem_ids()
+    answers = load_answers(args.answers)
+    print(f"{'problem':>7} {'status':>9} {'time (s)':>9}  answer")
+    results, makespan = run_all(problems, args.workers, expected_times(args.timings), answers,
+                                args.cache, args.profile and os.path.abspath(args.profile))
+
+    counts = {}
+    for status, *_ in results.values():
+        counts[status] = counts.get(status, 0) + 1
+    busy = sum(cpu for _, _, _, cpu, _ in results.values())
+    longest = max(cpu for _, _, _, cpu, _ in results.values())
+    print(f"\n{len(results)} problems on {args.workers} workers: "
+          + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    print(f"makespan {makespan:.2f} s, summed CPU time {busy:.2f} s, speedup {busy / makespan:.2f}x, "
+          f"lower bound {max(longest, busy / args.workers):.2f} s")
+
+    if args.write_answers:
+        answers.update({problem: answer for problem, (status, answer, *_) in results.items()
+                        if status != "error"})
+        write_answers(answers, args.answers)
+    return 1 if counts.get("WRONG") or counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Sieve of Eratosthenes shared by the prime-heavy problems.
+
+Idea:
+Only odd numbers are stored: index `i` of the bytearray stands for `2*i + 1`,
+so a sieve up to `n` needs about `n/2` bytes instead of the `8*n` bytes of a
+`[True] * n` list. Multiples of each prime are cleared with a single slice
+assignment, which runs in C instead of one interpreter step per element.
+
+Usage:
+    s = Sieve(1_000_000)
+    s.is_prime[97]      # 1 -- flat bytearray indexed by n (built on first use)
+    97 in s             # True -- lookup straight in the odd-only storage
+    s.primes()          # [2, 3, 5, ...] (cached)
+    s.prime_count(100)  # 25
+
+For limits too large to hold in memory, `segmented_primes` and
+`prime_segments` sieve one cache-sized window at a time and only keep the
+primes up to sqrt(limit) around, so memory stays O(sqrt(limit)):
+    sum(segmented_primes(10**10))
+"""
+import itertools
+import math
+from functools import cached_property
+
+from euler.optional import require_numpy
+
+# Odd numbers per window of the segmented sieve (one byte each). 256 KiB
+# keeps a window in L2 cache on common hardware.
+SEGMENT_SIZE = 1 << 18
+
+
+class Sieve:
+    """Primality of every integer `0 <= n <= limit`."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._odd = _odd_sieve(limit)
+        self._primes = None
+
+    @classmethod
+    def from_odd_flags(cls, limit, odd):
+        """
+        Wraps already-computed odd-only flags (index i <=> 2*i + 1) without
+        sieving again. `odd` must have at least (limit + 1) // 2 entries.
+        """
+        sieve = cls.__new__(cls)
+        sieve.limit = limit
+        sieve._odd = odd[:(limit + 1) // 2]
+        sieve._primes = None
+        return sieve
+
+    def __contains__(self, n):
+        if n & 1:
+            return 0 < n <= self.limit and self._odd[n >> 1] == 1
+        return n == 2 and self.limit >= 2
+
+    def __len__(self):
+        return self.limit + 1
+
+    @cached_property
+    def is_prime(self):
+        """
+        Flat bytearray where `is_prime[n]` is 1 if n is prime and 0 otherwise.
+
+        This is the drop-in replacement for the `[True] * n` lists the scripts
+        used to build; indexing it is as fast as indexing a list.
+        """
+        flags = bytearray(self.limit + 1)
+        flags[1::2] = self._odd[:len(flags) // 2]
+        if self.limit >= 2:
+            flags[2] = 1
+        return flags
+
+    def primes(self):
+        """Returns the sorted list of all primes up to the limit."""
+        if self._primes is None:
+            odd_primes = itertools.compress(range(1, self.limit + 1, 2), self._odd)
+            self._primes = ([2] if self.limit >= 2 else []) + list(odd_primes)
+        return self._primes
+
+    def prime_count(self, n=None):
+        """Returns pi(n), the number of primes <= n (default: the limit)."""
+        if n is None or n > self.limit:
+            n = self.limit
+        if n < 2:
+            return 0
+        return 1 + self._odd.count(1, 0, (n + 1) // 2)
+
+
+def _odd_sieve(limit):
+    """Returns a bytearray where index i is 1 iff 2*i + 1 <= limit is prime."""
+    size = (limit + 1) // 2
+    odd = bytearray([1]) * size
+    if size:
+        odd[0] = 0  # 1 is not prime
+    for i in range(1, (math.isqrt(limit) + 1) // 2):
+        if odd[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            odd[start::p] = bytes(len(range(start, size, p)))
+    return odd
+
+
+def primes_up_to(limit):
+    """Returns the list of primes <= limit."""
+    return Sieve(limit).primes()
+
+
+def sieve_window(lo, hi, base_primes):
+    """
+    Sieves the odd numbers 2*lo + 1 .. 2*hi - 1.
+
+    Returns a bytearray where index i is 1 iff 2*(lo + i) + 1 is prime.
+    `base_primes` must hold the odd primes up to sqrt(2*hi - 1), in order.
+    """
+    segment = bytearray([1]) * (hi - lo)
+    if lo == 0 and hi > 0:
+        segment[0] = 0  # 1 is not prime
+    first = 2 * lo + 1
+    last = 2 * hi - 1
+    for p in base_primes:
+        start = p * p
+        if start > last:
+            break
+        if start < first:
+            start = (first + p - 1) // p * p
+            if not start & 1:
+                start += p
+        index = start // 2 - lo
+        segment[index::p] = bytes(len(range(index, hi - lo, p)))
+    return segment
+
+
+def prime_segments(limit, segment_size=SEGMENT_SIZE, as_numpy=False):
+    """
+    Yields the primes <= limit in increasing order, one window at a time.
+
+    Each window covers `segment_size` odd numbers and is yielded as a list of
+    ints, or as an int64 numpy array when `as_numpy` is true. Only the primes
+    up to sqrt(limit) are kept between windows.
+    """
+    np = require_numpy("prime_segments(as_numpy=True)") if as_numpy else None
+    if limit < 2:
+        return
+    yield np.array([2], dtype=np.int64) if as_numpy else [2]
+
+    base_primes = Sieve(math.isqrt(limit)).primes()[1:]
+    size = (limit + 1) // 2
+    for lo in range(0, size, segment_size):
+        hi = min(lo + segment_size, size)
+        segment = sieve_window(lo, hi, base_primes)
+        first = 2 * lo + 1
+        if as_numpy:
+            flags = np.frombuffer(segment, dtype=np.uint8)
+            yield np.flatnonzero(flags).astype(np.int64) * 2 + first
+        else:
+            yield list(itertools.compress(range(first, 2 * hi, 2), segment))
+
+
+def segmented_primes(limit, segment_size=SEGMENT_SIZE):
+    """Yields every prime <= limit using O(sqrt(limit)) memory."""
+    for segment in prime_segments(limit, segment_size):
+        yield from segment